@@ -1,33 +1,13 @@
 #!/usr/bin/env python3
 """보탬e 자동화 메인 실행 스크립트"""
-import asyncio
 import argparse
+import os
 import sys
-from typing import Dict, Any
-
-from loguru import logger
-from src.card_usage_automation import CardUsageAutomation
-from src.tax_invoice_automation import TaxInvoiceAutomation
-from src.transfer_automation import TransferAutomation
-
-
-AUTOMATION_TYPES = {
-    'card': {
-        'class': CardUsageAutomation,
-        'name': '카드사용내역 집행등록',
-        'description': '미사용 카드내역을 조회하여 자동으로 집행등록합니다.'
-    },
-    'tax': {
-        'class': TaxInvoiceAutomation,
-        'name': '전자세금계산서 집행등록',
-        'description': '미등록 전자세금계산서를 조회하여 자동으로 집행등록합니다.'
-    },
-    'transfer': {
-        'class': TransferAutomation,
-        'name': '집행이체 일괄처리',
-        'description': '이체 대기건을 선택하고 일괄이체합니다. (인증서 인증 필요)'
-    }
-}
+from typing import Dict, Any, Optional
+
+# 자동화 모듈(Playwright), asyncio, 설정/로그 파일은 필요할 때 불러옴 (--list/--help는 바로 시작)
+from src.logger import logger
+from src.registry import AUTOMATION_TYPES, PLAN_TYPES, RUN_TYPES, load_automation_class
 
 
 def print_banner():
@@ -56,8 +36,19 @@ def list_automations():
         print()
 
 
-async def run_automation(automation_type: str, **kwargs) -> Dict[str, Any]:
-    """자동화 실행"""
+async def run_automation(
+    automation_type: str,
+    plan: Optional[str] = None,
+    automation: Any = None,
+    fiscal_year: Optional[str] = None,
+    project_code: Optional[str] = None,
+    **kwargs
+) -> Dict[str, Any]:
+    """자동화 실행 (plan: 처리 계획 CSV, 계획된 건만 계획된 비목/재원으로 처리)
+
+    automation이 주어지면 새로 만들지 않고 그 인스턴스로 실행한다 (이동 계획 적용 등).
+    fiscal_year/project_code가 주어지면 설정 파일 값 대신 사용한다.
+    """
     if automation_type not in AUTOMATION_TYPES:
         logger.error(f"알 수 없는 자동화 타입: {automation_type}")
         list_automations()
@@ -67,7 +58,13 @@ async def run_automation(automation_type: str, **kwargs) -> Dict[str, Any]:
     logger.info(f"[{info['name']}] 자동화 시작")
 
     try:
-        automation = info['class']()
+        automation = automation or load_automation_class(automation_type)()
+        if fiscal_year:
+            automation.fiscal_year = fiscal_year
+        if project_code:
+            automation.project_code = project_code
+        if plan:
+            automation.use_plan(plan)
         result = await automation.run(**kwargs)
         return result
     except Exception as e:
@@ -75,29 +72,189 @@ async def run_automation(automation_type: str, **kwargs) -> Dict[str, Any]:
         return {'status': 'ERROR', 'error': str(e)}
 
 
-async def run_all_automations():
-    """모든 자동화 순차 실행"""
+async def run_all_automations(session: Any = None, **options) -> Dict[str, Any]:
+    """모든 자동화 순차 실행 (브라우저/로그인/보조사업 선택 공유)
+
+    session이 주어지면(데몬) 그 세션을 쓰고 끝나도 닫지 않는다.
+    options: run_automation에 넘길 fiscal_year/project_code
+    """
+    from src.navigation import plan_from_config
+    from src.session import BotameSession
+
     results = {}
+    owns_session = session is None
+    session = session or BotameSession()
+
+    # 기본 실행 순서: card -> tax -> transfer (이동 계획이 있으면 화면 이동이 가장 적은 순서)
+    order = ['card', 'tax', 'transfer']
+    navigation = plan_from_config(order)
+    if navigation:
+        order = navigation.order
+        logger.info("화면 이동 계획:")
+        for line in navigation.describe():
+            logger.info(f"  {line}")
+    automations = {}
 
-    # 실행 순서: card -> tax -> transfer
-    for automation_type in ['card', 'tax', 'transfer']:
-        info = AUTOMATION_TYPES[automation_type]
-        logger.info(f"\n{'='*50}")
-        logger.info(f"[{info['name']}] 시작")
-        logger.info(f"{'='*50}")
+    try:
+        for automation_type in order:
+            info = AUTOMATION_TYPES[automation_type]
+            logger.info(f"\n{'='*50}")
+            logger.info(f"[{info['name']}] 시작")
+            logger.info(f"{'='*50}")
+
+            automation = load_automation_class(automation_type)()
+            if navigation:
+                automation.use_navigation(navigation, automation_type, automations)
+            automations[automation_type] = automation
+
+            result = await run_automation(automation_type, session=session, automation=automation, **options)
+            results[automation_type] = result
+
+            if result.get('status') not in ['COMPLETED', 'NO_RECORDS']:
+                logger.warning(f"[{info['name']}] 완료되지 않음: {result.get('status')}")
+                # 이체 자동화가 아닌 경우만 계속 진행
+                if automation_type != 'transfer':
+                    continue
+
+            logger.success(f"[{info['name']}] 완료")
+
+    finally:
+        if navigation:
+            results['navigation'] = navigation.report(session.screens)
+        if owns_session:
+            await session.close()
 
-        result = await run_automation(automation_type)
-        results[automation_type] = result
+    return results
 
-        if result.get('status') not in ['COMPLETED', 'NO_RECORDS']:
-            logger.warning(f"[{info['name']}] 완료되지 않음: {result.get('status')}")
-            # 이체 자동화가 아닌 경우만 계속 진행
-            if automation_type != 'transfer':
-                continue
 
-        logger.success(f"[{info['name']}] 완료")
+async def run_request(params: Dict[str, Any], session: Any = None) -> Dict[str, Any]:
+    """실행 요청 처리 (CLI 직접 실행과 데몬 공용)
 
-    return results
+    params: type(card|tax|transfer|all), plan, fiscal_year, project_code
+            batch가 참이면 targets(없으면 batch.targets)의 보조사업마다 실행 (parallel: 동시 실행 수)
+    """
+    if params.get('batch'):
+        return await run_batch(params, session)
+    options = {'fiscal_year': params.get('fiscal_year'), 'project_code': params.get('project_code')}
+    if params['type'] == 'all':
+        return await run_all_automations(session=session, **options)
+    return await run_automation(params['type'], plan=params.get('plan'), session=session, **options)
+
+
+async def run_batch(params: Dict[str, Any], session: Any = None) -> Dict[str, Any]:
+    """여러 보조사업 일괄 실행 (한 세션에서 보조사업만 바꿔 가며, 보조사업별 결과)
+
+    session이 주어지면(데몬) 그 세션을 메인 세션으로 쓰고 끝나도 닫지 않는다.
+    """
+    from src.batch import BatchRunner, load_targets
+    from src.config import config
+    from src.session import BotameSession
+
+    fiscal_year = params.get('fiscal_year') or config.fiscal_year
+    targets = load_targets(params['targets'], fiscal_year) if params.get('targets') else None
+    request = {'type': params['type'], 'plan': None, 'fiscal_year': params.get('fiscal_year')}
+    batch = BatchRunner.from_config(run_request, request, targets, params.get('parallel'))
+    if not batch.targets:
+        logger.error("일괄 실행할 보조사업이 없습니다 (settings.yaml batch.targets 또는 --targets)")
+        return {'status': 'NO_TARGETS'}
+
+    owns_session = session is None
+    session = session or BotameSession()
+    try:
+        return await batch.run(session)
+    finally:
+        if owns_session:
+            await session.close()
+
+
+def run_via_daemon(params: Dict[str, Any]) -> Dict[str, Any]:
+    """실행 중인 데몬에 실행 요청 (진행 로그를 그대로 출력)"""
+    import asyncio
+    from src.daemon import call
+
+    def show(method: str, event: Dict[str, Any]):
+        if method == 'queued':
+            print(f"데몬 실행 대기열 {event['position']}번째 (job {event['job']})")
+        else:
+            print(f"{event['time'][11:19]} | {event['level']: <8} | {event['message']}")
+
+    logger.info("실행 중인 데몬으로 요청합니다 (직접 실행: --local)")
+    return asyncio.run(call('run', params, on_event=show))
+
+
+def serve(stop: bool = False, status: bool = False) -> int:
+    """상주 브라우저 데몬 실행/상태 확인/종료"""
+    import asyncio
+    from src.daemon import AutomationDaemon, call, is_running
+
+    if stop or status:
+        if not is_running():
+            print("실행 중인 데몬이 없습니다")
+            return 1
+        print(asyncio.run(call('shutdown' if stop else 'status')))
+        return 0
+
+    if is_running():
+        logger.error("데몬이 이미 실행 중입니다 (종료: python main.py serve --stop)")
+        return 1
+
+    async def serve_forever():
+        await AutomationDaemon(run_request, RUN_TYPES).serve_forever()
+
+    asyncio.run(serve_forever())
+    return 0
+
+
+def run_schedule() -> int:
+    """settings.yaml의 schedule.jobs를 한 프로세스에서 실행 (데몬 제어 소켓도 함께 열림)"""
+    import asyncio
+    from src.daemon import AutomationDaemon, is_running
+    from src.scheduler import JobScheduler
+
+    if is_running():
+        logger.error("데몬이 이미 실행 중입니다 - 같은 계정으로 프로세스를 둘 띄우지 않습니다 (종료: python main.py serve --stop)")
+        return 1
+
+    async def schedule_forever() -> int:
+        daemon = AutomationDaemon(run_request, RUN_TYPES)
+        try:
+            scheduler = JobScheduler.from_config(daemon.submit)
+        except ValueError as e:
+            logger.error(f"스케줄 설정 오류: {e}")
+            return 1
+        if not scheduler.specs:
+            logger.error("schedule.jobs에 작업이 없습니다")
+            return 1
+
+        task = asyncio.create_task(scheduler.run())
+        try:
+            await daemon.serve_forever()
+        finally:
+            task.cancel()
+        return 0
+
+    return asyncio.run(schedule_forever())
+
+
+def run_plan(plan_type: str, input_path: str, output_path: Optional[str] = None) -> int:
+    """내보내기 파일로 처리 계획 생성 (브라우저 없이)"""
+    from src.planner import build_plan, summarize_plan, write_plan
+
+    try:
+        plan = build_plan(plan_type, input_path)
+        path = write_plan(plan, plan_type, output_path)
+    except Exception as e:
+        logger.error(f"처리 계획 생성 실패: {e}")
+        return 1
+
+    print("\n" + "=" * 50)
+    print(f"처리 계획 ({AUTOMATION_TYPES[plan_type]['name']})")
+    print("=" * 50)
+    for line in summarize_plan(plan):
+        print(line)
+    print(f"\n계획 파일: {path}")
+    print(f"실행: python main.py {plan_type} --plan {path}")
+    return 0
 
 
 def print_summary(results: Dict[str, Any]):
@@ -106,7 +263,16 @@ def print_summary(results: Dict[str, Any]):
     print("실행 결과 요약")
     print("=" * 50)
 
-    if isinstance(results, dict) and 'status' in results:
+    if isinstance(results, dict) and 'projects' in results:
+        # 보조사업 일괄 실행 결과
+        for label, project in results['projects'].items():
+            print(f"[{label}] {project['status']:<12} 처리 {project['processed']}건"
+                  f" / 성공 {project['success']}건 / 실패 {project['failure']}건")
+        print(f"\n보조사업 {len(results['projects'])}개 (동시 {results['parallel']}개): {results['status']}")
+        print(f"처리: {results['processed']}건 / 성공: {results['success']}건 / 실패: {results['failure']}건")
+        if results['failed']:
+            print(f"완료되지 않은 보조사업: {', '.join(results['failed'])}")
+    elif isinstance(results, dict) and 'status' in results:
         # 단일 자동화 결과
         print(f"상태: {results.get('status')}")
         print(f"처리: {results.get('processed', 0)}건")
@@ -115,6 +281,8 @@ def print_summary(results: Dict[str, Any]):
     else:
         # 다중 자동화 결과
         for auto_type, result in results.items():
+            if auto_type == 'navigation':
+                continue
             info = AUTOMATION_TYPES.get(auto_type, {'name': auto_type})
             print(f"\n[{info['name']}]")
             print(f"  상태: {result.get('status')}")
@@ -122,6 +290,12 @@ def print_summary(results: Dict[str, Any]):
             print(f"  성공: {result.get('success', 0)}건")
             print(f"  실패: {result.get('failure', 0)}건")
 
+        navigation = results.get('navigation')
+        if navigation:
+            predicted, actual = navigation['predicted'], navigation['actual']
+            print(f"\n화면 이동: 예상 {predicted['navigations']}회 / 실제 {actual['navigations']}회"
+                  f" (탭 전환 예상 {predicted['switches']}회 / 실제 {actual['switches']}회)")
+
     print("\n" + "=" * 50)
 
 
@@ -136,6 +310,13 @@ def main():
   python main.py tax               # 전자세금계산서 집행등록 실행
   python main.py transfer          # 집행이체 일괄처리 실행
   python main.py all               # 모든 자동화 순차 실행
+  python main.py plan card --input export.xlsx   # 카드내역 처리 계획 (브라우저 없이)
+  python main.py card --plan plan.csv            # 처리 계획대로 실행
+  python main.py card --batch      # settings.yaml batch.targets의 보조사업마다 실행
+  python main.py all --targets 2024:A-001,2024:A-002 --parallel 2   # 보조사업 2개씩 동시 실행
+  python main.py serve             # 로그인된 브라우저를 유지하는 데몬 (이후 실행은 데몬으로 요청)
+  python main.py serve --stop      # 데몬 종료
+  python main.py schedule          # settings.yaml의 schedule.jobs대로 상주 실행
   python main.py --list            # 사용 가능한 자동화 목록
         """
     )
@@ -143,8 +324,75 @@ def main():
     parser.add_argument(
         'type',
         nargs='?',
-        choices=list(AUTOMATION_TYPES.keys()) + ['all'],
-        help='실행할 자동화 타입'
+        choices=list(AUTOMATION_TYPES.keys()) + ['all', 'plan', 'serve', 'schedule'],
+        help='실행할 자동화 타입 (plan: 처리 계획 생성, serve: 데몬 실행, schedule: 스케줄 실행)'
+    )
+
+    parser.add_argument(
+        'target',
+        nargs='?',
+        choices=PLAN_TYPES,
+        help='plan 대상 자동화 타입'
+    )
+
+    parser.add_argument(
+        '--input', '-i',
+        help='plan: 보탬e에서 내보낸 파일 (xlsx/csv)'
+    )
+
+    parser.add_argument(
+        '--output', '-o',
+        help='plan: 계획 CSV 저장 경로 (기본: logs/plans/)'
+    )
+
+    parser.add_argument(
+        '--plan',
+        help='처리 계획 CSV (계획된 건만 계획된 비목/재원으로 처리)'
+    )
+
+    parser.add_argument(
+        '--fiscal-year',
+        help='회계연도 (기본: 설정 파일 project.fiscal_year)'
+    )
+
+    parser.add_argument(
+        '--project',
+        help='보조사업 코드 (기본: 설정 파일 project.project_code)'
+    )
+
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='여러 보조사업 일괄 실행 (대상: 설정 파일 batch.targets)'
+    )
+
+    parser.add_argument(
+        '--targets',
+        help='일괄 실행 대상 보조사업 ("회계연도:코드"를 쉼표로 구분, 또는 한 줄에 하나씩 적은 파일)'
+    )
+
+    parser.add_argument(
+        '--parallel',
+        type=int,
+        help='일괄 실행 시 동시에 처리할 보조사업 수 (기본: 설정 파일 batch.parallel)'
+    )
+
+    parser.add_argument(
+        '--local',
+        action='store_true',
+        help='실행 중인 데몬이 있어도 이 프로세스에서 직접 실행'
+    )
+
+    parser.add_argument(
+        '--stop',
+        action='store_true',
+        help='serve: 실행 중인 데몬 종료'
+    )
+
+    parser.add_argument(
+        '--status',
+        action='store_true',
+        help='serve: 실행 중인 데몬 상태'
     )
 
     parser.add_argument(
@@ -173,11 +421,56 @@ def main():
         list_automations()
         return 1
 
+    if args.type == 'plan':
+        if not args.target or not args.input:
+            parser.error("plan에는 대상(card|tax)과 --input이 필요합니다")
+        return run_plan(args.target, args.input, args.output)
+
+    if args.plan and args.type not in PLAN_TYPES:
+        parser.error(f"--plan은 {'/'.join(PLAN_TYPES)}에서만 사용할 수 있습니다")
+
+    batch = args.batch or bool(args.targets)
+    if batch and args.type not in RUN_TYPES:
+        parser.error("--batch/--targets는 자동화 실행(card|tax|transfer|all)에서만 사용할 수 있습니다")
+    if batch and (args.plan or args.project):
+        parser.error("--batch/--targets에는 --plan/--project를 함께 쓸 수 없습니다 (처리 계획/보조사업은 대상별)")
+    targets = None
+    if args.targets:
+        from src.batch import load_targets
+        from src.config import config
+
+        try:
+            targets = [list(target) for target in load_targets(args.targets, args.fiscal_year or config.fiscal_year)]
+        except (OSError, ValueError) as e:
+            parser.error(f"--targets: {e}")
+
     try:
-        if args.type == 'all':
-            results = asyncio.run(run_all_automations())
+        import asyncio
+        from src.logger import setup_logger
+
+        # 콘솔/파일 로그 설정 (자동화/데몬 모듈은 loguru logger를 직접 사용)
+        setup_logger()
+
+        if args.type == 'serve':
+            return serve(stop=args.stop, status=args.status)
+        if args.type == 'schedule':
+            return run_schedule()
+
+        from src.daemon import is_running
+
+        params = {
+            'type': args.type,
+            # 데몬의 작업 디렉토리와 다를 수 있으므로 절대 경로로 전달
+            'plan': os.path.abspath(args.plan) if args.plan else None,
+            'fiscal_year': args.fiscal_year,
+            'project_code': args.project
+        }
+        if batch:
+            params.update(batch=True, targets=targets, parallel=args.parallel)
+        if not args.local and is_running():
+            results = run_via_daemon(params)
         else:
-            results = asyncio.run(run_automation(args.type))
+            results = asyncio.run(run_request(params))
 
         print_summary(results)
 
@@ -0,0 +1,14 @@
+"""금액 문자열 처리 모듈 (브라우저/pandas 없이 사용 가능)"""
+import re
+
+
+# 금액 표기에서 제거할 문자 (콤마, '원', 공백)
+AMOUNT_NOISE = re.compile(r'[,원 ]')
+# 정수로 변환 가능한 형태
+INTEGER_PATTERN = re.compile(r'[+-]?\d+')
+
+
+def parse_amount(amount_str: str) -> int:
+    """금액 문자열을 정수로 변환 (변환할 수 없으면 0)"""
+    cleaned = AMOUNT_NOISE.sub('', amount_str or '').strip()
+    return int(cleaned) if INTEGER_PATTERN.fullmatch(cleaned) else 0
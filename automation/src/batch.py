@@ -0,0 +1,218 @@
+"""여러 보조사업 일괄 실행 모듈 (`python main.py card --batch`)
+
+(회계연도, 보조사업코드) 대상 목록마다 선택한 자동화를 실행한다. 대상마다 브라우저를
+새로 띄우지 않고, 한 세션에서 select_project로 보조사업만 바꿔 가며 처리한다
+(BotameAutomation.prepare가 세션의 선택된 보조사업과 다를 때만 다시 선택).
+
+- parallel이 2 이상이면 로그인 상태를 복사한 컨텍스트를 더 만들어 여러 보조사업을
+  동시에 처리한다. 각 컨텍스트는 공용 대기열에서 다음 대상을 가져가므로 오래 걸리는
+  보조사업이 있어도 나머지가 한 컨텍스트에 몰리지 않는다.
+- 속도 제한(rate_limiter)은 프로세스 공용이므로 컨텍스트가 늘어도 전체 요청 속도는
+  설정값을 넘지 않는다.
+- 처리 기록/워터마크는 보조사업별로 따로 저장된다.
+
+대상 형식: {"fiscal_year": "2024", "project_code": "2024-001"}, "2024:2024-001",
+대상 파일의 "2024,2024-001" 또는 보조사업코드만("2024-001", 회계연도는 project.fiscal_year).
+명령행(--targets)에서는 쉼표로 대상을 구분한다 ("2024:2024-001,2024:2024-002").
+
+이 모듈은 Playwright를 import하지 않는다.
+"""
+import asyncio
+import re
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from loguru import logger
+
+from .config import config
+
+
+# (회계연도, 보조사업코드)
+Target = Tuple[str, str]
+
+# 대상 하나 실행: (params, 세션) -> 실행 결과 (main.run_request)
+Runner = Callable[[Dict[str, Any], Any], Awaitable[Dict[str, Any]]]
+
+SUCCESS_STATUSES = ('COMPLETED', 'NO_RECORDS')
+
+TARGET_SEPARATOR = re.compile(r'[\s,:/]+')
+
+
+def parse_target(value: Union[str, Dict[str, Any], List[Any], Tuple[Any, ...]], fiscal_year: Optional[str] = None) -> Target:
+    """대상 하나 -> (회계연도, 보조사업코드) (회계연도가 없으면 fiscal_year)"""
+    if isinstance(value, dict):
+        parts = [value.get('fiscal_year') or '', value.get('project_code') or '']
+    elif isinstance(value, (list, tuple)):
+        parts = list(value)
+    else:
+        parts = TARGET_SEPARATOR.split(str(value).strip())
+    parts = [str(part).strip() for part in parts if str(part).strip()]
+
+    if len(parts) == 1 and fiscal_year:
+        parts = [str(fiscal_year), parts[0]]
+    if len(parts) != 2:
+        raise ValueError(f"보조사업 대상 형식 오류 (예: 2024:2024-001): {value}")
+    return parts[0], parts[1]
+
+
+def load_targets(source: Union[str, Iterable[Any], None], fiscal_year: Optional[str] = None) -> List[Target]:
+    """대상 목록 (파일 경로, 쉼표로 구분한 문자열 또는 목록, 중복 제거)
+
+    파일은 한 줄에 대상 하나 ('#' 주석, 빈 줄, fiscal_year로 시작하는 머리글 무시).
+    """
+    if not source:
+        return []
+    if isinstance(source, str):
+        path = Path(source)
+        if path.is_file():
+            lines = (line.split('#')[0].strip() for line in path.read_text(encoding='utf-8-sig').splitlines())
+            values = [line for line in lines if line and not line.lower().startswith('fiscal_year')]
+        else:
+            values = [part for part in source.split(',') if part.strip()]
+    else:
+        values = list(source)
+
+    targets: List[Target] = []
+    for value in values:
+        target = parse_target(value, fiscal_year)
+        if target not in targets:
+            targets.append(target)
+    return targets
+
+
+def target_label(target: Target) -> str:
+    return f"{target[0]} / {target[1]}"
+
+
+def result_counts(result: Dict[str, Any]) -> Dict[str, int]:
+    """처리/성공/실패 건수 (all이면 자동화별 합계)"""
+    nested = [value for value in result.values() if isinstance(value, dict) and 'status' in value]
+    sources = nested if 'status' not in result and nested else [result]
+    return {
+        key: sum(source.get(key, 0) or 0 for source in sources)
+        for key in ('processed', 'success', 'failure')
+    }
+
+
+def target_status(result: Dict[str, Any]) -> str:
+    """대상 실행 결과 상태 (all이면 완료되지 않은 첫 자동화의 상태)"""
+    if 'status' in result:
+        return result['status']
+    for key, value in result.items():
+        if isinstance(value, dict) and 'status' in value and value['status'] not in SUCCESS_STATUSES:
+            return value['status']
+    return 'COMPLETED'
+
+
+class BatchRunner:
+    """대상 보조사업마다 자동화 실행 (세션별로 select_project만 바꿔 가며)"""
+
+    def __init__(self, runner: Runner, params: Dict[str, Any], targets: List[Target], parallel: int = 1):
+        """
+        Args:
+            runner: 대상 하나 실행 함수 (main.run_request)
+            params: 실행 요청 (type, plan 등, 대상마다 fiscal_year/project_code를 바꿔 전달)
+            targets: (회계연도, 보조사업코드) 목록
+            parallel: 동시에 처리할 보조사업 수 (세션/컨텍스트 수)
+        """
+        self.runner = runner
+        self.params = params
+        self.targets = targets
+        self.parallel = max(1, min(parallel, len(targets) or 1))
+        self.results: Dict[Target, Dict[str, Any]] = {}
+        self.lanes: Dict[Target, int] = {}  # 대상 -> 처리한 세션 번호 (0: 메인 세션)
+
+    @classmethod
+    def from_config(
+        cls,
+        runner: Runner,
+        params: Dict[str, Any],
+        targets: Optional[List[Target]] = None,
+        parallel: Optional[int] = None
+    ) -> 'BatchRunner':
+        """settings.yaml의 batch로 생성 (targets/parallel이 없으면 batch.targets/batch.parallel)"""
+        if targets is None:
+            targets = load_targets(config.get('batch.targets') or [], params.get('fiscal_year') or config.fiscal_year)
+        return cls(runner, params, targets, parallel or config.get('batch.parallel', 1))
+
+    async def warm_up(self, session: Any):
+        """메인 세션 로그인 및 첫 보조사업 선택 (컨텍스트를 복사하기 전에 로그인 상태를 만듦)"""
+        from .botame import BotameAutomation
+
+        automation = BotameAutomation('batch')
+        automation.fiscal_year, automation.project_code = self.targets[0]
+        failure = await automation.prepare(session)
+        if failure:
+            logger.warning(f"일괄 실행 준비 미완료 ({failure}) - 대상별 실행에서 다시 시도")
+
+    async def run(self, session: Any) -> Dict[str, Any]:
+        """모든 대상 실행 후 보조사업별 결과 반환 (session은 닫지 않음)"""
+        if not self.targets:
+            return self.summary()
+
+        logger.info(f"보조사업 {len(self.targets)}개 일괄 실행 ({self.params['type']}, 동시 {self.parallel}개)")
+        queue: 'asyncio.Queue[Target]' = asyncio.Queue()
+        for target in self.targets:
+            queue.put_nowait(target)
+
+        if self.parallel > 1:
+            await self.warm_up(session)
+        await asyncio.gather(*(self._lane(lane, session, queue) for lane in range(self.parallel)))
+        return self.summary()
+
+    async def _lane(self, lane: int, session: Any, queue: 'asyncio.Queue[Target]'):
+        """세션 하나로 대기열의 대상을 차례로 처리 (0번은 메인 세션, 나머지는 복사한 컨텍스트)"""
+        if lane:
+            from .botame import BotameAutomation
+
+            try:
+                # 새 컨텍스트는 빈 페이지이므로 보탬e 접속/로그인 확인까지 마친 세션을 사용
+                session = await session.spawn_worker(lane, BotameAutomation('batch'))
+            except Exception as e:
+                logger.error(f"일괄 실행 컨텍스트 {lane} 생성 실패 - 남은 세션으로 처리: {e}")
+                return
+
+        try:
+            while not queue.empty():
+                target = queue.get_nowait()
+                self.lanes[target] = lane
+                self.results[target] = await self._run_target(target, session)
+        finally:
+            if lane:
+                await session.close()
+
+    async def _run_target(self, target: Target, session: Any) -> Dict[str, Any]:
+        label = target_label(target)
+        logger.info(f"[{label}] 보조사업 실행 시작")
+        params = {**self.params, 'fiscal_year': target[0], 'project_code': target[1]}
+        try:
+            result = await self.runner(params, session)
+        except Exception as e:
+            logger.error(f"[{label}] 보조사업 실행 실패: {e}")
+            result = {'status': 'ERROR', 'error': str(e)}
+
+        status = target_status(result)
+        log = logger.success if status in SUCCESS_STATUSES else logger.warning
+        log(f"[{label}] 보조사업 실행 종료: {status}")
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        """보조사업별 결과 (대상 순서) 및 전체 상태"""
+        projects = {}
+        for target in self.targets:
+            result = self.results.get(target, {'status': 'NOT_RUN'})
+            projects[target_label(target)] = {
+                'status': target_status(result),
+                'lane': self.lanes.get(target),
+                **result_counts(result),
+                'result': result
+            }
+        failed = [label for label, project in projects.items() if project['status'] not in SUCCESS_STATUSES]
+        return {
+            'type': self.params['type'],
+            'status': 'COMPLETED' if not failed else 'PARTIAL' if len(failed) < len(projects) else 'FAILED',
+            'parallel': self.parallel,
+            **{key: sum(project[key] for project in projects.values()) for key in ('processed', 'success', 'failure')},
+            'failed': failed,
+            'projects': projects
+        }
@@ -1,30 +1,172 @@
 """보탬e 기본 자동화 모듈"""
-from typing import Optional, List, Dict, Any
-from playwright.async_api import Page
+import functools
+import time
+from datetime import date
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, Iterable, Set, Union
+from playwright.async_api import Page, Locator
 from loguru import logger
 
+from .budget_mapping import get_budget_matcher
 from .config import config
-from .browser import BrowserManager
+from .grid_capture import GridCapture
+from .journal import RecordJournal
 from .logger import AutomationLogger
+from .menu_routes import get_menu_routes, program_from_urls
+from .navigation import OP_BATCH_REQUEST, NavigationPlan
+from .pipeline import Pipeline, Stage
+from .reconciliation import AmountReconciler
+from .rate_limiter import ACTION_NAVIGATE, ACTION_SUBMIT, get_rate_limiter
+from .records import GridRecord, parse_date
+from .retry import ERROR_SESSION, ERROR_TIMEOUT, RetryPolicy
+from .screens import ScreenManager
+from .select_options import SELECT_OPTIONS_SCRIPT, OptionIndex
+from .session import BotameSession
+from .watermark import WatermarkTracker, search_start
+
+
+# 그리드 일괄 추출 스크립트 (행/셀 텍스트를 한 번의 evaluate로 수집)
+GRID_EXTRACT_SCRIPT = """
+({rowSelector, columns, keyColumn, minCells, statusSelectors, limit}) => {
+    const rows = Array.from(document.querySelectorAll(rowSelector));
+    const picked = limit ? rows.slice(0, limit) : rows;
+    const records = [];
+    picked.forEach((row, index) => {
+        const cells = Array.from(row.querySelectorAll('td')).map(td => td.innerText);
+        if (cells.length < minCells) return;
+
+        const record = {row_index: index};
+        columns.forEach((name, i) => { record[name] = i < cells.length ? cells[i] : ''; });
+
+        for (const [name, selector] of Object.entries(statusSelectors || {})) {
+            const el = row.querySelector(selector);
+            record[name] = el ? el.innerText : null;
+        }
+
+        const key = (record[keyColumn] || '').trim();
+        record.row_key = key || cells.join('|');
+        records.push(record);
+    });
+    return records;
+}
+"""
 
 
 class BotameAutomation:
     """보탬e 자동화 기본 클래스"""
 
+    # 로그인 상태 판별 (셀렉터는 실제 화면에 맞게 수정 필요)
+    LOGIN_FORM_SELECTOR = 'input[type="password"]'
+    LOGGED_IN_SELECTOR = 'text=전체메뉴 검색'
+
+    # 그리드 스크롤 영역 / 페이지 이동 (셀렉터는 실제 화면에 맞게 수정 필요)
+    GRID_SCROLL_SELECTOR = '.cl-grid .cl-grid-body, .grid-body'
+    PAGER_NEXT_SELECTOR = '.cl-pageindexer-next:not(.cl-disabled), a.page-next:not(.disabled)'
+    PAGER_INDEX_SELECTOR = '.cl-pageindexer-index, .pagination a'
+
+    # 정수로 변환/대사할 금액 필드 (서브클래스에서 지정)
+    AMOUNT_COLUMNS: List[str] = []
+
+    # 전체메뉴 검색 / 열린 화면 탭 (셀렉터는 실제 화면에 맞게 수정 필요)
+    MENU_SEARCH_SELECTOR = '.menu-search input, input.menu-search'
+    MENU_SEARCH_RESULT_SELECTOR = '.menu-search-result .cl-listbox-item, .cl-popup .cl-listbox-item'
+    SCREEN_TAB_SELECTOR = '.cl-mdifolder .cl-tabfolder-item, .cl-tabfolder-item'
+    SCREEN_TAB_CLOSE_SELECTOR = '.cl-tabfolder-item-close, .cl-close'
+    # 탭 전환 후 조회 조건 초기화 버튼 (셀렉터는 실제 화면에 맞게 수정 필요)
+    SCREEN_RESET_SELECTOR = 'button:has-text("초기화"), a:has-text("초기화"), .btn-reset'
+
+    # 증분 조회 기준 일자 필드 (서브클래스에서 지정, 없으면 매번 전체 조회)
+    WATERMARK_FIELD: Optional[str] = None
+    # 목록 조회 조건 시작일 (셀렉터는 실제 화면에 맞게 수정 필요)
+    DATE_FROM_SELECTOR = 'input#searchStartDate, input[name="startDate"], input[name="fromDate"]'
+
+    # 집행등록 폼 드롭다운 (셀렉터는 실제 화면에 맞게 수정 필요)
+    BUDGET_ITEM_SELECTOR = 'select#budgetItem, select[name="budgetItem"]'
+    FUNDING_TYPE_SELECTOR = 'select#fundingType, select[name="fundingType"]'
+
     def __init__(self, automation_type: str):
-        self.browser_manager = BrowserManager()
+        self.session = BotameSession()
+        self.owns_session = True
+        self.browser_manager = self.session.browser_manager
         self.page: Optional[Page] = None
+        self.automation_type = automation_type
         self.logger = AutomationLogger(automation_type)
         self.fiscal_year = config.fiscal_year
         self.project_code = config.project_code
+        self.max_workers = 1
+        self.grid_page = 1
+        # (셀렉터, 회계연도, 보조사업) -> 옵션 인덱스
+        self.option_indexes: Dict[tuple, OptionIndex] = {}
+        self.journal: Optional[RecordJournal] = None
+        # 일시적 오류 재시도 정책 (워커와 재시도 예산 공유)
+        self.retry = RetryPolicy.from_config()
+        # 동작 분류별 속도 제한 (프로세스 공용) / 응답 시간을 반영할 마지막 동작
+        self.rate_limiter = get_rate_limiter()
+        self._last_action: Optional[str] = None
+        # 메뉴 경로 → 화면 바로 열기 캐시 (프로세스 공용)
+        self.menu_routes = get_menu_routes()
+        # 처리 계획 (행 키 -> 비목/재원, use_plan으로 설정)
+        self.plan: Optional[Dict[str, Dict[str, Any]]] = None
+        # 증분 조회 워터마크 (이 일자까지 처리 완료) 및 이번 실행 추적
+        self.watermark: Optional[date] = None
+        self.watermarks: Optional[WatermarkTracker] = None
+        # 조회 반복자가 조건 범위를 끝까지 읽었는지 (max_items/오류로 멈추면 False)
+        self.fetch_complete = False
+        # 화면 이동 계획 (use_navigation): 뒤 자동화에 넘긴 작업 / 대신 집행요청할 앞 자동화
+        self.deferred_operations: Set[str] = set()
+        self.request_for: List['BotameAutomation'] = []
+        self.request_deferred = False
+        # 그리드 스크롤/페이지 이동 전 대기 (메인 페이지를 등록과 함께 쓸 때)
+        self.grid_barrier: Optional[Callable[[], Awaitable[None]]] = None
 
     async def start(self):
-        """브라우저 시작"""
-        self.page = await self.browser_manager.start()
+        """브라우저 시작 (공유 세션이면 기존 브라우저 사용)"""
+        self.page = await self.session.start()
+
+    @property
+    def screens(self) -> ScreenManager:
+        """현재 페이지의 열린 화면 탭 (세션 공용, 자동화를 연달아 실행해도 유지)"""
+        return self.session.screens
+
+    def attach(self, session: BotameSession):
+        """공유 세션 사용 (세션은 만든 쪽에서 종료)"""
+        self.session = session
+        self.owns_session = False
+        self.browser_manager = session.browser_manager
+        self.page = session.page
 
     async def stop(self):
-        """브라우저 종료"""
-        await self.browser_manager.stop()
+        """브라우저 종료 (직접 만든 세션만 종료)"""
+        if self.owns_session:
+            await self.session.close()
+
+    async def prepare(self, session: Optional[BotameSession] = None) -> Optional[str]:
+        """브라우저 시작, 로그인, 보조사업 선택
+
+        공유 세션이 주어지면 이미 끝난 단계(로그인/같은 보조사업 선택)는 건너뛴다.
+
+        Returns:
+            실패 시 결과 상태 코드, 성공 시 None
+        """
+        if session is not None:
+            self.attach(session)
+
+        await self.start()
+
+        if not self.session.logged_in:
+            if not await self.ensure_login():
+                return 'LOGIN_FAILED'
+            self.session.logged_in = True
+
+        target = (self.fiscal_year, self.project_code)
+        if self.session.project != target:
+            if not await self.select_project():
+                return 'PROJECT_SELECT_FAILED'
+            self.session.project = target
+        else:
+            logger.info(f"보조사업 선택 재사용: {target[0]} / {target[1]}")
+
+        return None
 
     async def login(self) -> bool:
         """보탬e 로그인"""
@@ -32,8 +174,12 @@ class BotameAutomation:
             logger.info("로그인 시도...")
 
             # 보탬e 접속
+            await self.throttle(ACTION_NAVIGATE)
             await self.page.goto(config.botame_url)
-            await self.page.wait_for_load_state('networkidle')
+            # 페이지를 다시 불러오면 열린 탭과 보조사업 선택이 사라짐
+            self.screens.clear()
+            self.session.project = None
+            await self.ready('login_page', required=True)
 
             # 로그인 폼 확인 (셀렉터는 실제 화면에 맞게 수정 필요)
             # 아이디 입력
@@ -43,10 +189,11 @@ class BotameAutomation:
             await self.page.fill('input[name="password"], input#password, input[type="password"]', config.password)
 
             # 로그인 버튼 클릭
+            await self.throttle(ACTION_SUBMIT)
             await self.page.click('button[type="submit"], button:has-text("로그인")')
 
             # 로그인 성공 확인 (메인 페이지 로딩 대기)
-            await self.page.wait_for_load_state('networkidle')
+            await self.ready('login', required=True)
 
             # 로그인 성공 여부 확인 (에러 메시지 없으면 성공)
             error_element = await self.page.query_selector('.error-message, .login-error')
@@ -63,6 +210,85 @@ class BotameAutomation:
             await self.browser_manager.screenshot("login_error")
             return False
 
+    async def ready(
+        self,
+        screen: str,
+        grid: Optional[str] = None,
+        replaces_ms: int = 0,
+        required: bool = False
+    ) -> bool:
+        """화면 준비 대기 (로딩 오버레이/데이터 요청/그리드 행 수 기준)
+
+        Args:
+            screen: 화면 이름 (지표 구분용)
+            grid: 행 수 안정화를 확인할 그리드 행 셀렉터
+            replaces_ms: 대체한 고정 대기시간 (절감 시간 계산용)
+            required: 시간 초과 시 TimeoutError 발생 (로그인/보조사업/조회/저장 등
+                다음 단계가 화면 결과에 의존하는 대기, with_retry에서 재시도됨)
+
+        Raises:
+            TimeoutError: required이고 시간 안에 준비되지 않은 경우
+        """
+        started = time.perf_counter()
+        ready = await self.browser_manager.readiness.wait(
+            screen, self.logger, grid=grid, replaces_ms=replaces_ms
+        )
+        # 직전 동작의 응답 시간으로 해당 분류의 속도 조절
+        if self._last_action:
+            self.rate_limiter.observe(self._last_action, time.perf_counter() - started, ready)
+            self._last_action = None
+        if required and not ready:
+            raise TimeoutError(f"[{screen}] 화면 준비 대기 시간 초과")
+        return ready
+
+    async def throttle(self, action: str):
+        """서버에 요청을 보내는 동작 전 속도 제한 대기 (rate_limiter.ACTION_*)"""
+        await self.rate_limiter.acquire(action)
+        self._last_action = action
+
+    async def is_logged_in(self, navigate: bool = True) -> bool:
+        """로그인 상태 확인 (메인 화면 또는 로그인 폼 중 먼저 나타나는 쪽으로 판별)
+
+        navigate가 False면 이미 보탬e를 연 현재 페이지에서 확인한다.
+        """
+        try:
+            if navigate:
+                await self.page.goto(config.botame_url, wait_until='domcontentloaded')
+                self.screens.clear()
+                self.session.project = None
+
+            logged_in = self.page.locator(self.LOGGED_IN_SELECTOR)
+            login_form = self.page.locator(self.LOGIN_FORM_SELECTOR)
+            await logged_in.or_(login_form).first.wait_for(state='visible')
+
+            return await logged_in.first.is_visible()
+
+        except Exception as e:
+            logger.debug(f"세션 확인 중 오류: {e}")
+            return False
+
+    async def ensure_login(self) -> bool:
+        """세션이 유효하면 재사용하고, 만료된 경우에만 로그인
+
+        저장된 세션을 복원했거나 이미 보탬e를 열어 둔 페이지(데몬 유휴 후/재시도/워커)는
+        로그인 폼이 없을 수 있으므로 먼저 로그인 상태를 확인한다.
+        """
+        restored = self.browser_manager.session_restored
+        if restored or self.page.url != 'about:blank':
+            if await self.is_logged_in():
+                logger.success("기존 세션으로 로그인 상태 확인")
+                return True
+
+            if restored:
+                logger.info("저장된 세션이 만료됨 - 다시 로그인합니다")
+                self.browser_manager.clear_session()
+
+        if not await self.login():
+            return False
+
+        await self.browser_manager.save_session()
+        return True
+
     async def select_project(self, fiscal_year: str = None, project_code: str = None) -> bool:
         """보조사업 선택"""
         try:
@@ -78,10 +304,14 @@ class BotameAutomation:
             await self.page.fill('input#projectCode, input[name="projectCode"]', pc)
 
             # 조회 버튼 클릭
+            await self.throttle(ACTION_SUBMIT)
             await self.page.click('button:has-text("조회"), button.search-btn')
 
             # 결과 대기
-            await self.page.wait_for_load_state('networkidle')
+            await self.ready('project', required=True)
+
+            # 보조사업이 바뀌면 비목/재원 옵션도 바뀔 수 있음
+            self.option_indexes.clear()
 
             logger.success("보조사업 선택 완료")
             return True
@@ -91,17 +321,89 @@ class BotameAutomation:
             await self.browser_manager.screenshot("select_project_error")
             return False
 
+    async def open_screen(self, menu_path: List[str], reset: bool = True) -> bool:
+        """화면 열기 (이미 열린 탭이면 탭 전환, 아니면 메뉴 이동 후 오래된 탭 닫기)
+
+        Args:
+            menu_path: 메뉴 경로 (대메뉴 > ... > 화면)
+            reset: 탭 전환 시 이전 조회 조건/팝업 초기화
+        """
+        if self.screens.is_open(menu_path):
+            if await self._activate_screen(menu_path[-1], reset):
+                self.screens.activated(menu_path)
+                logger.info(f"열린 화면으로 전환: {menu_path[-1]}")
+                return True
+            self.screens.closed(menu_path)
+
+        if not await self.navigate_to_menu(menu_path):
+            return False
+
+        for evicted in self.screens.opened(menu_path):
+            await self._close_screen(evicted[-1])
+        return True
+
+    async def _activate_screen(self, screen: str, reset: bool) -> bool:
+        """열린 화면 탭 클릭 (탭이 없으면 False)"""
+        tab = self.page.locator(self.SCREEN_TAB_SELECTOR).filter(has_text=screen)
+        try:
+            if not await tab.count():
+                return False
+            await tab.first.click()
+
+            if reset:
+                # 이전 작업에서 남은 팝업을 닫고 조회 조건 초기화
+                await self.page.keyboard.press('Escape')
+                reset_button = self.page.locator(f'{self.SCREEN_RESET_SELECTOR} >> visible=true')
+                if await reset_button.count():
+                    await reset_button.first.click()
+                self.grid_page = 1
+
+            await self.ready('screen_tab')
+            return True
+
+        except Exception as e:
+            logger.debug(f"화면 탭 전환 실패 ({screen}): {e}")
+            return False
+
+    async def _close_screen(self, screen: str):
+        """오래 쓰지 않은 화면 탭 닫기"""
+        tab = self.page.locator(self.SCREEN_TAB_SELECTOR).filter(has_text=screen)
+        try:
+            if await tab.count():
+                await tab.first.locator(self.SCREEN_TAB_CLOSE_SELECTOR).first.click()
+                logger.debug(f"오래된 화면 탭 닫기: {screen}")
+        except Exception as e:
+            logger.debug(f"화면 탭 닫기 실패 ({screen}): {e}")
+
     async def navigate_to_menu(self, menu_path: List[str]) -> bool:
-        """메뉴 이동"""
+        """메뉴 이동 (캐시된 경로가 있으면 바로 열고, 실패하면 단계별 클릭)"""
         try:
             logger.info(f"메뉴 이동: {' > '.join(menu_path)}")
 
-            for menu in menu_path:
-                # 메뉴 클릭 (셀렉터는 실제 화면에 맞게 수정 필요)
-                await self.page.click(f'a:has-text("{menu}"), span:has-text("{menu}")')
-                await self.page.wait_for_timeout(500)
+            route = self.menu_routes.get(menu_path)
+            if route:
+                if await self._open_route(route):
+                    logger.success(f"메뉴 이동 완료 (바로 열기): {menu_path[-1]}")
+                    return True
+                self.menu_routes.invalidate(menu_path)
+                await self.page.keyboard.press('Escape')  # 열려 있을 수 있는 검색 결과 닫기
+
+            # 클릭 이동 중 화면 앱 요청에서 프로그램 ID 수집
+            requested: List[str] = []
+            listener = lambda request: requested.append(request.url)
+            self.page.on('request', listener)
+            try:
+                for menu in menu_path:
+                    # 메뉴 클릭 (셀렉터는 실제 화면에 맞게 수정 필요)
+                    await self.throttle(ACTION_NAVIGATE)
+                    await self.page.click(f'a:has-text("{menu}"), span:has-text("{menu}")')
+                    await self.ready('menu', replaces_ms=500)
+            finally:
+                self.page.remove_listener('request', listener)
 
-            await self.page.wait_for_load_state('networkidle')
+            self.menu_routes.record(menu_path, program_from_urls(
+                requested, config.get('menu_routes.program_pattern', r'/([\w/-]+)\.clx')
+            ))
             logger.success(f"메뉴 이동 완료: {menu_path[-1]}")
             return True
 
@@ -110,34 +412,660 @@ class BotameAutomation:
             await self.browser_manager.screenshot("navigate_error")
             return False
 
+    async def _open_route(self, route: Dict[str, Any]) -> bool:
+        """캐시된 경로로 화면 바로 열기 (열린 화면 탭이 확인되지 않으면 False)"""
+        screen = route['screen']
+        open_script = config.get('menu_routes.open_script')
+        try:
+            await self.throttle(ACTION_NAVIGATE)
+            if open_script and route.get('program'):
+                await self.page.evaluate(open_script, route['program'])
+            else:
+                # 전체메뉴 검색으로 화면명 검색 후 결과 클릭
+                await self.page.locator(self.MENU_SEARCH_SELECTOR).first.fill(screen)
+                result = self.page.locator(self.MENU_SEARCH_RESULT_SELECTOR).filter(has_text=screen)
+                if not await result.count():
+                    await self.page.keyboard.press('Enter')
+                    await self.ready('menu_search')
+                    if not await result.count():
+                        return False
+                await result.first.click()
+
+            await self.ready('menu')
+            return await self.page.locator(self.SCREEN_TAB_SELECTOR).filter(has_text=screen).count() > 0
+
+        except Exception as e:
+            logger.debug(f"메뉴 바로 열기 실패 ({screen}): {e}")
+            return False
+
+    async def extract_grid(
+        self,
+        row_selector: str,
+        columns: List[str],
+        key_column: str,
+        min_cells: int = 1,
+        status_selectors: Optional[Dict[str, str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """결과 그리드 일괄 추출
+
+        셀마다 inner_text()를 호출하지 않고 한 번의 page.evaluate로
+        전체 행을 읽어온다.
+
+        Args:
+            row_selector: 행 셀렉터
+            columns: td 순서대로 매핑할 필드명
+            key_column: 행 키로 사용할 필드명 (승인번호 등)
+            min_cells: 최소 셀 개수 (미만이면 제외)
+            status_selectors: 상태 필드명 -> 행 내부 셀렉터 (없으면 None)
+            limit: 최대 행 수
+
+        Returns:
+            필드명 -> 텍스트 딕셔너리 목록 (row_key, row_index 포함)
+        """
+        started = time.perf_counter()
+        records = await self.page.evaluate(GRID_EXTRACT_SCRIPT, {
+            'rowSelector': row_selector,
+            'columns': columns,
+            'keyColumn': key_column,
+            'minCells': min_cells,
+            'statusSelectors': status_selectors or {},
+            'limit': limit
+        })
+        elapsed = time.perf_counter() - started
+
+        self.logger.record_timing('grid_extract', elapsed)
+        logger.debug(f"그리드 추출: {len(records)}행 / {elapsed * 1000:.1f}ms")
+        return records
+
+    async def fetch_grid(
+        self,
+        screen: str,
+        row_selector: str,
+        columns: List[str],
+        key_column: str,
+        min_cells: int = 1,
+        status_selectors: Optional[Dict[str, str]] = None,
+        limit: Optional[int] = None,
+        action: Optional[Callable[[], Awaitable[bool]]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """목록 화면을 조회하고 그리드 레코드 반환
+
+        grid_capture가 설정된 화면은 조회 시 데이터 서브미션 응답에서 바로
+        레코드를 만들고, 캡처하지 못하면 DOM 일괄 추출로 대체한다.
+
+        Args:
+            action: 그리드를 채우는 동작 (기본: open_record_screen, 페이지/스크롤 이동 등)
+
+        Returns:
+            레코드 목록 (동작 실패 또는 더 읽을 내용이 없으면 None)
+        """
+        action = action or self.open_record_screen
+        started = time.perf_counter()
+        async with GridCapture.from_config(self.page, screen, key_column) as capture:
+            if not await action():
+                return None
+
+        records = capture.records(limit=limit)
+        if records is not None:
+            self.logger.record_timing('grid_capture', time.perf_counter() - started)
+            logger.debug(f"[{screen}] 응답 캡처로 {len(records)}행 조회")
+            return records
+
+        return await self.extract_grid(
+            row_selector, columns, key_column,
+            min_cells=min_cells,
+            status_selectors=status_selectors,
+            limit=limit
+        )
+
+    async def iter_grid(
+        self,
+        screen: str,
+        row_selector: str,
+        columns: List[str],
+        key_column: str,
+        min_cells: int = 1,
+        status_selectors: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """목록 화면의 모든 레코드를 페이지/가상 스크롤을 따라가며 순차 반환
+
+        현재 보이는 행을 모두 내보낸 뒤에야 스크롤 또는 다음 페이지로
+        이동하므로, 호출 측은 첫 레코드부터 바로 처리를 시작할 수 있다.
+        이미 내보낸 행 키는 다시 반환하지 않는다. 각 레코드에는 행이 있던
+        페이지 번호(grid_page)가 포함된다. 호출 측은 행 딕셔너리를 바로
+        records 모델(CardRecord 등)로 바꾸어 넘긴다.
+
+        사용 예:
+            async for row in self.iter_grid('card_usage', ...):
+                ...
+        """
+        grid_kwargs = dict(min_cells=min_cells, status_selectors=status_selectors)
+        seen = set()
+
+        self.grid_page = 1
+        rows = await self.fetch_grid(screen, row_selector, columns, key_column, **grid_kwargs)
+        paged = False
+
+        while rows is not None:
+            fresh = [row for row in rows if row['row_key'] not in seen]
+            for row in fresh:
+                seen.add(row['row_key'])
+                row['grid_page'] = self.grid_page
+                yield row
+
+            if not fresh and paged:
+                break  # 페이지 이동 후에도 새 행이 없으면 종료
+
+            # 가상 스크롤 영역 아래쪽 → 없으면 다음 페이지
+            if self.grid_barrier:
+                await self.grid_barrier()
+            rows = None
+            if fresh:
+                rows = await self.fetch_grid(
+                    screen, row_selector, columns, key_column,
+                    action=lambda: self._scroll_grid(screen, row_selector), **grid_kwargs
+                )
+                paged = False
+            if rows is None:
+                rows = await self.fetch_grid(
+                    screen, row_selector, columns, key_column,
+                    action=lambda: self._next_grid_page(screen, row_selector), **grid_kwargs
+                )
+                paged = True
+
+        logger.debug(f"[{screen}] 그리드 순회 완료: {len(seen)}행 / {self.grid_page}페이지")
+
+    async def _scroll_grid(self, screen: str, row_selector: str, to_top: bool = False) -> bool:
+        """그리드 스크롤 영역을 한 화면 아래로 (또는 맨 위로) 이동, 이동 여부 반환"""
+        moved = await self.page.evaluate("""
+            ([selector, toTop]) => {
+                const el = document.querySelector(selector);
+                if (!el) return false;
+                const before = el.scrollTop;
+                el.scrollTop = toTop ? 0 : before + el.clientHeight;
+                return el.scrollTop !== before;
+            }
+        """, [self.GRID_SCROLL_SELECTOR, to_top])
+        if moved:
+            await self.ready(screen, grid=row_selector)
+        return moved
+
+    async def _next_grid_page(self, screen: str, row_selector: str) -> bool:
+        """다음 페이지로 이동, 이동 여부 반환"""
+        next_btn = self.page.locator(self.PAGER_NEXT_SELECTOR)
+        if not await next_btn.count():
+            return False
+
+        await self.throttle(ACTION_SUBMIT)
+        await next_btn.first.click()
+        await self.ready(screen, grid=row_selector)
+        self.grid_page += 1
+        return True
+
+    async def reveal_row(
+        self,
+        screen: str,
+        row_selector: str,
+        row_key: str,
+        grid_page: Optional[int] = None
+    ) -> Locator:
+        """행이 DOM에 나타나도록 페이지/스크롤 이동 후 행 Locator 반환
+
+        응답 캡처나 다른 페이지에서 읽은 행은 현재 화면에 렌더링되어 있지
+        않을 수 있으므로 클릭 전에 호출한다.
+        """
+        row = self.locate_row(row_selector, row_key)
+        if await row.count():
+            return row
+
+        if grid_page and grid_page != self.grid_page:
+            page_link = self.page.locator(self.PAGER_INDEX_SELECTOR).filter(
+                has_text=str(grid_page)
+            )
+            if await page_link.count():
+                await self.throttle(ACTION_SUBMIT)
+                await page_link.first.click()
+                await self.ready(screen, grid=row_selector, required=True)
+                self.grid_page = grid_page
+                if await row.count():
+                    return row
+
+        # 가상 스크롤 영역을 위에서부터 내려가며 탐색
+        await self._scroll_grid(screen, row_selector, to_top=True)
+        while not await row.count():
+            if not await self._scroll_grid(screen, row_selector):
+                break
+        return row
+
+    def locate_row(self, row_selector: str, row_key: str) -> Locator:
+        """행 키로 그리드 행 재탐색"""
+        return self.page.locator(row_selector).filter(has_text=row_key).first
+
+    async def option_index(self, selector: str) -> Optional[OptionIndex]:
+        """셀렉트 박스 옵션 인덱스 (보조사업별로 한 번만 조회, 셀렉트 박스가 없으면 None)"""
+        key = (selector, self.fiscal_year, self.project_code)
+        index = self.option_indexes.get(key)
+        if index is None:
+            options = await self.page.evaluate(SELECT_OPTIONS_SCRIPT, selector)
+            if options is None:
+                return None
+            index = OptionIndex(options)
+            self.option_indexes[key] = index
+            logger.debug(f"옵션 인덱스 생성: {selector} ({len(index)}개)")
+        return index
+
+    async def select_option_text(self, selector: str, text: str, fallback: Optional[str] = None) -> bool:
+        """옵션 텍스트로 선택 (인덱스 조회 후 select_option 한 번)"""
+        index = await self.option_index(selector)
+        if index is None:
+            return False
+
+        value = index.find(text, fallback)
+        if value is None:
+            logger.warning(f"옵션 '{text}' 못 찾음: {selector}")
+            return False
+        if index.find(text) is None:
+            logger.warning(f"옵션 '{text}' 못 찾음, '{fallback}' 선택")
+
+        await self.page.select_option(selector, value=value)
+        return True
+
+    async def _select_budget_item(self, budget_item: str):
+        """비목 선택 (못 찾으면 기타운영비)"""
+        try:
+            await self.select_option_text(self.BUDGET_ITEM_SELECTOR, budget_item, fallback='기타')
+        except Exception as e:
+            logger.error(f"비목 선택 중 오류: {e}")
+
+    async def _select_funding_type(self, funding_type: str):
+        """재원구분 선택"""
+        try:
+            await self.select_option_text(self.FUNDING_TYPE_SELECTOR, funding_type)
+        except Exception as e:
+            logger.error(f"재원구분 선택 중 오류: {e}")
+
     def find_budget_mapping(self, vendor_name: str, business_type: str = "") -> Dict[str, str]:
-        """비목/세목 매핑 찾기"""
-        rules = config.budget_mapping_rules
-
-        for rule in rules:
-            # 업종 매칭
-            if 'vendor_type' in rule and business_type:
-                if rule['vendor_type'] in business_type:
-                    return {
-                        'item': rule['budget_item'],
-                        'funding': rule['funding_type']
-                    }
-
-            # 거래처명 패턴 매칭
-            if 'vendor_name_contains' in rule and vendor_name:
-                if rule['vendor_name_contains'] in vendor_name:
-                    return {
-                        'item': rule['budget_item'],
-                        'funding': rule['funding_type']
-                    }
-
-        # 기본값 반환
-        default = config.default_budget
-        return {
-            'item': default.get('budget_item', '기타운영비'),
-            'funding': default.get('funding_type', '시도비')
-        }
+        """비목/세목 매핑 찾기 (컴파일된 규칙 + 거래처별 캐시)"""
+        return get_budget_matcher().match(vendor_name, business_type)
+
+    async def open_record_screen(self) -> bool:
+        """처리 대상 목록 화면 열기 (워커 준비용, 서브클래스에서 구현)"""
+        raise NotImplementedError("서브클래스에서 구현하세요")
+
+    def create_worker(self) -> 'BotameAutomation':
+        """같은 설정/로거를 쓰는 워커 인스턴스 생성"""
+        worker = self.__class__()
+        worker.logger = self.logger
+        worker.fiscal_year = self.fiscal_year
+        worker.project_code = self.project_code
+        worker.option_indexes = self.option_indexes
+        worker.journal = self.journal
+        worker.retry = self.retry
+        worker.watermark = self.watermark
+        return worker
+
+    async def with_retry(
+        self,
+        label: str,
+        operation: Callable[[], Awaitable[bool]],
+        item: Optional[str] = None
+    ) -> bool:
+        """일시적 오류(timeout/detached/세션 만료)는 재시도하고, 최종 실패는 False 반환
+
+        처리 메서드는 retry.is_transient인 예외를 직접 처리하지 않고 다시
+        발생시켜 이 메서드에서 재시도되도록 한다.
+
+        Args:
+            label: 로그/스크린샷용 작업 이름
+            operation: 성공 여부를 반환하는 비동기 함수 (매 시도마다 호출)
+            item: 최종 실패 시 항목 로그에 남길 이름
+        """
+        try:
+            return await self.retry.run(operation, label, recover=self._recover)
+        except Exception as e:
+            logger.error(f"{label} 재시도 후 실패: {e}")
+            if item:
+                self.logger.log_item(item, "FAILURE", str(e))
+            await self.browser_manager.screenshot(f"retry_failed_{label}")
+            return False
+
+    async def _recover(self, kind: str) -> bool:
+        """재시도 전 복구 (세션 만료이거나 로그인 화면으로 돌아갔으면 재로그인)"""
+        if kind == ERROR_TIMEOUT:
+            self.rate_limiter.on_error()
+
+        try:
+            if kind != ERROR_SESSION and not await self.page.locator(self.LOGIN_FORM_SELECTOR).count():
+                return True
+
+            logger.warning("세션 만료 감지 - 재로그인 후 재시도")
+            self.retry.relogins += 1
+            self.session.logged_in = False
+            self.browser_manager.clear_session()
+            if not await self.ensure_login():
+                return False
+            self.session.logged_in = True
+            return await self.select_project() and await self.open_record_screen()
+
+        except Exception as e:
+            logger.error(f"재로그인 중 오류: {e}")
+            return False
+
+    def open_journal(self) -> Optional[RecordJournal]:
+        """처리 기록 열기 (비활성화 시 None)"""
+        try:
+            journal = RecordJournal.from_config(self.automation_type, self.fiscal_year, self.project_code)
+            self.journal = journal.open() if journal else None
+        except Exception as e:
+            logger.warning(f"처리 기록을 열 수 없음 - 기록 없이 진행: {e}")
+            self.journal = None
+        self.watermark = self._load_watermark()
+        return self.journal
+
+    def _load_watermark(self) -> Optional[date]:
+        """저장된 증분 조회 워터마크 (처리 기록이 없거나 비활성화 시 None)"""
+        if not (self.journal and self.WATERMARK_FIELD and config.get('watermark.enabled', True)):
+            return None
+        watermark = parse_date(self.journal.get_watermark())
+        if watermark:
+            logger.info(f"증분 조회 워터마크: {watermark} (이전 실행에서 이 일자까지 처리 완료)")
+        return watermark
+
+    async def fill_search_from(self) -> Optional[date]:
+        """목록 조회 조건 시작일을 워터마크 기준으로 입력 (조회 버튼 클릭 전에 호출)
+
+        워터마크가 없거나 입력란을 찾지 못하면 화면 기본 조건(회계연도 전체)으로 조회한다.
+        """
+        start = search_start(self.watermark, config.get('watermark.overlap_days', 7), self.fiscal_year)
+        if start is None:
+            return None
+
+        date_from = self.page.locator(self.DATE_FROM_SELECTOR)
+        if not await date_from.count():
+            logger.warning("조회 시작일 입력란을 찾을 수 없음 - 전체 기간 조회")
+            return None
+
+        await date_from.first.fill(start.strftime(config.get('watermark.date_format', '%Y-%m-%d')))
+        logger.info(f"증분 조회: {start} 이후 내역만 조회")
+        return start
+
+    def _save_watermark(self, results: Dict[str, Any]):
+        """이번 실행 결과로 워터마크 갱신"""
+        value = self.watermarks.next_value(self.fetch_complete)
+        if not self.fetch_complete:
+            logger.info("목록을 끝까지 조회하지 않아 워터마크 유지")
+        if value and value != self.watermark:
+            self.journal.set_watermark(value.isoformat())
+            logger.info(f"워터마크 갱신: {self.watermark} → {value}")
+            self.watermark = value
+        results['watermark'] = value.isoformat() if value else None
+
+    def close_journal(self):
+        """처리 기록 저장 후 닫기"""
+        if self.journal:
+            self.journal.close()
+
+    def journal_mark(self, record: GridRecord, state: str, detail: str = ''):
+        """레코드 처리 단계 기록"""
+        if self.journal:
+            self.journal.mark(record.row_key, state, detail)
+
+    def journal_pending_request(self) -> int:
+        """저장했지만 아직 집행요청하지 않은 건수 (이전 실행분 포함)"""
+        return len(self.journal.keys('saved')) if self.journal else 0
+
+    def journal_requested(self):
+        """일괄 집행요청 완료 기록"""
+        if self.journal:
+            count = self.journal.advance('saved', 'requested')
+            logger.debug(f"집행요청 완료 기록: {count}건")
+
+    def deferred_requests(self) -> List['BotameAutomation']:
+        """이 자동화에 일괄 집행요청을 넘긴 앞 자동화"""
+        return [automation for automation in self.request_for if automation.request_deferred]
+
+    async def request_execution(self, results: Dict[str, Any]) -> bool:
+        """일괄 집행요청 (이동 계획상 뒤 자동화가 같은 화면에서 함께 요청하면 넘김)"""
+        if OP_BATCH_REQUEST in self.deferred_operations:
+            self.request_deferred = True
+            results['request_deferred'] = True
+            logger.info("일괄 집행요청은 집행등록 화면의 다음 자동화에서 함께 수행")
+            return True
+
+        if not await self.with_retry('batch_execution_request', self.batch_execution_request):
+            return False
+        self.journal_requested()
+        for automation in self.deferred_requests():
+            automation.mark_requested()
+        return True
+
+    def mark_requested(self):
+        """다른 자동화가 함께 수행한 일괄 집행요청을 처리 기록에 반영"""
+        self.request_deferred = False
+        if self.open_journal():
+            self.journal_requested()
+        self.close_journal()
+
+    def _skip_finished(self, record: GridRecord, results: Dict[str, Any]) -> bool:
+        """이전 실행에서 저장까지 끝난 건이면 건너뜀 (화면 조작 전에 판단)"""
+        if self.journal and self.journal.is_done(record.row_key):
+            results['skipped'] = results.get('skipped', 0) + 1
+            logger.debug(f"이전 실행에서 처리 완료 - 건너뜀: {record.row_key}")
+            return True
+        self.journal_mark(record, 'fetched')
+        return False
+
+    async def process_records(
+        self,
+        records: Union[Iterable[GridRecord], AsyncIterator[GridRecord]],
+        handler: str,
+        results: Dict[str, Any]
+    ):
+        """레코드 일괄 처리 (조회 → 매핑 → 등록 파이프라인)
+
+        records는 리스트 또는 iter_grid 같은 비동기 반복자를 받는다. 조회한
+        레코드는 크기가 제한된 대기열을 따라 매핑 단계(map_record)와 등록
+        단계(handler)로 넘어가며, 단계별 처리량/대기열 깊이는
+        results['pipeline']에 기록된다. 매핑 단계는 쌓인 레코드를 묶어
+        AMOUNT_COLUMNS를 한 번에 정수로 바꾸고 대사하므로(results['reconciliation'],
+        대사 보고서 CSV) 등록 단계에는 검증된 정수 금액만 넘어간다.
+
+        max_workers가 2 이상이면 등록 단계가 워커마다 로그인된 컨텍스트에서
+        병렬로 돌고, 메인 페이지는 다음 페이지를 계속 읽는다. 워커가 1개면
+        메인 페이지를 함께 쓰므로 그리드를 이동하기 전에 대기 중인 등록이
+        끝나기를 기다린다(grid_barrier). 결과와 로그는 모두 이 인스턴스의
+        results/AutomationLogger에 모인다.
+        처리 기록(journal)이 있으면 이전 실행에서 저장까지 끝난 건은 화면 조작
+        없이 건너뛰고(results['skipped']), 저장에 성공한 건은 saved로 기록한다.
+        WATERMARK_FIELD가 있으면 목록을 끝까지 읽은 실행에 한해 처리 완료된
+        일자까지 워터마크를 올려(results['watermark']) 다음 조회 시작일로 쓴다.
+
+        Args:
+            records: 처리할 레코드 (records.GridRecord)
+            handler: 레코드 처리 메서드명 (예: 'process_record')
+            results: 처리 건수를 집계할 결과 딕셔너리
+        """
+        workers = self.max_workers
+        if isinstance(records, list):
+            workers = min(workers, len(records))
+
+        planned = set(self.plan) if self.plan is not None else None
+
+        # 증분 조회 워터마크 추적 (계획 실행은 계획 밖의 행을 건너뛰므로 제외)
+        self.fetch_complete = False
+        self.watermarks = None
+        if self.journal and self.WATERMARK_FIELD and self.plan is None and config.get('watermark.enabled', True):
+            self.watermarks = WatermarkTracker(self.watermark)
+
+        async def fetch() -> AsyncIterator[GridRecord]:
+            async for record in _iterate(records):
+                if planned is not None:
+                    if record.row_key not in planned:
+                        continue
+                    planned.discard(record.row_key)
+
+                if self.watermarks:
+                    self.watermarks.fetched(record.get(self.WATERMARK_FIELD))
+                if not self._skip_finished(record, results):
+                    yield record
+                elif self.watermarks:
+                    self.watermarks.settled(record.get(self.WATERMARK_FIELD))
+
+                if planned is not None and not planned:
+                    break  # 계획된 건을 모두 찾으면 나머지 페이지는 읽지 않음
+
+        # 금액 열 정수 변환/대사 (묶음 단위, 보고서는 묶음마다 파일에 이어 씀)
+        reconciler = AmountReconciler.from_config(self.AMOUNT_COLUMNS) if self.AMOUNT_COLUMNS else None
+        if reconciler:
+            try:
+                reconciler.start_report(self.automation_type)
+            except Exception as e:
+                logger.warning(f"대사 보고서 파일을 열 수 없음 - 실행 후 저장: {e}")
+
+        async def map_stage(batch: List[GridRecord]) -> List[GridRecord]:
+            if reconciler:
+                batch = reconciler.check(batch)
+            for record in batch:
+                self.map_record(record)
+                if self.plan is not None:
+                    record.budget = dict(self.plan[record.row_key]['budget'])
+                self.journal_mark(record, 'mapped', (record.budget or {}).get('item', ''))
+            return batch
+
+        if workers <= 1:
+            register = [lambda: self._main_consumer(handler, results)]
+        else:
+            logger.info(f"워커 {workers}개로 병렬 처리")
+            register = [
+                functools.partial(self._worker_consumer, worker_id, handler, results)
+                for worker_id in range(1, workers + 1)
+            ]
+
+        pipeline = Pipeline(
+            self.automation_type,
+            [
+                Stage('map', map_stage, batch_size=config.get('pipeline.map_batch_size', 50)),
+                Stage('register', consumers=register)
+            ],
+            queue_size=config.get('pipeline.queue_size', 20),
+            report_interval=config.get('pipeline.report_interval', 30)
+        )
+        if workers <= 1:
+            self.grid_barrier = pipeline.drain
+
+        try:
+            await pipeline.run(fetch())
+        finally:
+            self.grid_barrier = None
+            results['pipeline'] = pipeline.report()
+            if reconciler:
+                results['reconciliation'] = reconciler.summary()
+                try:
+                    reconciler.write_report(self.automation_type)
+                except Exception as e:
+                    logger.warning(f"대사 보고서 저장 실패: {e}")
+
+        if planned:
+            logger.warning(f"처리 계획 중 {len(planned)}건을 목록에서 찾지 못함: {', '.join(sorted(planned)[:10])}")
+            results['plan_missing'] = len(planned)
+
+        # 모든 워커가 준비에 실패한 경우 남은 건은 메인 페이지에서 처리
+        if pipeline.leftover:
+            logger.warning(f"워커 미처리 {len(pipeline.leftover)}건 - 메인 페이지에서 순차 처리")
+            if await self.open_record_screen():
+                for record in pipeline.leftover:
+                    await self._handle(self, handler, record, results)
+
+        if self.watermarks:
+            self._save_watermark(results)
+
+    def use_plan(self, path: str):
+        """처리 계획 파일(main.py plan)을 작업 목록으로 사용
+
+        계획에서 등록 대상(register)인 건만 처리하고, 비목/재원은 계획 파일의
+        값을 그대로 쓴다. 처리 대상이 계획으로 정해지므로 max_items는 적용하지 않는다.
+        """
+        from .planner import load_plan
+
+        self.plan = load_plan(path)
+        self.max_items = 0
+
+    def use_navigation(
+        self,
+        plan: NavigationPlan,
+        automation_type: str,
+        automations: Dict[str, 'BotameAutomation']
+    ):
+        """화면 이동 계획 적용 (automations: 먼저 실행한 자동화 타입 -> 인스턴스)"""
+        self.deferred_operations = plan.deferred_operations(automation_type)
+        self.request_for = [automations[other] for other in plan.performs_for(automation_type) if other in automations]
+
+    def map_record(self, record: GridRecord) -> GridRecord:
+        """등록 전 매핑/검증 (파이프라인 매핑 단계, 서브클래스에서 record['budget'] 등을 채움)"""
+        return record
+
+    @asynccontextmanager
+    async def _main_consumer(self, handler: str, results: Dict[str, Any]):
+        """등록 단계 소비자: 메인 페이지"""
+        yield lambda record: self._handle(self, handler, record, results)
+
+    @asynccontextmanager
+    async def _worker_consumer(self, worker_id: int, handler: str, results: Dict[str, Any]):
+        """등록 단계 소비자: 자신의 컨텍스트에서 로그인/화면 준비 후 처리 (실패 시 None)"""
+        worker = self.create_worker()
+        worker_session = await self.session.spawn_worker(worker_id, worker)
+
+        try:
+            failure = await worker.prepare(worker_session)
+            if failure or not await worker.open_record_screen():
+                logger.error(f"워커 {worker_id} 준비 실패: {failure or '화면 열기 실패'}")
+                await worker_session.browser_manager.screenshot("worker_error")
+                yield None
+            else:
+                yield lambda record: self._handle(worker, handler, record, results)
+
+        finally:
+            await worker_session.close()
+
+    async def _handle(
+        self,
+        target: 'BotameAutomation',
+        handler: str,
+        record: GridRecord,
+        results: Dict[str, Any]
+    ):
+        """레코드 1건 처리(일시적 오류는 재시도) 후 결과 집계 및 저장 완료 기록"""
+        success = await target.with_retry(
+            f"{handler}_{record.row_key}",
+            lambda: getattr(target, handler)(record),
+            item=record.row_key
+        )
+        self._count_result(results, success)
+        if success:
+            self.journal_mark(record, 'saved')
+            if self.watermarks:
+                self.watermarks.settled(record.get(self.WATERMARK_FIELD))
+
+    @staticmethod
+    def _count_result(results: Dict[str, Any], success: bool):
+        """처리 결과 집계"""
+        results['processed'] += 1
+        if success:
+            results['success'] += 1
+        else:
+            results['failure'] += 1
 
     async def run(self) -> Dict[str, Any]:
         """자동화 실행 (서브클래스에서 구현)"""
         raise NotImplementedError("서브클래스에서 구현하세요")
+
+
+async def _iterate(records: Union[Iterable[Any], AsyncIterator[Any]]) -> AsyncIterator[Any]:
+    """리스트와 비동기 반복자를 같은 방식으로 순회"""
+    if hasattr(records, '__aiter__'):
+        async for record in records:
+            yield record
+    else:
+        for record in records:
+            yield record
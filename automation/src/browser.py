@@ -1,10 +1,16 @@
 """브라우저 관리 모듈"""
 import asyncio
+import json
+import os
+import time
+from pathlib import Path
 from typing import Optional
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext
+from playwright.async_api import async_playwright, Browser, Page, BrowserContext, Route
 from loguru import logger
 
 from .config import config
+from .readiness import PageReadiness
+from .resource_policy import ResourcePolicy
 
 
 class BrowserManager:
@@ -15,38 +21,141 @@ class BrowserManager:
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.readiness: Optional[PageReadiness] = None
+        self.resource_policy: Optional[ResourcePolicy] = None
+        self.session_restored = False
+        self.owns_browser = True
+        self.screenshot_prefix = ''
+
+    @property
+    def session_path(self) -> Optional[Path]:
+        """세션 저장 파일 경로 (비활성화 시 None)"""
+        if not config.get('session.enabled', True):
+            return None
+        return Path(config.get('session.storage_state', '.session/storage_state.json'))
+
+    def _load_session_state(self) -> Optional[str]:
+        """재사용 가능한 세션 파일 경로 반환 (없거나 만료되면 None)"""
+        path = self.session_path
+        if not path or not path.exists():
+            return None
+
+        max_age = config.get('session.max_age_minutes', 60) * 60
+        age = time.time() - path.stat().st_mtime
+        if age > max_age:
+            logger.info(f"저장된 세션 만료 ({age / 60:.0f}분 경과) - 새로 로그인합니다")
+            self.clear_session()
+            return None
+
+        return str(path)
 
     async def start(self) -> Page:
         """브라우저 시작"""
         logger.info("브라우저 시작...")
 
         self.playwright = await async_playwright().start()
+        self.resource_policy = ResourcePolicy.from_config()
 
         # 브라우저 실행
-        self.browser = await self.playwright.chromium.launch(
-            headless=config.is_headless,
-            slow_mo=config.slow_mo
-        )
+        # 동작 간격은 rate_limiter가 동작 분류별로 조절 (slow_mo 미사용)
+        self.browser = await self.playwright.chromium.launch(headless=config.is_headless)
+
+        # 컨텍스트 생성 (저장된 세션이 있으면 복원)
+        storage_state = self._load_session_state()
+        await self._open_context(storage_state)
+        self.session_restored = storage_state is not None
+        if self.session_restored:
+            logger.info(f"저장된 세션 복원: {storage_state}")
+
+        logger.info("브라우저 시작 완료")
+        return self.page
 
-        # 컨텍스트 생성
+    async def _open_context(self, storage_state=None):
+        """컨텍스트 및 페이지 생성"""
         self.context = await self.browser.new_context(
             viewport={'width': 1920, 'height': 1080},
-            locale='ko-KR'
+            locale='ko-KR',
+            storage_state=storage_state
         )
 
-        # 페이지 생성
+        # 불필요한 리소스 차단
+        if self.resource_policy:
+            await self.context.route('**/*', self._route_request)
+
+        # 페이지 생성 (준비 상태 감지기는 첫 요청부터 추적하도록 바로 연결)
         self.page = await self.context.new_page()
+        self.readiness = PageReadiness(self.page)
 
         # 타임아웃 설정
         self.page.set_default_timeout(config.get('botame.timeout', 30000))
 
-        logger.info("브라우저 시작 완료")
-        return self.page
+    async def spawn_worker(self, worker_id: int) -> 'BrowserManager':
+        """같은 브라우저에 로그인 상태를 복사한 워커 컨텍스트 생성
+
+        워커는 브라우저를 공유하므로 stop() 시 자신의 컨텍스트만 닫는다.
+        """
+        worker = BrowserManager()
+        worker.playwright = self.playwright
+        worker.browser = self.browser
+        worker.owns_browser = False
+        worker.resource_policy = self.resource_policy
+        worker.screenshot_prefix = f"w{worker_id}_"
+
+        await worker._open_context(await self.context.storage_state())
+        logger.debug(f"워커 {worker_id} 컨텍스트 생성")
+        return worker
+
+    async def _route_request(self, route: Route):
+        """리소스 차단 정책 적용"""
+        request = route.request
+        if self.resource_policy.should_block(request.resource_type, request.url):
+            await route.abort('blockedbyclient')
+        else:
+            await route.continue_()
+
+    async def save_session(self):
+        """로그인 세션 저장 (소유자 전용 권한)"""
+        path = self.session_path
+        if not path or not self.context:
+            return
+
+        try:
+            state = await self.context.storage_state()
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+            # 임시 파일에 0600으로 쓴 뒤 교체 (쓰기 도중 중단돼도 기존 파일 유지)
+            tmp_path = path.with_suffix(path.suffix + '.tmp')
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, path)
+            os.chmod(path, 0o600)
+
+            logger.debug(f"세션 저장: {path}")
+
+        except Exception as e:
+            logger.warning(f"세션 저장 실패: {e}")
+
+    def clear_session(self):
+        """저장된 세션 삭제"""
+        path = self.session_path
+        if path and path.exists():
+            path.unlink()
+            logger.debug(f"세션 삭제: {path}")
+        self.session_restored = False
 
     async def stop(self):
-        """브라우저 종료"""
+        """브라우저 종료 (워커는 자신의 컨텍스트만 종료)"""
+        if not self.owns_browser:
+            if self.context:
+                await self.context.close()
+            return
+
         logger.info("브라우저 종료...")
 
+        if self.resource_policy:
+            logger.info(f"리소스 차단 정책: {self.resource_policy.summary()}")
+
         if self.page:
             await self.page.close()
         if self.context:
@@ -61,7 +170,7 @@ class BrowserManager:
     async def screenshot(self, name: str):
         """스크린샷 저장"""
         if self.page:
-            path = f"logs/screenshots/{name}.png"
+            path = f"logs/screenshots/{self.screenshot_prefix}{name}.png"
             await self.page.screenshot(path=path)
             logger.debug(f"스크린샷 저장: {path}")
 
@@ -0,0 +1,123 @@
+"""비목/세목 매핑 모듈
+
+매핑 규칙을 한 번만 컴파일하여 (업종, 거래처명) 패턴을 각각 하나의 정규식으로
+검사한다. 규칙 우선순위는 기존과 같이 "먼저 적힌 규칙이 우선"이며, 결과는
+정규화된 (거래처명, 업종) 키로 LRU 캐시에 보관한다.
+"""
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import config
+
+
+DEFAULT_BUDGET_ITEM = '기타운영비'
+DEFAULT_FUNDING_TYPE = '시도비'
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """매칭용 정규화 (전각/반각 통일, 대소문자 무시, 공백 정리)"""
+    if not text:
+        return ''
+    return ' '.join(unicodedata.normalize('NFKC', text).casefold().split())
+
+
+class _PatternIndex:
+    """부분 문자열 패턴 집합 → 일치하는 규칙 중 가장 앞선 규칙 번호
+
+    모든 위치에서 전방탐색 (?=(p1|p2|...))을 시도하면 각 위치마다 규칙 순서상
+    가장 앞선 패턴이 잡히므로, 그 중 최솟값이 전체에서 가장 앞선 규칙이 된다.
+    """
+
+    def __init__(self, patterns: List[Tuple[int, str]]):
+        self.index: Dict[str, int] = {}
+        self.empty_rule: Optional[int] = None  # 빈 패턴은 모든 값에 일치
+
+        for rule_no, pattern in patterns:
+            if not pattern:
+                if self.empty_rule is None:
+                    self.empty_rule = rule_no
+            elif pattern not in self.index:
+                self.index[pattern] = rule_no
+
+        ordered = sorted(self.index, key=self.index.get)
+        self.regex = re.compile(
+            '(?=(' + '|'.join(re.escape(p) for p in ordered) + '))'
+        ) if ordered else None
+
+    def first_rule(self, text: str) -> Optional[int]:
+        """text에 일치하는 가장 앞선 규칙 번호 (없으면 None)"""
+        if not text:
+            return None
+
+        best = self.empty_rule
+        if self.regex:
+            for match in self.regex.finditer(text):
+                rule_no = self.index[match.group(1)]
+                if best is None or rule_no < best:
+                    best = rule_no
+                    if best == 0:
+                        break
+        return best
+
+
+class BudgetMatcher:
+    """컴파일된 비목/세목 매핑기"""
+
+    def __init__(
+        self,
+        rules: List[Dict[str, Any]],
+        default: Optional[Dict[str, str]] = None,
+        cache_size: int = 4096
+    ):
+        default = default or {}
+        self.default = (
+            default.get('budget_item', DEFAULT_BUDGET_ITEM),
+            default.get('funding_type', DEFAULT_FUNDING_TYPE)
+        )
+        self.results = [(rule['budget_item'], rule['funding_type']) for rule in rules]
+
+        self._by_type = _PatternIndex([
+            (no, normalize_text(rule['vendor_type']))
+            for no, rule in enumerate(rules) if 'vendor_type' in rule
+        ])
+        self._by_name = _PatternIndex([
+            (no, normalize_text(rule['vendor_name_contains']))
+            for no, rule in enumerate(rules) if 'vendor_name_contains' in rule
+        ])
+
+        self._lookup = lru_cache(maxsize=cache_size)(self._match_normalized)
+
+    def _match_normalized(self, vendor_name: str, business_type: str) -> Tuple[str, str]:
+        candidates = [
+            rule_no for rule_no in (
+                self._by_type.first_rule(business_type),
+                self._by_name.first_rule(vendor_name)
+            ) if rule_no is not None
+        ]
+        return self.results[min(candidates)] if candidates else self.default
+
+    def match(self, vendor_name: str, business_type: str = '') -> Dict[str, str]:
+        """비목/세목 매핑 ({'item': 비목, 'funding': 재원})"""
+        item, funding = self._lookup(normalize_text(vendor_name), normalize_text(business_type))
+        return {'item': item, 'funding': funding}
+
+    def cache_info(self):
+        """LRU 캐시 통계"""
+        return self._lookup.cache_info()
+
+
+_matcher: Optional[BudgetMatcher] = None
+
+
+def get_budget_matcher() -> BudgetMatcher:
+    """설정 기반 매핑기 (최초 호출 시 한 번만 컴파일)"""
+    global _matcher
+    if _matcher is None:
+        _matcher = BudgetMatcher(
+            config.budget_mapping_rules,
+            config.default_budget,
+            cache_size=config.get('budget_mapping.cache_size', 4096)
+        )
+    return _matcher
@@ -1,25 +1,35 @@
 """카드사용내역 집행등록 자동화"""
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, AsyncIterator
 from loguru import logger
 
 from .botame import BotameAutomation
 from .config import config
+from .navigation import CARD_MENU, EXECUTION_MENU
+from .rate_limiter import ACTION_NAVIGATE, ACTION_SAVE, ACTION_SUBMIT
+from .records import CardRecord
+from .retry import is_transient
+from .session import BotameSession
 
 
 class CardUsageAutomation(BotameAutomation):
     """보조금전용카드 사용내역 집행등록 자동화"""
 
+    # 카드사용내역 그리드 (셀렉터는 실제 화면에 맞게 수정 필요)
+    ROW_SELECTOR = 'tr.card-usage-row, .card-usage-item'
+    COLUMNS = ['transaction_date', 'approval_number', 'amount', 'merchant_name', 'business_type']
+    AMOUNT_COLUMNS = list(CardRecord.AMOUNT_FIELDS)
+    WATERMARK_FIELD = 'transaction_date'
+
     def __init__(self):
         super().__init__("카드사용내역_집행등록")
         self.max_items = config.get('automation.card_usage.max_items', 50)
+        self.max_workers = config.get('automation.card_usage.max_workers', 1)
 
-    async def fetch_unused_records(self) -> List[Dict[str, Any]]:
-        """미사용 카드사용내역 조회"""
-        records = []
-
+    async def open_record_screen(self) -> bool:
+        """카드사용내역관리 화면에서 미사용 내역 조회"""
         try:
             # 카드사용내역관리 메뉴 이동
-            await self.navigate_to_menu(['금융정보관리', '보조금카드관리', '보조금전용카드사용내역관리'])
+            await self.open_screen(CARD_MENU)
 
             # 조회 조건 설정
             await self.page.select_option('select#fiscalYear', self.fiscal_year)
@@ -29,144 +39,124 @@ class CardUsageAutomation(BotameAutomation):
             if unused_checkbox:
                 await unused_checkbox.check()
 
+            # 이전 실행 이후 내역만 조회 (워터마크가 있으면)
+            await self.fill_search_from()
+
             # 조회 버튼 클릭
+            await self.throttle(ACTION_SUBMIT)
             await self.page.click('button:has-text("조회")')
-            await self.page.wait_for_load_state('networkidle')
+            await self.ready('card_usage', grid=self.ROW_SELECTOR, required=True)
+            return True
+
+        except Exception as e:
+            logger.error(f"카드내역 화면 조회 중 오류: {e}")
+            await self.browser_manager.screenshot("open_card_screen_error")
+            return False
 
-            # 미사용 내역 추출 (셀렉터는 실제 화면에 맞게 수정 필요)
-            rows = await self.page.query_selector_all('tr.card-usage-row, .card-usage-item')
+    async def iter_unused_records(self) -> AsyncIterator[CardRecord]:
+        """미사용 카드사용내역을 페이지/스크롤을 따라가며 순차 반환 (최대 max_items건)"""
+        count = 0
 
-            for row in rows[:self.max_items]:
+        try:
+            # 미사용 내역 조회 (응답 캡처 또는 DOM 추출, 셀렉터는 실제 화면에 맞게 수정 필요)
+            async for row in self.iter_grid(
+                'card_usage',
+                self.ROW_SELECTOR,
+                self.COLUMNS,
+                key_column='approval_number',
+                min_cells=5,
+                status_selectors={'used_status': '.used-status, td:last-child'}
+            ):
                 # 사용여부 확인
-                used_cell = await row.query_selector('.used-status, td:last-child')
-                if used_cell:
-                    used_text = await used_cell.inner_text()
-                    if 'Y' in used_text or '사용' in used_text:
-                        continue  # 이미 사용된 건 스킵
-
-                # 데이터 추출
-                record = await self._extract_record_data(row)
-                if record:
-                    records.append(record)
+                used_text = row.pop('used_status', None)
+                if used_text and ('Y' in used_text or '사용' in used_text):
+                    continue  # 이미 사용된 건 스킵
+
+                yield CardRecord.from_row(row)
+                count += 1
+                if self.max_items and count >= self.max_items:
+                    logger.info(f"최대 처리 건수({self.max_items}건) 도달 - 나머지는 다음 실행에서 처리")
+                    break
+            else:
+                self.fetch_complete = True
 
-            logger.info(f"미사용 카드내역 {len(records)}건 조회 완료")
-            return records
+            logger.info(f"미사용 카드내역 {count}건 조회 완료")
 
         except Exception as e:
             logger.error(f"카드내역 조회 중 오류: {e}")
             await self.browser_manager.screenshot("fetch_card_error")
-            return records
 
-    async def _extract_record_data(self, row) -> Dict[str, Any]:
-        """행에서 데이터 추출"""
-        try:
-            cells = await row.query_selector_all('td')
-            if len(cells) < 5:
-                return None
-
-            return {
-                'transaction_date': await cells[0].inner_text(),
-                'approval_number': await cells[1].inner_text(),
-                'amount': await cells[2].inner_text(),
-                'merchant_name': await cells[3].inner_text(),
-                'business_type': await cells[4].inner_text() if len(cells) > 4 else '',
-                'element': row
-            }
-        except Exception as e:
-            logger.warning(f"데이터 추출 중 오류: {e}")
-            return None
+    async def fetch_unused_records(self) -> List[CardRecord]:
+        """미사용 카드사용내역 조회 (전체 목록)"""
+        return [record async for record in self.iter_unused_records()]
 
-    async def process_record(self, record: Dict[str, Any]) -> bool:
+    def map_record(self, record: CardRecord) -> CardRecord:
+        """비목/세목 매핑 (파이프라인 매핑 단계)"""
+        record.budget = self.find_budget_mapping(record.merchant_name, record.business_type)
+        return record
+
+    async def process_record(self, record: CardRecord) -> bool:
         """개별 카드내역 집행등록"""
+        merchant = record.merchant_name or 'Unknown'
         try:
-            merchant = record.get('merchant_name', 'Unknown')
-            amount = record.get('amount', '0')
+            amount = record.amount
 
-            logger.info(f"처리 중: {merchant} / {amount}")
+            logger.info(f"처리 중: {merchant} / {amount:,}")
 
             # 해당 행의 집행등록 버튼 클릭 (또는 체크박스 선택 후 일괄 등록)
-            row = record.get('element')
-            if row:
-                register_btn = await row.query_selector('button:has-text("집행등록"), a:has-text("등록")')
-                if register_btn:
-                    await register_btn.click()
-                    await self.page.wait_for_load_state('networkidle')
+            row = await self.reveal_row('card_usage', self.ROW_SELECTOR, record.row_key, record.grid_page)
+            register_btn = row.locator('button:has-text("집행등록"), a:has-text("등록")')
+            if await register_btn.count():
+                await self.throttle(ACTION_NAVIGATE)
+                await register_btn.first.click()
+                await self.ready('card_register', required=True)
 
             # 집행등록 화면/팝업에서 처리
-            # 증빙유형 선택
-            evidence_select = await self.page.query_selector('select#evidenceType, select[name="evidenceType"]')
-            if evidence_select:
-                await evidence_select.select_option(value='신용카드')
+            # 증빙유형 선택 (건마다 ElementHandle을 남기지 않도록 Locator 사용)
+            evidence_select = self.page.locator('select#evidenceType, select[name="evidenceType"]')
+            if await evidence_select.count():
+                await evidence_select.first.select_option(value='신용카드')
 
-            # 비목/세목 자동 매핑
-            budget = self.find_budget_mapping(
-                record.get('merchant_name', ''),
-                record.get('business_type', '')
-            )
+            # 비목/세목 자동 매핑 (파이프라인 매핑 단계에서 미리 계산)
+            budget = record.budget or self.map_record(record).budget
 
             # 비목 선택
-            budget_item_select = await self.page.query_selector('select#budgetItem, select[name="budgetItem"]')
-            if budget_item_select:
-                # 옵션에서 해당 비목 찾아서 선택
-                await self._select_budget_item(budget['item'])
+            await self._select_budget_item(budget['item'])
 
             # 재원구분 선택
-            funding_select = await self.page.query_selector('select#fundingType, select[name="fundingType"]')
-            if funding_select:
-                await funding_select.select_option(label=budget['funding'])
+            await self._select_funding_type(budget['funding'])
 
             # 저장
+            await self.throttle(ACTION_SAVE)
             await self.page.click('button:has-text("저장"), button.save-btn')
-            await self.page.wait_for_load_state('networkidle')
+            await self.ready('card_save', required=True)
 
             # 성공 확인
-            success_msg = await self.page.query_selector('.success-message, .alert-success')
-            if success_msg:
-                self.logger.log_item(merchant, "SUCCESS", f"집행등록 완료 ({amount})")
+            if await self.page.locator('.success-message, .alert-success').count():
+                self.logger.log_item(merchant, "SUCCESS", f"집행등록 완료 ({amount:,})")
                 return True
             else:
                 self.logger.log_item(merchant, "FAILURE", "저장 실패")
                 return False
 
         except Exception as e:
-            self.logger.log_item(record.get('merchant_name', 'Unknown'), "FAILURE", str(e))
-            await self.browser_manager.screenshot(f"process_error_{record.get('approval_number', 'unknown')}")
+            if is_transient(e):
+                raise  # with_retry에서 재시도
+            self.logger.log_item(merchant, "FAILURE", str(e))
+            await self.browser_manager.screenshot(f"process_error_{record.approval_number or 'unknown'}")
             return False
 
-    async def _select_budget_item(self, budget_item: str):
-        """비목 선택 (옵션 텍스트로 검색)"""
-        try:
-            # 비목 선택 셀렉트 박스에서 해당 비목 찾기
-            options = await self.page.query_selector_all('select#budgetItem option')
-            for option in options:
-                text = await option.inner_text()
-                if budget_item in text:
-                    value = await option.get_attribute('value')
-                    await self.page.select_option('select#budgetItem', value=value)
-                    return
-
-            # 못 찾으면 기타운영비로 선택
-            logger.warning(f"비목 '{budget_item}' 못 찾음, 기타운영비 선택")
-            for option in options:
-                text = await option.inner_text()
-                if '기타' in text:
-                    value = await option.get_attribute('value')
-                    await self.page.select_option('select#budgetItem', value=value)
-                    return
-
-        except Exception as e:
-            logger.error(f"비목 선택 중 오류: {e}")
-
     async def batch_execution_request(self) -> bool:
         """일괄 집행요청"""
         try:
             # 집행관리 > 집행등록 화면으로 이동
-            await self.navigate_to_menu(['집행관리', '집행등록'])
+            await self.open_screen(EXECUTION_MENU)
 
             # 미요청 건 필터
             await self.page.select_option('select#executionStatus', '미요청')
+            await self.throttle(ACTION_SUBMIT)
             await self.page.click('button:has-text("조회")')
-            await self.page.wait_for_load_state('networkidle')
+            await self.ready('execution', required=True)
 
             # 전체 선택
             select_all = await self.page.query_selector('input.select-all, input#selectAll')
@@ -174,6 +164,7 @@ class CardUsageAutomation(BotameAutomation):
                 await select_all.check()
 
             # 집행요청 버튼 클릭
+            await self.throttle(ACTION_SUBMIT)
             await self.page.click('button:has-text("집행요청")')
 
             # 확인 다이얼로그
@@ -181,63 +172,60 @@ class CardUsageAutomation(BotameAutomation):
             if confirm_btn:
                 await confirm_btn.click()
 
-            await self.page.wait_for_load_state('networkidle')
+            await self.ready('execution_request', required=True)
 
             logger.success("일괄 집행요청 완료")
             return True
 
         except Exception as e:
+            if is_transient(e):
+                raise  # with_retry에서 재시도
             logger.error(f"일괄 집행요청 중 오류: {e}")
             return False
 
-    async def run(self) -> Dict[str, Any]:
-        """자동화 실행"""
+    async def run(self, session: Optional[BotameSession] = None) -> Dict[str, Any]:
+        """자동화 실행
+
+        Args:
+            session: 공유 세션 (없으면 브라우저를 직접 시작/종료)
+        """
         self.logger.log_start({
             'fiscal_year': self.fiscal_year,
             'project_code': self.project_code,
-            'max_items': self.max_items
+            'max_items': self.max_items,
+            'max_workers': self.max_workers
         })
 
         results = {
             'status': 'STARTED',
             'processed': 0,
             'success': 0,
-            'failure': 0
+            'failure': 0,
+            'skipped': 0
         }
 
-        try:
-            # 브라우저 시작
-            await self.start()
-
-            # 로그인
-            if not await self.login():
-                results['status'] = 'LOGIN_FAILED'
-                return results
+        # 이전 실행 처리 기록 (저장/요청 완료 건은 건너뜀)
+        self.open_journal()
 
-            # 보조사업 선택
-            if not await self.select_project():
-                results['status'] = 'PROJECT_SELECT_FAILED'
+        try:
+            # 브라우저 시작, 로그인, 보조사업 선택 (공유 세션이면 재사용)
+            failure = await self.prepare(session)
+            if failure:
+                results['status'] = failure
                 return results
 
-            # 미사용 카드내역 조회
-            records = await self.fetch_unused_records()
-            if not records:
+            # 미사용 카드내역을 조회하면서 건별 처리 (max_workers > 1이면 병렬)
+            await self.process_records(self.iter_unused_records(), 'process_record', results)
+            # 이전 실행에서 저장 후 집행요청 전에 중단된 건과 앞 자동화가 넘긴 집행요청 포함
+            pending_request = self.journal_pending_request() or self.deferred_requests()
+            if results['processed'] == 0 and not pending_request:
                 results['status'] = 'NO_RECORDS'
                 logger.info("처리할 카드내역이 없습니다")
                 return results
 
-            # 건별 처리
-            for record in records:
-                success = await self.process_record(record)
-                results['processed'] += 1
-                if success:
-                    results['success'] += 1
-                else:
-                    results['failure'] += 1
-
             # 일괄 집행요청
-            if results['success'] > 0:
-                await self.batch_execution_request()
+            if results['success'] > 0 or pending_request:
+                await self.request_execution(results)
 
             results['status'] = 'COMPLETED'
 
@@ -247,6 +235,10 @@ class CardUsageAutomation(BotameAutomation):
             results['error'] = str(e)
 
         finally:
+            results['retry'] = self.retry.summary()
+            results['rate_limit'] = self.rate_limiter.summary()
+            results['screens'] = self.screens.summary()
+            self.close_journal()
             # 브라우저 종료
             await self.stop()
             # 로그 종료
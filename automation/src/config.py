@@ -1,24 +1,33 @@
-"""설정 관리 모듈"""
+"""설정 관리 모듈
+
+전역 config는 import 시점이 아니라 처음 설정값을 읽을 때 .env와 설정 파일을 읽는다.
+"""
 import os
-import yaml
 from pathlib import Path
 from typing import Any, Dict, Optional
-from dotenv import load_dotenv
 
 
 class Config:
     """설정 관리자"""
 
     def __init__(self, config_path: str = "config/settings.yaml"):
-        # 환경변수 로드
-        load_dotenv()
-
-        # 설정 파일 로드
         self.config_path = Path(config_path)
-        self._config = self._load_config()
+        self._loaded: Optional[Dict[str, Any]] = None
+
+    @property
+    def _config(self) -> Dict[str, Any]:
+        """설정 (처음 접근할 때 환경변수와 설정 파일 로드)"""
+        if self._loaded is None:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+            self._loaded = self._load_config()
+        return self._loaded
 
     def _load_config(self) -> Dict[str, Any]:
         """설정 파일 로드 및 환경변수 치환"""
+        import yaml
+
         if not self.config_path.exists():
             raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {self.config_path}")
 
@@ -88,10 +97,6 @@ class Config:
     def is_headless(self) -> bool:
         return self.get('browser.headless', False)
 
-    @property
-    def slow_mo(self) -> int:
-        return self.get('browser.slow_mo', 100)
-
 
 # 전역 설정 인스턴스
 config = Config()
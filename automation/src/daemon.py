@@ -0,0 +1,376 @@
+"""상주 브라우저 데몬 모듈 (`python main.py serve`)
+
+`python main.py <type>`을 실행할 때마다 드는 import, Playwright 드라이버 기동,
+Chromium 실행, 로그인 비용을 없애기 위해, 로그인된 브라우저 세션을 띄워 둔 채로
+실행 요청을 받아 차례로 처리한다.
+
+- 제어 소켓: Unix 소켓(daemon.socket), Unix 소켓이 없는 OS에서는 127.0.0.1:daemon.port
+- 접근 제한: Unix 소켓은 소유자 전용(0700 디렉토리, 0600 소켓). TCP는 인증이 없으므로
+  요청마다 공유 토큰(daemon.token, 없으면 데몬이 만들어 daemon.token_path에 0600으로
+  저장)을 확인한다. transfer(집행이체)를 실행할 수 있으므로 다른 사용자의 요청을 받지 않는다.
+- 프로토콜: 한 줄에 JSON 하나인 JSON-RPC 2.0
+    요청  {"jsonrpc": "2.0", "id": 1, "method": "run", "params": {"type": "card", ...}, "token": ...}
+    진행  {"jsonrpc": "2.0", "method": "progress", "params": {"level": "INFO", "message": ...}}
+    결과  {"jsonrpc": "2.0", "id": 1, "result": {...}}
+- 메서드: ping, status, run, shutdown (run의 max_runtime: 최대 실행 시간(초))
+  (run의 batch/targets/parallel: 여러 보조사업 일괄 실행)
+
+브라우저가 하나이므로 실행 요청은 큐에 넣어 한 번에 하나씩 처리하고, 실행 중 로그를
+요청한 클라이언트로 진행 이벤트로 보낸다. 클라이언트 연결이 끊어져도 큐에 들어간
+실행은 계속한다.
+
+클라이언트 함수(is_running, call)는 Playwright를 import하지 않는다.
+"""
+import asyncio
+import hmac
+import itertools
+import json
+import os
+import secrets
+import socket
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+from .config import config
+
+
+# JSON-RPC 오류 코드
+PARSE_ERROR = -32700
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+RUN_FAILED = -32000
+UNAUTHORIZED = -32001
+
+# 한 줄(JSON 메시지) 최대 크기
+LINE_LIMIT = 2 ** 20
+
+# 실행 요청 처리 함수: (params, 공유 세션) -> 실행 결과
+Runner = Callable[[Dict[str, Any], Any], Awaitable[Dict[str, Any]]]
+
+
+class DaemonError(Exception):
+    """데몬이 돌려준 JSON-RPC 오류"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def _endpoint() -> Tuple[str, Any]:
+    """('unix', 소켓 경로) 또는 ('tcp', (호스트, 포트))"""
+    if hasattr(socket, 'AF_UNIX') and config.get('daemon.socket'):
+        return 'unix', config.get('daemon.socket')
+    return 'tcp', ('127.0.0.1', config.get('daemon.port', 8765))
+
+
+def _token_path() -> Path:
+    return Path(config.get('daemon.token_path', '.session/daemon.token'))
+
+
+def _load_token() -> Optional[str]:
+    """TCP 제어 토큰 (환경 변수 BOTAME_DAEMON_TOKEN > daemon.token > 토큰 파일, 없으면 None)"""
+    token = os.environ.get('BOTAME_DAEMON_TOKEN') or config.get('daemon.token')
+    if token:
+        return str(token)
+    try:
+        return _token_path().read_text(encoding='utf-8').strip() or None
+    except OSError:
+        return None
+
+
+def _ensure_token() -> str:
+    """TCP 제어 토큰 (설정이 없으면 새로 만들어 소유자 전용 파일에 저장)"""
+    token = os.environ.get('BOTAME_DAEMON_TOKEN') or config.get('daemon.token')
+    if token:
+        return str(token)
+
+    token = secrets.token_urlsafe(32)
+    path = _token_path()
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(token)
+    os.chmod(path, 0o600)
+    return token
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    return json.dumps({'jsonrpc': '2.0', **message}, ensure_ascii=False, default=str).encode('utf-8') + b'\n'
+
+
+def is_running() -> bool:
+    """데몬이 제어 소켓에서 연결을 받고 있는지 (CLI가 데몬으로 보낼지 판단)"""
+    if not config.get('daemon.enabled', True):
+        return False
+    kind, address = _endpoint()
+    if kind == 'unix' and not Path(address).exists():
+        return False
+    try:
+        family = socket.AF_UNIX if kind == 'unix' else socket.AF_INET
+        with socket.socket(family, socket.SOCK_STREAM) as probe:
+            probe.settimeout(0.5)
+            probe.connect(address)
+        return True
+    except OSError:
+        return False
+
+
+async def call(
+    method: str,
+    params: Optional[Dict[str, Any]] = None,
+    on_event: Optional[Callable[[str, Dict[str, Any]], None]] = None
+) -> Any:
+    """데몬 메서드 호출, 결과 반환 (on_event: 진행 이벤트 수신)
+
+    Raises:
+        DaemonError: 데몬이 오류를 돌려줌
+        ConnectionError: 결과를 받기 전에 연결이 끊어짐
+    """
+    kind, address = _endpoint()
+    request = {'id': 1, 'method': method, 'params': params or {}}
+    if kind == 'unix':
+        reader, writer = await asyncio.open_unix_connection(address, limit=LINE_LIMIT)
+    else:
+        reader, writer = await asyncio.open_connection(*address, limit=LINE_LIMIT)
+        request['token'] = _load_token()
+
+    try:
+        writer.write(_encode(request))
+        await writer.drain()
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("결과를 받기 전에 데몬 연결이 끊어짐")
+            message = json.loads(line)
+            if 'id' not in message:
+                if on_event:
+                    on_event(message.get('method', ''), message.get('params', {}))
+                continue
+            if 'error' in message:
+                raise DaemonError(message['error'].get('code', RUN_FAILED), message['error'].get('message', ''))
+            return message.get('result')
+    finally:
+        writer.close()
+
+
+class AutomationDaemon:
+    """로그인된 브라우저 세션을 유지하며 실행 요청을 차례로 처리"""
+
+    def __init__(self, runner: Runner, automation_types: Tuple[str, ...], session: Any = None):
+        """
+        Args:
+            runner: 실행 요청 처리 함수 (main.run_request)
+            automation_types: 받을 수 있는 자동화 타입
+            session: 공유 세션 (없으면 새 BotameSession)
+        """
+        if session is None:
+            from .session import BotameSession
+            session = BotameSession()
+        self.runner = runner
+        self.automation_types = automation_types
+        self.session = session
+        self.queue: 'asyncio.Queue[Dict[str, Any]]' = asyncio.Queue()
+        self.current: Optional[Dict[str, Any]] = None
+        self.completed = 0
+        self.started_at = time.time()
+        self.last_run = time.monotonic()
+        self._job_ids = itertools.count(1)
+        self._stopped = asyncio.Event()
+        self.token: Optional[str] = None  # TCP 제어 토큰 (Unix 소켓은 파일 권한으로 제한)
+
+    async def warm_up(self):
+        """브라우저 시작 및 로그인/보조사업 선택 (실패해도 첫 실행에서 다시 시도)"""
+        from .botame import BotameAutomation
+
+        try:
+            failure = await BotameAutomation('daemon').prepare(self.session)
+            if failure:
+                logger.warning(f"데몬 준비 미완료 ({failure}) - 첫 실행에서 다시 시도")
+            else:
+                logger.success("데몬 준비 완료 (브라우저/로그인 유지)")
+        except Exception as e:
+            logger.warning(f"데몬 준비 중 오류 - 첫 실행에서 다시 시도: {e}")
+
+    async def serve_forever(self):
+        """제어 소켓을 열고 shutdown 요청까지 실행 요청 처리"""
+        kind, address = _endpoint()
+        if kind == 'unix':
+            Path(address).parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if Path(address).exists():
+                Path(address).unlink()  # 이전 데몬이 남긴 소켓 파일
+            # 소켓 파일이 만들어지는 순간부터 소유자 전용
+            umask = os.umask(0o077)
+            try:
+                server = await asyncio.start_unix_server(self.handle_client, address, limit=LINE_LIMIT)
+            finally:
+                os.umask(umask)
+            os.chmod(address, 0o600)
+        else:
+            self.token = _ensure_token()
+            server = await asyncio.start_server(self.handle_client, *address, limit=LINE_LIMIT)
+        logger.info(f"데몬 대기 중: {address}")
+
+        await self.warm_up()
+        worker = asyncio.create_task(self._worker())
+        try:
+            async with server:
+                await self._stopped.wait()
+        finally:
+            worker.cancel()
+            await self.session.close()
+            if kind == 'unix' and Path(address).exists():
+                os.unlink(address)
+            logger.info("데몬 종료")
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """클라이언트 연결 처리 (한 줄에 요청 하나)"""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    method, params = request['method'], request.get('params') or {}
+                except (ValueError, KeyError, TypeError) as e:
+                    await self._send(writer, {'id': None, 'error': {'code': PARSE_ERROR, 'message': str(e)}})
+                    continue
+                if self.token and not hmac.compare_digest(str(request.get('token') or '').encode(), self.token.encode()):
+                    logger.warning("제어 토큰이 없거나 다른 요청 - 연결 종료")
+                    await self._send(writer, {
+                        'id': request.get('id'), 'error': {'code': UNAUTHORIZED, 'message': "제어 토큰 불일치"}
+                    })
+                    break
+                await self._dispatch(writer, request.get('id'), method, params)
+                if self._stopped.is_set():
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, writer: asyncio.StreamWriter, request_id: Any, method: str, params: Dict[str, Any]):
+        if method == 'ping':
+            await self._send(writer, {'id': request_id, 'result': {'pid': os.getpid()}})
+        elif method == 'status':
+            await self._send(writer, {'id': request_id, 'result': self.status()})
+        elif method == 'shutdown':
+            await self._send(writer, {'id': request_id, 'result': {'stopping': True}})
+            self._stopped.set()
+        elif method == 'run':
+            await self._run(writer, request_id, params)
+        else:
+            await self._send(writer, {
+                'id': request_id, 'error': {'code': METHOD_NOT_FOUND, 'message': f"알 수 없는 메서드: {method}"}
+            })
+
+    async def _run(self, writer: asyncio.StreamWriter, request_id: Any, params: Dict[str, Any]):
+        """실행 요청을 큐에 넣고 진행 이벤트와 결과를 보냄"""
+        if params.get('type') not in self.automation_types:
+            await self._send(writer, {
+                'id': request_id,
+                'error': {'code': INVALID_PARAMS, 'message': f"알 수 없는 자동화 타입: {params.get('type')}"}
+            })
+            return
+
+        job = self.enqueue(params)
+        await self._send(writer, {'method': 'queued', 'params': {'job': job['id'], 'position': self.queue.qsize()}})
+
+        connected = True
+        while True:
+            event = await job['events'].get()
+            if event is None:
+                break
+            if connected:
+                connected = await self._send(writer, {'method': 'progress', 'params': event})
+
+        try:
+            message = {'id': request_id, 'result': job['result'].result()}
+        except Exception as e:
+            message = {'id': request_id, 'error': {'code': RUN_FAILED, 'message': str(e)}}
+        if connected:
+            await self._send(writer, message)
+
+    def enqueue(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """실행 요청을 큐에 넣음 (job: id, params, events 큐, result future)"""
+        job = {
+            'id': next(self._job_ids),
+            'params': params,
+            'events': asyncio.Queue(),
+            'result': asyncio.get_running_loop().create_future()
+        }
+        self.queue.put_nowait(job)
+        return job
+
+    async def submit(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """실행 요청을 큐에 넣고 결과 대기 (스케줄러용, 진행 이벤트는 버림)"""
+        job = self.enqueue(params)
+        while await job['events'].get() is not None:
+            pass
+        return job['result'].result()
+
+    async def _worker(self):
+        """큐의 실행 요청을 하나씩 처리 (실행 로그를 진행 이벤트로 전달)"""
+        while True:
+            job = await self.queue.get()
+            self.current = {'job': job['id'], **job['params'], 'started_at': time.time()}
+
+            # 오래 쉬었으면 사이트 세션이 만료됐을 수 있으므로 로그인 상태를 다시 확인
+            # (확인하면서 페이지를 다시 불러오므로 보조사업도 다시 선택)
+            if time.monotonic() - self.last_run > config.get('daemon.session_check_after', 600):
+                self.session.logged_in = False
+                self.session.project = None
+
+            events = job['events']
+            sink = logger.add(
+                lambda message: events.put_nowait({
+                    'level': message.record['level'].name,
+                    'message': message.record['message'],
+                    'time': message.record['time'].isoformat(timespec='seconds')
+                }),
+                level=config.get('daemon.event_level', 'INFO'),
+                filter=lambda record: record['name'] != __name__
+            )
+            try:
+                # max_runtime(초)을 넘기면 실행 취소 (다음 실행 전에 로그인/보조사업 다시 확인)
+                timeout = job['params'].get('max_runtime')
+                try:
+                    result = await asyncio.wait_for(self.runner(job['params'], self.session), timeout)
+                except asyncio.TimeoutError:
+                    self.session.logged_in = False
+                    self.session.project = None
+                    raise TimeoutError(f"최대 실행 시간({timeout}초) 초과로 중단") from None
+                job['result'].set_result(result)
+                self.completed += 1
+            except Exception as e:
+                logger.error(f"데몬 실행 실패 (job {job['id']}): {e}")
+                job['result'].set_exception(e)
+            finally:
+                logger.remove(sink)
+                events.put_nowait(None)
+                self.current = None
+                self.last_run = time.monotonic()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'pid': os.getpid(),
+            'uptime_seconds': round(time.time() - self.started_at),
+            'logged_in': self.session.logged_in,
+            'project': self.session.project,
+            'current': self.current,
+            'queued': self.queue.qsize(),
+            'completed': self.completed
+        }
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, message: Dict[str, Any]) -> bool:
+        """메시지 전송 (클라이언트 연결이 끊어졌으면 False)"""
+        try:
+            writer.write(_encode(message))
+            await writer.drain()
+            return True
+        except (ConnectionError, RuntimeError):
+            return False
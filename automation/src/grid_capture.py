@@ -0,0 +1,197 @@
+"""그리드 데이터 응답 캡처 모듈
+
+eXBuilder 그리드는 데이터 서브미션(JSON/XML) 응답으로 채워진다. 조회 버튼을
+누르는 동안 해당 응답을 가로채 레코드를 만들면 렌더링/스크롤 비용과 셀 단위
+조회 없이 화면 밖 행까지 한 번에 읽을 수 있다. DOM은 클릭 동작에만 쓴다.
+
+응답 형식이나 필드명이 설정과 맞지 않으면 None을 반환하여 호출 측이
+DOM 추출(extract_grid)로 대체하도록 한다.
+"""
+import asyncio
+import json
+import re
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, List, Optional
+from playwright.async_api import Page, Response
+from loguru import logger
+
+from .config import config
+
+
+def _find_rows(node: Any, dataset: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+    """JSON에서 행 목록(딕셔너리 리스트) 탐색 (dataset 지정 시 해당 키 우선)"""
+    if isinstance(node, dict):
+        if dataset and isinstance(node.get(dataset), list):
+            return node[dataset]
+        for value in node.values():
+            found = _find_rows(value, dataset)
+            if found is not None:
+                return found
+    elif isinstance(node, list):
+        if not dataset and node and all(isinstance(item, dict) for item in node):
+            return node
+        for value in node:
+            found = _find_rows(value, dataset)
+            if found is not None:
+                return found
+    return None
+
+
+def _parse_xml_rows(text: str, dataset: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+    """XML 응답에서 행 목록 추출 (<row> 하위 요소의 id 속성 또는 태그명을 필드명으로 사용)"""
+    root = ET.fromstring(text)
+
+    container = root
+    if dataset:
+        container = next(
+            (el for el in root.iter() if el.get('id') == dataset or el.tag == dataset),
+            None
+        )
+        if container is None:
+            return None
+
+    rows = [
+        {(col.get('id') or col.tag): (col.text or '') for col in row}
+        for row in container.iter('row')
+    ]
+    return rows or None
+
+
+def parse_payload(text: str, dataset: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """서브미션 응답 본문에서 행 목록 추출 (형식을 알 수 없으면 None)"""
+    text = text.strip()
+    try:
+        if text.startswith(('{', '[')):
+            return _find_rows(json.loads(text), dataset)
+        if text.startswith('<'):
+            return _parse_xml_rows(text, dataset)
+    except (ValueError, ET.ParseError) as e:
+        logger.debug(f"그리드 응답 파싱 실패: {e}")
+    return None
+
+
+def map_rows(
+    rows: List[Dict[str, Any]],
+    fields: Dict[str, str],
+    flags: Optional[Dict[str, Dict[str, Any]]] = None,
+    key_column: str = '',
+    limit: Optional[int] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """응답 행을 extract_grid와 같은 형태의 레코드로 변환
+
+    Args:
+        rows: 응답 행 목록
+        fields: 레코드 필드명 -> 응답 필드명
+        flags: 상태 필드명 -> {'field': 응답 필드명, 'value': 해당 상태 값}
+               (값이 일치하면 원문, 아니면 None)
+        key_column: 행 키로 사용할 레코드 필드명
+        limit: 최대 행 수
+
+    Returns:
+        레코드 목록 (설정된 응답 필드가 없으면 None)
+    """
+    flags = flags or {}
+    if rows:
+        expected = set(fields.values()) | {spec['field'] for spec in flags.values()}
+        missing = expected - set(rows[0])
+        if missing:
+            logger.warning(f"그리드 응답에 설정된 필드가 없음: {sorted(missing)} - DOM 추출로 대체")
+            return None
+
+    records = []
+    for index, row in enumerate(rows[:limit] if limit else rows):
+        record: Dict[str, Any] = {'row_index': index}
+        for name, source in fields.items():
+            value = row.get(source)
+            record[name] = '' if value is None else str(value)
+        for name, spec in flags.items():
+            value = row.get(spec['field'])
+            record[name] = str(value) if value is not None and str(value) == str(spec['value']) else None
+
+        record['row_key'] = record.get(key_column, '').strip() or '|'.join(
+            str(record[name]) for name in fields
+        )
+        records.append(record)
+    return records
+
+
+class GridCapture:
+    """조회 동작 중 그리드 데이터 서브미션 응답 캡처
+
+    사용 예:
+        async with GridCapture.from_config(page, 'card_usage', 'approval_number') as capture:
+            await page.click('button:has-text("조회")')
+        rows = capture.records(limit=50)
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        screen: str,
+        url_pattern: Optional[str] = None,
+        dataset: Optional[str] = None,
+        fields: Optional[Dict[str, str]] = None,
+        flags: Optional[Dict[str, Dict[str, Any]]] = None,
+        key_column: str = ''
+    ):
+        self.page = page
+        self.screen = screen
+        self.url_pattern = re.compile(url_pattern) if url_pattern else None
+        self.dataset = dataset
+        self.fields = fields or {}
+        self.flags = flags or {}
+        self.key_column = key_column
+        self.payload_rows: Optional[List[Dict[str, Any]]] = None
+        self._tasks: List[asyncio.Future] = []
+
+    @classmethod
+    def from_config(cls, page: Page, screen: str, key_column: str) -> 'GridCapture':
+        """settings.yaml의 grid_capture.screens.<screen>으로 생성 (비활성화 시 캡처하지 않음)"""
+        settings = config.get(f'grid_capture.screens.{screen}', {}) or {}
+        if not config.get('grid_capture.enabled', False) or not settings.get('url_pattern'):
+            return cls(page, screen)
+        return cls(
+            page,
+            screen,
+            url_pattern=settings['url_pattern'],
+            dataset=settings.get('dataset'),
+            fields=settings.get('fields'),
+            flags=settings.get('flags'),
+            key_column=key_column
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.url_pattern is not None and bool(self.fields)
+
+    async def __aenter__(self) -> 'GridCapture':
+        if self.enabled:
+            self.page.on('response', self._on_response)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if not self.enabled:
+            return
+        self.page.remove_listener('response', self._on_response)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _on_response(self, response: Response):
+        if response.ok and self.url_pattern.search(response.url):
+            self._tasks.append(asyncio.ensure_future(self._parse(response)))
+
+    async def _parse(self, response: Response):
+        """응답 본문 파싱 (여러 응답이 일치하면 마지막 응답 사용)"""
+        try:
+            rows = parse_payload(await response.text(), self.dataset)
+            if rows is not None:
+                self.payload_rows = rows
+                logger.debug(f"[{self.screen}] 그리드 응답 캡처: {len(rows)}행 ({response.url})")
+        except Exception as e:
+            logger.debug(f"[{self.screen}] 그리드 응답 읽기 실패: {e}")
+
+    def records(self, limit: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """캡처한 레코드 (캡처 실패 시 None → DOM 추출로 대체)"""
+        if self.payload_rows is None:
+            return None
+        return map_rows(self.payload_rows, self.fields, self.flags, self.key_column, limit)
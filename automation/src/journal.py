@@ -0,0 +1,200 @@
+"""처리 기록(체크포인트) 저널 모듈
+
+레코드별 처리 단계(fetched → mapped → saved → requested)를 로컬 SQLite에
+기록하여, 실행이 중간에 끊겨도 다음 실행에서 이미 저장/요청한 건은 화면 조작
+없이 건너뛰고 남은 집행요청만 이어서 수행한다.
+
+사이트에 반영된 단계(saved, requested)는 바로 기록해, 프로세스가 강제 종료되어도
+다음 실행에서 같은 건을 다시 등록하지 않는다. 사이트에 아무것도 쓰지 않은
+단계(fetched, mapped)는 메모리에 반영한 뒤 batch_size건 또는 flush_interval초마다
+한 번의 트랜잭션으로 묶어 쓰므로 조회/매핑 루프에 디스크 지연이 끼지 않는다
+(유실되어도 다음 실행에서 다시 조회/매핑할 뿐이다).
+"""
+import sqlite3
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from .config import config
+
+
+# 처리 단계 (뒤로 갈수록 진행된 단계)
+STATES = ('fetched', 'mapped', 'saved', 'requested')
+STATE_RANK = {state: rank for rank, state in enumerate(STATES)}
+# 사이트에 반영된 단계 (묶지 않고 바로 기록)
+DURABLE_STATES = ('saved', 'requested')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    automation TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    record_key TEXT NOT NULL,
+    state TEXT NOT NULL,
+    detail TEXT NOT NULL DEFAULT '',
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (automation, scope, record_key)
+)
+"""
+
+# 증분 조회 워터마크 (watermark.py)
+WATERMARK_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    automation TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    value TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (automation, scope)
+)
+"""
+
+
+class RecordJournal:
+    """자동화/보조사업 단위 레코드 처리 기록"""
+
+    def __init__(
+        self,
+        path: str,
+        automation: str,
+        scope: str,
+        batch_size: int = 20,
+        flush_interval: float = 2.0
+    ):
+        self.path = Path(path)
+        self.automation = automation
+        self.scope = scope
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.states: Dict[str, str] = {}
+        self._pending: Dict[str, Tuple[str, str, str]] = {}
+        self._last_flush = time.monotonic()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def from_config(cls, automation: str, fiscal_year: str, project_code: str) -> Optional['RecordJournal']:
+        """settings.yaml의 journal로 생성 (비활성화 시 None)"""
+        if not config.get('journal.enabled', False):
+            return None
+        return cls(
+            config.get('journal.path', 'data/journal.db'),
+            automation,
+            f"{fiscal_year}/{project_code}",
+            batch_size=config.get('journal.batch_size', 20),
+            flush_interval=config.get('journal.flush_interval', 2.0)
+        )
+
+    def open(self) -> 'RecordJournal':
+        """DB 열기 및 기존 기록 로드"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(SCHEMA)
+        self._conn.execute(WATERMARK_SCHEMA)
+
+        rows = self._conn.execute(
+            'SELECT record_key, state FROM records WHERE automation = ? AND scope = ?',
+            (self.automation, self.scope)
+        )
+        self.states = dict(rows)
+        if self.states:
+            logger.info(f"처리 기록 로드 ({self.scope}): {self.summary()}")
+        return self
+
+    def state(self, key: str) -> Optional[str]:
+        return self.states.get(key)
+
+    def is_done(self, key: str, state: str = 'saved') -> bool:
+        """key가 state 단계 이상까지 진행되었는지"""
+        current = self.states.get(key)
+        return current is not None and STATE_RANK[current] >= STATE_RANK[state]
+
+    def keys(self, state: str) -> List[str]:
+        """현재 state 단계인 key 목록"""
+        return [key for key, current in self.states.items() if current == state]
+
+    def mark(self, key: str, state: str, detail: str = ''):
+        """처리 단계 기록 (이전 단계로는 되돌리지 않음, saved/requested는 바로 저장)"""
+        if not self._record(key, state, detail):
+            return
+
+        if (state in DURABLE_STATES
+                or len(self._pending) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def _record(self, key: str, state: str, detail: str = '') -> bool:
+        """메모리/대기 목록에 반영 (이전 단계면 무시하고 False)"""
+        current = self.states.get(key)
+        if current is not None and STATE_RANK[current] > STATE_RANK[state]:
+            return False
+
+        self.states[key] = state
+        self._pending[key] = (state, detail, datetime.now().isoformat(timespec='seconds'))
+        return True
+
+    def advance(self, from_state: str, to_state: str) -> int:
+        """from_state 단계인 모든 key를 to_state로 진행 (예: 일괄 집행요청 후 saved → requested, 한 트랜잭션)"""
+        keys = self.keys(from_state)
+        for key in keys:
+            self._record(key, to_state)
+        self.flush()
+        return len(keys)
+
+    def get_watermark(self) -> Optional[str]:
+        """저장된 워터마크 (없으면 None)"""
+        if self._conn is None:
+            return None
+        row = self._conn.execute(
+            'SELECT value FROM watermarks WHERE automation = ? AND scope = ?',
+            (self.automation, self.scope)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_watermark(self, value: str):
+        """워터마크 저장 (바로 기록)"""
+        if self._conn is None:
+            return
+        with self._conn:
+            self._conn.execute(
+                'INSERT INTO watermarks (automation, scope, value, updated_at) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT (automation, scope) DO UPDATE SET '
+                'value = excluded.value, updated_at = excluded.updated_at',
+                (self.automation, self.scope, value, datetime.now().isoformat(timespec='seconds'))
+            )
+
+    def flush(self):
+        """대기 중인 기록을 한 트랜잭션으로 저장"""
+        self._last_flush = time.monotonic()
+        if not self._pending or self._conn is None:
+            return
+
+        rows = [
+            (self.automation, self.scope, key, state, detail, updated_at)
+            for key, (state, detail, updated_at) in self._pending.items()
+        ]
+        with self._conn:
+            self._conn.executemany(
+                'INSERT INTO records (automation, scope, record_key, state, detail, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (automation, scope, record_key) DO UPDATE SET '
+                'state = excluded.state, detail = excluded.detail, updated_at = excluded.updated_at',
+                rows
+            )
+        self._pending.clear()
+
+    def close(self):
+        """남은 기록 저장 후 닫기"""
+        if self._conn is None:
+            return
+        self.flush()
+        self._conn.close()
+        self._conn = None
+
+    def summary(self) -> str:
+        """단계별 건수 요약"""
+        counts = Counter(self.states.values())
+        return ', '.join(f"{state} {counts[state]}" for state in STATES if counts[state]) or '없음'
@@ -1,12 +1,22 @@
-"""로깅 모듈"""
+"""로깅 모듈
+
+loguru(asyncio 포함)는 import 비용이 커서, 이 모듈의 logger는 처음 쓸 때 loguru를
+import하고 setup_logger()로 콘솔/파일 출력을 설정하는 대리 객체이다. 그래서 import만
+해서는 로그 파일이 만들어지지 않는다.
+"""
 import sys
 from datetime import datetime
 from pathlib import Path
-from loguru import logger
+
+
+_configured = False
 
 
 def setup_logger(log_file: str = "logs/automation.log"):
     """로거 설정"""
+    global _configured
+    from loguru import logger
+
     # 로그 디렉토리 생성
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -34,9 +44,28 @@ def setup_logger(log_file: str = "logs/automation.log"):
         encoding="utf-8"
     )
 
+    _configured = True
     return logger
 
 
+def get_logger():
+    """설정된 loguru logger (처음 호출할 때 setup_logger)"""
+    if not _configured:
+        return setup_logger()
+    from loguru import logger
+    return logger
+
+
+class _LazyLogger:
+    """첫 사용 시 loguru logger를 설정하고 위임하는 대리 객체"""
+
+    def __getattr__(self, name: str):
+        return getattr(get_logger(), name)
+
+
+logger = _LazyLogger()
+
+
 class AutomationLogger:
     """자동화 실행 로거"""
 
@@ -45,6 +74,7 @@ class AutomationLogger:
         self.execution_id = datetime.now().strftime('%Y%m%d%H%M%S')
         self.results = []
         self.errors = []
+        self.timings = {}
 
     def log_start(self, params: dict):
         """자동화 시작 로그"""
@@ -66,6 +96,13 @@ class AutomationLogger:
         else:
             logger.info(log_msg)
 
+    def record_timing(self, name: str, seconds: float):
+        """구간별 소요시간 기록 (횟수/합계/최대)"""
+        stat = self.timings.setdefault(name, {'count': 0, 'total': 0.0, 'max': 0.0})
+        stat['count'] += 1
+        stat['total'] += seconds
+        stat['max'] = max(stat['max'], seconds)
+
     def log_end(self):
         """자동화 종료 로그"""
         summary = {
@@ -75,8 +112,14 @@ class AutomationLogger:
         }
         logger.info(f"[{self.execution_id}] {self.automation_type} 완료")
         logger.info(f"[{self.execution_id}] 결과: 성공 {summary['success']}건, 실패 {summary['failure']}건")
-        return summary
 
+        if self.timings:
+            for name, stat in self.timings.items():
+                logger.info(
+                    f"[{self.execution_id}] 소요시간 {name}: "
+                    f"{stat['count']}회, 합계 {stat['total']:.3f}초, 최대 {stat['max']:.3f}초"
+                )
+            summary['timings'] = self.timings
+
+        return summary
 
-# 로거 초기화
-setup_logger()
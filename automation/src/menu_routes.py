@@ -0,0 +1,105 @@
+"""메뉴 경로 캐시 모듈
+
+메뉴 경로(대메뉴 > 중메뉴 > 화면)별로 화면을 바로 여는 방법을 JSON 파일에
+저장한다. 처음 메뉴를 클릭해 이동할 때 화면 앱(.clx) 요청 URL에서 프로그램 ID를
+찾아 기록해 두고, 다음부터는 단계별 클릭 대신 다음 중 하나로 한 번에 연다.
+
+- menu_routes.open_script가 설정되어 있으면 프로그램 ID로 앱의 화면 열기 호출
+- 아니면 '전체메뉴 검색'에 화면명을 입력하고 검색 결과 클릭
+
+바로 열기에 실패한 경로(메뉴 개편 등)는 캐시에서 지우고 클릭 이동으로 다시
+학습한다.
+
+사이드바 트리에는 프로그램 ID가 없으므로 시작 시 경로표를 미리 만들지 않는다.
+캐시 파일이 없는 첫 실행과 아직 클릭해 보지 않은 메뉴는 클릭 이동으로 연다.
+"""
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from loguru import logger
+
+from .config import config
+
+
+def route_key(menu_path: List[str]) -> str:
+    """메뉴 경로 키 (예: '금융정보관리 > 보조금카드관리 > 보조금전용카드사용내역관리')"""
+    return ' > '.join(menu_path)
+
+
+def program_from_urls(urls: Iterable[str], pattern: str) -> Optional[str]:
+    """요청 URL 경로에서 마지막으로 열린 화면의 프로그램 ID 추출 (없으면 None)"""
+    regex = re.compile(pattern)
+    program = None
+    for url in urls:
+        match = regex.search(urlparse(url).path)
+        if match:
+            program = match.group(1) if regex.groups else match.group(0)
+    return program
+
+
+class MenuRoutes:
+    """메뉴 경로 → 화면 열기 정보 (JSON 파일)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self.routes: Dict[str, Dict[str, Any]] = {}
+        if self.path and self.path.exists():
+            try:
+                self.routes = json.loads(self.path.read_text(encoding='utf-8'))
+            except (OSError, ValueError) as e:
+                logger.warning(f"메뉴 경로 캐시를 읽을 수 없음 - 새로 학습: {e}")
+
+    @classmethod
+    def from_config(cls) -> 'MenuRoutes':
+        """settings.yaml의 menu_routes로 생성 (비활성화 시 메모리 전용, 경로 없음)"""
+        if not config.get('menu_routes.enabled', True):
+            return cls()
+        return cls(config.get('menu_routes.path', 'data/menu_routes.json'))
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def get(self, menu_path: List[str]) -> Optional[Dict[str, Any]]:
+        return self.routes.get(route_key(menu_path))
+
+    def record(self, menu_path: List[str], program: Optional[str]):
+        """클릭 이동으로 확인한 경로 저장"""
+        if not self.enabled:
+            return
+        self.routes[route_key(menu_path)] = {
+            'screen': menu_path[-1],
+            'program': program,
+            'learned_at': datetime.now().isoformat(timespec='seconds')
+        }
+        self.save()
+
+    def invalidate(self, menu_path: List[str]):
+        """바로 열기에 실패한 경로 삭제"""
+        if self.routes.pop(route_key(menu_path), None) is not None:
+            logger.info(f"메뉴 경로 캐시 삭제 (다음 이동에서 다시 학습): {route_key(menu_path)}")
+            self.save()
+
+    def save(self):
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self.routes, ensure_ascii=False, indent=2), encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"메뉴 경로 캐시 저장 실패: {e}")
+
+
+_routes: Optional[MenuRoutes] = None
+
+
+def get_menu_routes() -> MenuRoutes:
+    """프로세스 공용 메뉴 경로 캐시"""
+    global _routes
+    if _routes is None:
+        _routes = MenuRoutes.from_config()
+    return _routes
@@ -0,0 +1,237 @@
+"""화면 이동 계획 모듈
+
+`python main.py all`에서 카드/세금계산서 집행등록, 일괄 집행요청, 집행이체가
+'금융정보관리', '집행관리 > 집행등록', '집행관리 > 집행이체관리'를 오가며 같은
+화면을 여러 번 열지 않도록, 실행할 작업을 화면별로 묶는 순서를 정한다.
+
+- 사이드바 구조(site_analysis/output/menus/all_menus_structure.json)에 작업의
+  메뉴 경로를 더해 메뉴 그래프를 만든다.
+- 자동화 실행 순서를 모두 따져 보고, 같은 화면에서 한 번만 하면 되는 작업(일괄
+  집행요청은 미요청 건 전체를 요청)은 마지막 자동화가 앞 자동화 몫까지 맡게 한다.
+- 메뉴 이동 횟수 → 탭 전환 횟수 → 메뉴 클릭 수가 가장 작은 계획을 고른다. 이미
+  열린 탭은 ScreenManager와 같은 규칙으로 탭 전환으로 센다.
+- 예상 이동 횟수는 실행 후 ScreenManager의 실제 횟수와 함께 보고한다.
+
+이 모듈은 Playwright를 import하지 않는다.
+"""
+import json
+from itertools import permutations
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from .config import config
+from .screens import ScreenManager
+
+
+# 작업 구분
+OP_REGISTER = 'register'  # 목록 조회 후 건별 집행등록
+OP_BATCH_REQUEST = 'batch_request'  # 일괄 집행요청
+OP_TRANSFER = 'transfer'  # 집행이체
+
+# 작업 화면 메뉴 경로
+CARD_MENU = ['금융정보관리', '보조금카드관리', '보조금전용카드사용내역관리']
+EXECUTION_MENU = ['집행관리', '집행등록']
+TRANSFER_MENU = ['집행관리', '집행이체관리']
+
+# 자동화별 작업 (실행 순서대로 (작업, 화면 메뉴 경로, 작업 시작 시 화면을 여는지))
+AUTOMATION_TASKS: Dict[str, List[Tuple[str, List[str], bool]]] = {
+    'card': [(OP_REGISTER, CARD_MENU, True), (OP_BATCH_REQUEST, EXECUTION_MENU, True)],
+    'tax': [(OP_REGISTER, EXECUTION_MENU, True), (OP_BATCH_REQUEST, EXECUTION_MENU, False)],
+    'transfer': [(OP_TRANSFER, TRANSFER_MENU, True)],
+}
+
+# 한 번 수행하면 여러 자동화 몫이 함께 처리되는 작업
+SHARED_OPERATIONS = (OP_BATCH_REQUEST,)
+
+# 작업 -> 먼저 끝나야 하는 작업 (모든 자동화의 해당 작업)
+OPERATION_AFTER: Dict[str, Tuple[str, ...]] = {OP_TRANSFER: (OP_BATCH_REQUEST,)}
+
+
+class MenuGraph:
+    """사이드바 메뉴 트리 (노드: 루트부터의 메뉴 경로)"""
+
+    def __init__(self):
+        self.children: Dict[Tuple[str, ...], List[str]] = {(): []}
+
+    @classmethod
+    def from_structure(cls, path: Optional[str]) -> 'MenuGraph':
+        """메뉴 구조 수집 결과로 생성 (대메뉴와 1단계 트리 항목, 파일이 없으면 빈 그래프)"""
+        graph = cls()
+        if not path:
+            return graph
+        try:
+            structure = json.loads(Path(path).read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.debug(f"메뉴 구조 파일을 읽을 수 없음 - 작업 경로만 사용: {e}")
+            return graph
+
+        for menu, info in structure.items():
+            graph.add_path([menu])
+            for item in info.get('submenus', []):
+                if 'tree-item-level-1' not in item.get('class', ''):
+                    continue
+                text = (item.get('text') or '').split('\n')[0].strip()
+                if text and text != menu:
+                    graph.add_path([menu, text])
+        return graph
+
+    def add_path(self, menu_path: List[str]):
+        for depth in range(len(menu_path)):
+            parent, name = tuple(menu_path[:depth]), menu_path[depth]
+            siblings = self.children.setdefault(parent, [])
+            if name not in siblings:
+                siblings.append(name)
+            self.children.setdefault(tuple(menu_path[:depth + 1]), [])
+
+    def __contains__(self, menu_path: List[str]) -> bool:
+        return tuple(menu_path) in self.children
+
+    def hops(self, current: Optional[List[str]], target: List[str]) -> int:
+        """current 화면에서 target 화면까지 클릭할 메뉴 수 (공통 상위 메뉴 아래 노드)"""
+        node = tuple(target)
+        ancestors = {tuple((current or [])[:depth]) for depth in range(len(current or []) + 1)}
+        hops = 0
+        while node not in ancestors:
+            if node not in self.children:
+                raise KeyError(f"메뉴 그래프에 없는 화면: {' > '.join(target)}")
+            node = node[:-1]
+            hops += 1
+        return hops
+
+
+class NavigationPlan:
+    """자동화 실행 순서와 공유 작업 담당
+
+    steps: 실행 순서의 작업 목록
+        {'automation', 'operation', 'menu_path', 'opens', 'for': [몫이 처리되는 자동화]}
+    """
+
+    def __init__(
+        self,
+        order: List[str],
+        steps: List[Dict[str, Any]],
+        graph: MenuGraph,
+        max_open: int = 4
+    ):
+        self.order = order
+        self.steps = steps
+        self.graph = graph
+        self.max_open = max_open  # 예상에 쓰는 최대 열린 탭 수 (screens.max_open)
+
+    def deferred_operations(self, automation_type: str) -> Set[str]:
+        """automation_type이 다른 자동화에 넘기는 작업"""
+        return {
+            step['operation'] for step in self.steps
+            if automation_type in step['for'] and step['automation'] != automation_type
+        }
+
+    def performs_for(self, automation_type: str) -> List[str]:
+        """automation_type이 함께 처리하는 앞 자동화"""
+        return [
+            other for step in self.steps if step['automation'] == automation_type
+            for other in step['for'] if other != automation_type
+        ]
+
+    def predict(self) -> Dict[str, int]:
+        """예상 메뉴 이동/탭 전환 횟수 (ScreenManager와 같은 규칙)"""
+        screens = ScreenManager(self.max_open)
+        clicks = 0
+        current: Optional[List[str]] = None
+        for step in self.steps:
+            if not step['opens']:
+                continue
+            if screens.is_open(step['menu_path']):
+                screens.activated(step['menu_path'])
+            else:
+                clicks += self.graph.hops(current, step['menu_path'])
+                screens.opened(step['menu_path'])
+            current = step['menu_path']
+        return {'navigations': screens.opened_count, 'switches': screens.reused, 'menu_clicks': clicks}
+
+    def describe(self) -> List[str]:
+        """로그용 계획 요약"""
+        lines = []
+        for step in self.steps:
+            line = f"{step['automation']}: {step['operation']} @ {' > '.join(step['menu_path'])}"
+            if len(step['for']) > 1:
+                line += f" ({', '.join(step['for'])} 함께)"
+            lines.append(line)
+        return lines
+
+    def report(self, screens: ScreenManager) -> Dict[str, Any]:
+        """예상/실제 화면 이동 비교 (실행 결과용)"""
+        actual = screens.summary()
+        return {
+            'order': self.order,
+            'predicted': self.predict(),
+            'actual': {'navigations': actual['opened'], 'switches': actual['reused']}
+        }
+
+
+def _build_steps(order: List[str]) -> Optional[List[Dict[str, Any]]]:
+    """실행 순서로 작업 목록 생성 (공유 작업은 마지막 자동화가 담당, 선후 조건 위반 시 None)"""
+    participants: Dict[str, List[str]] = {}
+    for automation in order:
+        for operation, _, _ in AUTOMATION_TASKS[automation]:
+            if operation in SHARED_OPERATIONS:
+                participants.setdefault(operation, []).append(automation)
+
+    steps = []
+    done: Set[str] = set()
+    for automation in order:
+        for operation, menu_path, opens in AUTOMATION_TASKS[automation]:
+            shared = participants.get(operation, [automation])
+            if shared[-1] != automation:
+                continue  # 뒤 자동화가 함께 수행
+            if any(op in participants and op not in done for op in OPERATION_AFTER.get(operation, ())):
+                return None
+            steps.append({
+                'automation': automation,
+                'operation': operation,
+                'menu_path': menu_path,
+                'opens': opens,
+                'for': shared
+            })
+            done.add(operation)
+    return steps
+
+
+def plan_navigation(
+    automation_types: List[str],
+    graph: Optional[MenuGraph] = None,
+    max_open: int = 4
+) -> NavigationPlan:
+    """화면 이동이 가장 적은 실행 계획 (비용이 같으면 주어진 순서에 가까운 계획)"""
+    graph = graph or MenuGraph()
+    for automation in automation_types:
+        for _, menu_path, _ in AUTOMATION_TASKS[automation]:
+            if menu_path not in graph:
+                logger.debug(f"메뉴 구조에 없는 화면 - 작업 경로로 추가: {' > '.join(menu_path)}")
+                graph.add_path(menu_path)
+
+    best: Optional[NavigationPlan] = None
+    best_cost: Optional[Tuple[int, int, int]] = None
+    for order in permutations(automation_types):
+        steps = _build_steps(list(order))
+        if steps is None:
+            continue
+        plan = NavigationPlan(list(order), steps, graph, max_open)
+        predicted = plan.predict()
+        cost = (predicted['navigations'], predicted['switches'], predicted['menu_clicks'])
+        if best_cost is None or cost < best_cost:
+            best, best_cost = plan, cost
+
+    if best is None:
+        raise ValueError(f"작업 선후 조건을 만족하는 실행 순서가 없음: {automation_types}")
+    return best
+
+
+def plan_from_config(automation_types: List[str]) -> Optional[NavigationPlan]:
+    """settings.yaml의 navigation으로 계획 생성 (비활성화 시 None)"""
+    if not config.get('navigation.enabled', True):
+        return None
+    graph = MenuGraph.from_structure(config.get('navigation.menu_structure'))
+    max_open = config.get('screens.max_open', 4) if config.get('screens.enabled', True) else 0
+    return plan_navigation(automation_types, graph, max_open)
@@ -0,0 +1,291 @@
+"""단계별 비동기 파이프라인 모듈
+
+조회(fetch) → 매핑(map) → 등록(register)처럼 이어지는 단계를 크기가 제한된
+asyncio.Queue로 연결한다. 앞 단계가 뒤 단계보다 빠르면 대기열이 차면서
+자연스럽게 멈추고(backpressure), 단계마다 처리량/처리 시간/대기열 깊이를
+집계하여 어느 단계가 병목인지 실행 결과에서 바로 확인할 수 있다.
+
+단계의 소비자는 비동기 컨텍스트 매니저로 만들어 소비자별 준비/정리(예: 워커
+브라우저 컨텍스트 생성/종료)를 할 수 있다. 준비에 실패하면 처리기 대신 None을
+내보내고, 한 단계의 소비자가 모두 실패하면 남은 항목은 leftover로 모인다.
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+
+
+Handler = Callable[[Any], Awaitable[Optional[Any]]]
+ConsumerFactory = Callable[[], AsyncContextManager[Optional[Handler]]]
+
+# 단계 종료 신호 (소비자는 꺼낸 뒤 다시 넣어 다른 소비자도 종료시킴)
+_DONE = object()
+
+
+class StageStats:
+    """단계별 처리량/대기열 통계"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0
+        self.errors = 0
+        self.busy = 0.0  # 처리 시간 합계 (소비자 합산, 초)
+        self.blocked = 0.0  # 다음 단계 대기열이 가득 차 기다린 시간 (초)
+        self.max_depth = 0
+        self._depth_total = 0
+        self._depth_samples = 0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    def sample_depth(self, depth: int):
+        """입력 대기열 깊이 기록 (항목을 꺼낼 때마다)"""
+        self.max_depth = max(self.max_depth, depth)
+        self._depth_total += depth
+        self._depth_samples += 1
+
+    @property
+    def avg_depth(self) -> float:
+        return self._depth_total / self._depth_samples if self._depth_samples else 0.0
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리 건수"""
+        return self.items / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'items': self.items,
+            'errors': self.errors,
+            'per_second': round(self.throughput, 2),
+            'busy_seconds': round(self.busy, 2),
+            'blocked_seconds': round(self.blocked, 2),
+            'avg_queue_depth': round(self.avg_depth, 1),
+            'max_queue_depth': self.max_depth
+        }
+
+    def summary(self) -> str:
+        return (
+            f"{self.name}: {self.items}건, {self.throughput:.2f}건/s, "
+            f"처리 {self.busy:.1f}s, 출력 대기 {self.blocked:.1f}s, "
+            f"입력 대기열 평균 {self.avg_depth:.1f}/최대 {self.max_depth}"
+        )
+
+
+class Stage:
+    """파이프라인 단계
+
+    handler만 주면 소비자 1개, consumers를 주면 팩토리마다 소비자 1개를 만든다.
+    처리기가 None을 반환하면 다음 단계로 넘기지 않는다.
+
+    batch_size를 주면 대기열에 이미 쌓인 항목을 최대 batch_size개까지 묶어
+    리스트로 처리기에 넘기고(기다리지 않음), 처리기가 반환한 리스트의 항목을
+    다음 단계로 넘긴다. 묶음 단위로 한 번에 처리하는 편이 빠른 단계에 쓴다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Optional[Handler] = None,
+        consumers: Optional[List[ConsumerFactory]] = None,
+        batch_size: Optional[int] = None
+    ):
+        self.name = name
+        self.consumers = consumers or [lambda: _fixed(handler)]
+        self.batch_size = batch_size
+
+
+@asynccontextmanager
+async def _fixed(handler: Handler):
+    yield handler
+
+
+class Pipeline:
+    """크기 제한 대기열로 연결된 단계별 비동기 파이프라인
+
+    사용 예:
+        pipeline = Pipeline('카드', [Stage('map', map_record), Stage('register', register)])
+        await pipeline.run(source())
+    """
+
+    def __init__(
+        self,
+        name: str,
+        stages: List[Stage],
+        queue_size: int = 20,
+        report_interval: float = 0
+    ):
+        self.name = name
+        self.stages = stages
+        self.queues = [asyncio.Queue(maxsize=queue_size) for _ in stages]
+        self.report_interval = report_interval
+        self.stats: Dict[str, StageStats] = {'fetch': StageStats('fetch')}
+        self.stats.update({stage.name: StageStats(stage.name) for stage in stages})
+        self.leftover: List[Any] = []
+        self._alive: Dict[str, int] = {}
+
+    async def drain(self):
+        """지금까지 넣은 항목이 모든 단계를 통과할 때까지 대기 (조회 단계에서 호출)"""
+        for queue in self.queues:
+            await queue.join()
+
+    async def run(self, source: AsyncIterator[Any]):
+        """source의 항목을 모든 단계로 흘려보내고 완료될 때까지 대기"""
+        reporter = asyncio.ensure_future(self._report()) if self.report_interval > 0 else None
+        try:
+            outcomes = await asyncio.gather(
+                self._feed(source),
+                *(self._run_stage(index) for index in range(len(self.stages))),
+                return_exceptions=True
+            )
+        finally:
+            if reporter:
+                reporter.cancel()
+
+        for stats in self.stats.values():
+            logger.info(f"[{self.name}] 파이프라인 {stats.summary()}")
+
+        errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+        if errors:
+            raise errors[0]
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """단계별 통계"""
+        return {name: stats.as_dict() for name, stats in self.stats.items()}
+
+    async def _put(self, stats: StageStats, queue: asyncio.Queue, item: Any):
+        started = time.monotonic()
+        await queue.put(item)
+        stats.blocked += time.monotonic() - started
+
+    async def _feed(self, source: AsyncIterator[Any]):
+        """조회 단계: source에서 꺼내 첫 대기열에 넣기"""
+        stats = self.stats['fetch']
+        stats.started = time.monotonic()
+        try:
+            iterator = source.__aiter__()
+            while True:
+                started = time.monotonic()
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+                stats.busy += time.monotonic() - started
+                stats.items += 1
+                await self._put(stats, self.queues[0], item)
+        finally:
+            stats.finished = time.monotonic()
+            await self.queues[0].put(_DONE)
+
+    async def _run_stage(self, index: int):
+        stage = self.stages[index]
+        inbox = self.queues[index]
+        outbox = self.queues[index + 1] if index + 1 < len(self.queues) else None
+        stats = self.stats[stage.name]
+        self._alive[stage.name] = len(stage.consumers)
+
+        try:
+            await asyncio.gather(*(
+                self._consume(stage, factory, inbox, outbox) for factory in stage.consumers
+            ))
+        finally:
+            stats.finished = time.monotonic()
+            if outbox is not None:
+                await outbox.put(_DONE)
+
+    async def _consume(
+        self,
+        stage: Stage,
+        factory: ConsumerFactory,
+        inbox: asyncio.Queue,
+        outbox: Optional[asyncio.Queue]
+    ):
+        """소비자: 종료 신호를 받을 때까지 항목 처리"""
+        stats = self.stats[stage.name]
+        try:
+            async with factory() as handler:
+                if handler is None:
+                    await self._give_up(stage, inbox)
+                    return
+
+                while True:
+                    depth = inbox.qsize()
+                    items, done = await self._take(stage, inbox)
+                    if items:
+                        stats.sample_depth(depth)
+                        if stats.started is None:
+                            stats.started = time.monotonic()
+
+                        started = time.monotonic()
+                        try:
+                            if stage.batch_size:
+                                results = await handler(items) or []
+                            else:
+                                results = [await handler(items[0])]
+                        except Exception as e:
+                            logger.error(f"[{self.name}] {stage.name} 단계 처리 중 오류: {e}")
+                            stats.errors += len(items)
+                            results = []
+                        stats.busy += time.monotonic() - started
+                        stats.items += len(items)
+
+                        for result in results:
+                            if result is not None and outbox is not None:
+                                await self._put(stats, outbox, result)
+                        for _ in items:
+                            inbox.task_done()
+
+                    if done:
+                        await inbox.put(_DONE)
+                        return
+
+        except Exception as e:
+            logger.error(f"[{self.name}] {stage.name} 단계 소비자 오류: {e}")
+            await self._give_up(stage, inbox)
+
+    async def _take(self, stage: Stage, inbox: asyncio.Queue):
+        """다음 항목(묶음 단계는 이미 쌓인 항목까지) 꺼내기, 종료 신호 여부 함께 반환"""
+        item = await inbox.get()
+        if item is _DONE:
+            inbox.task_done()
+            return [], True
+
+        items = [item]
+        while stage.batch_size and len(items) < stage.batch_size and not inbox.empty():
+            item = inbox.get_nowait()
+            if item is _DONE:
+                inbox.task_done()
+                return items, True
+            items.append(item)
+        return items, False
+
+    async def _give_up(self, stage: Stage, inbox: asyncio.Queue):
+        """소비자 이탈 (마지막 소비자였다면 남은 항목을 leftover로 모음)"""
+        self._alive[stage.name] -= 1
+        if self._alive[stage.name] > 0:
+            return
+
+        while True:
+            item = await inbox.get()
+            inbox.task_done()
+            if item is _DONE:
+                await inbox.put(_DONE)
+                return
+            self.leftover.append(item)
+
+    async def _report(self):
+        """주기적으로 단계별 진행 상황/대기열 깊이 로그"""
+        while True:
+            await asyncio.sleep(self.report_interval)
+            progress = [f"fetch {self.stats['fetch'].items}건"] + [
+                f"{stage.name} {self.stats[stage.name].items}건 (대기 {queue.qsize()})"
+                for stage, queue in zip(self.stages, self.queues)
+            ]
+            logger.info(f"[{self.name}] 진행: {' | '.join(progress)}")
@@ -0,0 +1,201 @@
+"""집행등록 사전 계획(dry-run) 모듈
+
+보탬e에서 내보낸 카드사용내역/세금계산서 파일(xlsx/csv)을 pandas로 읽어
+실제 실행과 같은 비목/재원 매핑과 금액 검증을 브라우저 없이 적용하고,
+건별 처리 계획을 CSV로 저장한다. 저장한 계획 파일은 `--plan`으로 실제
+실행의 작업 목록(처리 대상과 비목/재원)으로 그대로 쓸 수 있다.
+
+이 모듈은 Playwright를 import하지 않는다.
+"""
+import csv
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+from loguru import logger
+
+from .budget_mapping import get_budget_matcher
+from .config import config
+from .reconciliation import normalize_amounts, reconcile
+
+
+# 계획 대상 자동화별 설정
+#   key: 행 키 필드 (실제 실행의 row_key와 같은 값)
+#   vendor/business_type: 매핑에 쓰는 필드
+#   columns: 레코드 필드 -> 내보내기 파일에서 인식할 열 이름 (필드명 그대로인 열도 인식)
+PLAN_TYPES: Dict[str, Dict[str, Any]] = {
+    'card': {
+        'key': 'approval_number',
+        'vendor': 'merchant_name',
+        'business_type': 'business_type',
+        'amounts': ['amount'],
+        'columns': {
+            'transaction_date': ['거래일자', '사용일자', '승인일자'],
+            'approval_number': ['승인번호'],
+            'amount': ['금액', '사용금액', '승인금액'],
+            'merchant_name': ['가맹점명', '가맹점'],
+            'business_type': ['업종', '업종명'],
+            'used_status': ['사용여부', '집행여부'],
+        }
+    },
+    'tax': {
+        'key': 'invoice_number',
+        'vendor': 'vendor_name',
+        'business_type': None,  # 세금계산서에는 업종 정보가 없을 수 있음
+        'amounts': ['supply_amount', 'vat_amount', 'total_amount'],
+        'columns': {
+            'issue_date': ['작성일자', '발행일자'],
+            'invoice_number': ['승인번호'],
+            'vendor_name': ['공급자상호', '상호', '거래처명'],
+            'business_number': ['공급자사업자등록번호', '사업자등록번호'],
+            'supply_amount': ['공급가액'],
+            'vat_amount': ['세액', '부가세'],
+            'total_amount': ['합계금액', '총금액'],
+            'registered': ['등록여부', '집행등록여부'],
+        }
+    }
+}
+
+# 계획 파일의 처리 구분
+ACTION_REGISTER = 'register'  # 집행등록 대상
+ACTION_SKIP = 'skip'  # 이미 사용/등록된 건
+ACTION_REVIEW = 'review'  # 행 키가 없어 실제 실행에서 찾을 수 없음
+
+
+def read_export(path: str) -> pd.DataFrame:
+    """내보내기 파일 읽기 (xlsx/xls/csv, 모든 열을 문자열로)"""
+    suffix = Path(path).suffix.lower()
+    if suffix in ('.xlsx', '.xls'):
+        return pd.read_excel(path, dtype=str)
+    if suffix == '.csv':
+        try:
+            return pd.read_csv(path, dtype=str, encoding='utf-8-sig')
+        except UnicodeDecodeError:
+            return pd.read_csv(path, dtype=str, encoding='cp949')  # 엑셀에서 저장한 CSV
+    raise ValueError(f"지원하지 않는 파일 형식: {path} (xlsx/xls/csv)")
+
+
+def normalize_columns(frame: pd.DataFrame, plan_type: str) -> pd.DataFrame:
+    """내보내기 열 이름을 레코드 필드명으로 변환 (없는 필드는 빈 문자열)"""
+    columns = config.get(f'planner.columns.{plan_type}') or PLAN_TYPES[plan_type]['columns']
+    headers = {str(header).strip(): header for header in frame.columns}
+
+    records = pd.DataFrame(index=frame.index)
+    for field, aliases in columns.items():
+        source = next((headers[name] for name in [field, *aliases] if name in headers), None)
+        records[field] = frame[source].fillna('').str.strip() if source is not None else ''
+        if source is None:
+            logger.debug(f"내보내기 파일에 '{field}' 열 없음 ({', '.join(aliases)})")
+    return records
+
+
+def build_plan(plan_type: str, input_path: str) -> pd.DataFrame:
+    """내보내기 파일로 건별 처리 계획 생성
+
+    Returns:
+        row_key, action, note, 레코드 필드, budget_item, funding_type
+        (세금계산서는 금액 검증 열 포함) 열을 가진 DataFrame
+    """
+    spec = PLAN_TYPES[plan_type]
+    records = normalize_columns(read_export(input_path), plan_type)
+    if records[spec['key']].eq('').all():
+        raise ValueError(f"내보내기 파일에서 행 키({spec['key']}) 열을 찾을 수 없음: {input_path}")
+
+    plan = records.copy()
+    plan.insert(0, 'row_key', records[spec['key']])
+
+    # 비목/재원 매핑: 거래처/업종 조합별로 한 번만 계산해서 전체 행에 반영
+    vendor = records[spec['vendor']]
+    business_type = records[spec['business_type']] if spec['business_type'] else pd.Series('', index=records.index)
+    pairs = pd.DataFrame({'vendor': vendor, 'business_type': business_type})
+    unique = pairs.drop_duplicates()
+    matcher = get_budget_matcher()
+    mapped = [matcher.match(v, b) for v, b in unique.itertuples(index=False)]
+    unique = unique.assign(
+        budget_item=[m['item'] for m in mapped],
+        funding_type=[m['funding'] for m in mapped]
+    )
+    budget = pairs.merge(unique, on=['vendor', 'business_type'], how='left')
+    plan['budget_item'] = budget['budget_item'].to_numpy()
+    plan['funding_type'] = budget['funding_type'].to_numpy()
+
+    amounts = normalize_amounts(records, spec['amounts'])
+    for field in spec['amounts']:
+        plan[f'{field}_value'] = amounts[field]
+
+    # 처리 구분 (실제 실행의 조회 단계와 같은 기준)
+    plan['action'] = ACTION_REGISTER
+    plan['note'] = ''
+    if plan_type == 'card':
+        used = records['used_status'].str.contains('Y|사용', regex=True)
+        plan.loc[used, ['action', 'note']] = [ACTION_SKIP, '이미 사용']
+    else:
+        registered = records['registered'].isin(['Y', '등록'])
+        plan.loc[registered, ['action', 'note']] = [ACTION_SKIP, '이미 등록']
+
+        # 공급가액 + 세액 = 합계금액, 세율 검증 (실제 실행과 같은 대사 규칙)
+        checked = reconcile(
+            amounts,
+            tolerance=config.get('reconciliation.tolerance', 1),
+            vat_rate=config.get('reconciliation.vat_rate', 0.1)
+        )
+        plan = plan.join(checked)
+        plan['amount_mismatch'] = checked['total_status'].eq('mismatch')
+        if config.get('reconciliation.skip_mismatch', False):
+            plan.loc[plan['amount_mismatch'] & plan['action'].eq(ACTION_REGISTER), 'action'] = ACTION_SKIP
+        plan.loc[plan['amount_mismatch'] & plan['note'].eq(''), 'note'] = '금액 불일치'
+        plan.loc[checked['total_status'].eq('rounding') & plan['note'].eq(''), 'note'] = '끝전 차이'
+
+    missing_key = plan['row_key'].eq('')
+    plan.loc[missing_key, ['action', 'note']] = [ACTION_REVIEW, f"{spec['key']} 없음"]
+
+    duplicated = plan['row_key'].duplicated(keep='first') & ~missing_key
+    plan.loc[duplicated, ['action', 'note']] = [ACTION_SKIP, '중복']
+
+    leading = ['row_key', 'action', 'note']
+    return plan[leading + [column for column in plan.columns if column not in leading]]
+
+
+def write_plan(plan: pd.DataFrame, plan_type: str, output_path: Optional[str] = None) -> Path:
+    """계획 CSV 저장 (엑셀에서 바로 열리도록 UTF-8 BOM)"""
+    if output_path:
+        path = Path(output_path)
+    else:
+        output_dir = Path(config.get('planner.output_dir', 'logs/plans'))
+        path = output_dir / f"plan_{plan_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    plan.to_csv(path, index=False, encoding='utf-8-sig')
+    return path
+
+
+def summarize_plan(plan: pd.DataFrame) -> List[str]:
+    """계획 요약 (처리 구분별 건수, 비목별 건수)"""
+    lines = [f"전체 {len(plan)}건"]
+    lines += [f"  {action}: {count}건" for action, count in plan['action'].value_counts().items()]
+
+    register = plan[plan['action'] == ACTION_REGISTER]
+    if len(register):
+        lines.append("비목/재원별 등록 예정:")
+        counts = register.groupby(['budget_item', 'funding_type']).size().sort_values(ascending=False)
+        lines += [f"  {item} / {funding}: {count}건" for (item, funding), count in counts.items()]
+    if 'amount_mismatch' in plan:
+        lines.append(f"금액 불일치: {int(plan['amount_mismatch'].sum())}건")
+    return lines
+
+
+def load_plan(path: str) -> Dict[str, Dict[str, Any]]:
+    """실제 실행용 작업 목록 로드 (행 키 -> 비목/재원, 등록 대상만)
+
+    계획 파일에서 budget_item/funding_type을 직접 고친 경우 고친 값으로 등록한다.
+    """
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        rows = list(csv.DictReader(f))
+
+    plan = {
+        row['row_key']: {'budget': {'item': row['budget_item'], 'funding': row['funding_type']}}
+        for row in rows if row.get('action') == ACTION_REGISTER and row.get('row_key')
+    }
+    logger.info(f"처리 계획 로드: {path} (등록 대상 {len(plan)}건 / 전체 {len(rows)}건)")
+    return plan
@@ -0,0 +1,175 @@
+"""동작 분류별 속도 제한 모듈 (토큰 버킷)
+
+모든 동작에 고정 지연을 넣던 browser.slow_mo 대신, 서버에 부담을 주는 동작
+(메뉴/화면 이동, 저장, 조회·요청 제출)만 분류별 토큰 버킷으로 간격을 조절한다.
+한 프로세스의 모든 자동화와 워커가 같은 제한기를 쓰므로 워커 수를 늘려도
+사이트에 보내는 동작 속도는 설정값을 넘지 않는다.
+
+속도는 AIMD로 조절한다. 화면 준비가 slow_threshold보다 오래 걸리거나 일시적
+오류가 나면 속도를 decrease_factor배로 줄이고, 응답이 빠르면 increase_step씩
+max_rate까지 늘린다.
+"""
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+
+from .config import config
+
+
+# 동작 분류
+ACTION_NAVIGATE = 'navigate'  # 메뉴/화면 이동
+ACTION_SAVE = 'save'  # 집행등록 저장
+ACTION_SUBMIT = 'submit'  # 조회/집행요청 등 서버 제출
+
+DEFAULT_ACTIONS: Dict[str, Dict[str, float]] = {
+    ACTION_NAVIGATE: {'rate': 1.0, 'burst': 2, 'min_rate': 0.2, 'max_rate': 3.0},
+    ACTION_SAVE: {'rate': 0.5, 'burst': 1, 'min_rate': 0.1, 'max_rate': 2.0},
+    ACTION_SUBMIT: {'rate': 1.0, 'burst': 2, 'min_rate': 0.2, 'max_rate': 3.0},
+}
+
+
+class TokenBucket:
+    """초당 rate개 토큰이 burst개까지 쌓이는 버킷
+
+    acquire()는 토큰을 먼저 예약(음수 허용)하고 부족한 만큼만 기다리므로
+    잠금 없이도 여러 코루틴이 도착 순서대로 간격을 두고 통과한다.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.min_rate = min_rate or rate
+        self.max_rate = max_rate or rate
+        self.clock = clock
+        self.tokens = self.burst
+        self.updated = clock()
+
+        self.acquired = 0
+        self.waited = 0.0
+        self.slowdowns = 0
+        self.lowest_rate = rate
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """토큰 1개 예약 후 기다려야 할 시간 (초)"""
+        self._refill()
+        self.tokens -= 1
+        self.acquired += 1
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    async def acquire(self) -> float:
+        """토큰을 얻을 때까지 대기, 대기한 시간 반환"""
+        wait = self.reserve()
+        if wait > 0:
+            self.waited += wait
+            await asyncio.sleep(wait)
+        return wait
+
+    def slow_down(self, factor: float):
+        """속도 감소 (곱셈)"""
+        self._refill()
+        self.rate = max(self.min_rate, self.rate * factor)
+        self.slowdowns += 1
+        self.lowest_rate = min(self.lowest_rate, self.rate)
+
+    def speed_up(self, step: float):
+        """속도 증가 (덧셈)"""
+        self._refill()
+        self.rate = min(self.max_rate, self.rate + step)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'acquired': self.acquired,
+            'waited_seconds': round(self.waited, 2),
+            'rate': round(self.rate, 2),
+            'lowest_rate': round(self.lowest_rate, 2),
+            'slowdowns': self.slowdowns
+        }
+
+
+class ActionRateLimiter:
+    """동작 분류별 토큰 버킷 묶음 (분류가 없는 동작은 제한하지 않음)"""
+
+    def __init__(
+        self,
+        buckets: Dict[str, TokenBucket],
+        slow_threshold: float = 3.0,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.1
+    ):
+        self.buckets = buckets
+        self.slow_threshold = slow_threshold
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+
+    @classmethod
+    def from_config(cls) -> 'ActionRateLimiter':
+        """settings.yaml의 rate_limit으로 생성 (비활성화 시 제한 없음)"""
+        if not config.get('rate_limit.enabled', True):
+            return cls({})
+
+        actions = config.get('rate_limit.actions') or DEFAULT_ACTIONS
+        buckets = {
+            action: TokenBucket(
+                spec['rate'],
+                burst=spec.get('burst', 1),
+                min_rate=spec.get('min_rate'),
+                max_rate=spec.get('max_rate')
+            )
+            for action, spec in actions.items()
+        }
+        return cls(
+            buckets,
+            slow_threshold=config.get('rate_limit.slow_threshold', 3.0),
+            decrease_factor=config.get('rate_limit.decrease_factor', 0.5),
+            increase_step=config.get('rate_limit.increase_step', 0.1)
+        )
+
+    async def acquire(self, action: str) -> float:
+        """action 동작 전에 호출, 대기한 시간 반환"""
+        bucket = self.buckets.get(action)
+        return await bucket.acquire() if bucket else 0.0
+
+    def observe(self, action: str, seconds: float, ok: bool = True):
+        """동작 후 화면 준비 시간으로 속도 조절 (느리거나 실패하면 감소, 빠르면 증가)"""
+        bucket = self.buckets.get(action)
+        if bucket is None:
+            return
+        if not ok or seconds > self.slow_threshold:
+            bucket.slow_down(self.decrease_factor)
+            logger.debug(f"응답 지연({seconds:.1f}초) - {action} 속도 {bucket.rate:.2f}회/초로 감소")
+        else:
+            bucket.speed_up(self.increase_step)
+
+    def on_error(self):
+        """일시적 오류(시간 초과 등) - 모든 분류의 속도 감소 (사이트 전체 부하로 간주)"""
+        for bucket in self.buckets.values():
+            bucket.slow_down(self.decrease_factor)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """분류별 통계"""
+        return {action: bucket.as_dict() for action, bucket in self.buckets.items()}
+
+
+_limiter: Optional[ActionRateLimiter] = None
+
+
+def get_rate_limiter() -> ActionRateLimiter:
+    """프로세스 공용 속도 제한기 (모든 자동화/워커가 공유)"""
+    global _limiter
+    if _limiter is None:
+        _limiter = ActionRateLimiter.from_config()
+    return _limiter
@@ -0,0 +1,151 @@
+"""화면 준비 상태 감지 모듈
+
+networkidle은 eXBuilder 화면의 백그라운드 폴링(세션 타이머 등) 때문에
+필요 이상으로 오래 기다리는 경우가 많다. 대신 다음 신호가 모두 일정 시간
+(settle_ms) 유지되면 준비 완료로 본다.
+
+- 로딩 오버레이("잠시만 기다려 주세요")가 보이지 않음
+- 데이터 서브미션 요청(request_patterns)이 모두 완료됨 (ignore_patterns 제외)
+- 그리드 셀렉터가 주어지면 행 수가 더 이상 변하지 않음
+"""
+import asyncio
+import re
+import time
+from typing import Optional, Set
+from playwright.async_api import Page, Request
+from loguru import logger
+
+from .config import config
+
+
+# 오버레이 표시 여부와 그리드 행 수를 한 번에 조회
+READY_STATE_SCRIPT = """
+({overlaySelectors, overlayTexts, grid}) => {
+    const visible = el => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 1 && rect.height > 1 && getComputedStyle(el).visibility !== 'hidden';
+    };
+
+    let overlay = overlaySelectors.some(
+        sel => Array.from(document.querySelectorAll(sel)).some(visible)
+    );
+    for (const text of overlayTexts) {
+        if (overlay) break;
+        const found = document.evaluate(
+            `//*[normalize-space(text())="${text}"]`, document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        for (let i = 0; i < found.snapshotLength && !overlay; i++) {
+            overlay = visible(found.snapshotItem(i));
+        }
+    }
+
+    return {overlay, rows: grid ? document.querySelectorAll(grid).length : -1};
+}
+"""
+
+
+class PageReadiness:
+    """페이지별 준비 상태 감지기 (요청 추적은 페이지 생성 시점부터 시작)"""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.timeout = config.get('readiness.timeout', 30000) / 1000
+        self.poll_interval = config.get('readiness.poll_interval', 50) / 1000
+        self.settle = config.get('readiness.settle_ms', 150) / 1000
+        self.overlay_selectors = config.get('readiness.overlay_selectors', [])
+        self.overlay_texts = config.get('readiness.overlay_texts', ['잠시만 기다려 주세요'])
+        self.request_patterns = [re.compile(p) for p in config.get('readiness.request_patterns', [])]
+        self.ignore_patterns = [re.compile(p) for p in config.get('readiness.ignore_patterns', [])]
+        self.compare_networkidle = config.get('readiness.compare_networkidle', False)
+
+        self._pending: Set[Request] = set()
+        page.on('request', self._on_request)
+        page.on('requestfinished', self._on_request_done)
+        page.on('requestfailed', self._on_request_done)
+
+    def _is_tracked(self, request: Request) -> bool:
+        """추적 대상 요청 여부 (문서/XHR/fetch 중 패턴 일치, 폴링 제외)"""
+        if request.resource_type not in ('document', 'xhr', 'fetch'):
+            return False
+        url = request.url
+        if any(p.search(url) for p in self.ignore_patterns):
+            return False
+        return not self.request_patterns or any(p.search(url) for p in self.request_patterns)
+
+    def _on_request(self, request: Request):
+        if self._is_tracked(request):
+            self._pending.add(request)
+
+    def _on_request_done(self, request: Request):
+        self._pending.discard(request)
+
+    async def wait(
+        self,
+        screen: str,
+        automation_logger=None,
+        grid: Optional[str] = None,
+        replaces_ms: int = 0
+    ) -> bool:
+        """화면 준비 대기
+
+        Args:
+            screen: 화면 이름 (지표 구분용)
+            automation_logger: 소요시간을 기록할 AutomationLogger
+            grid: 행 수 안정화를 확인할 그리드 행 셀렉터
+            replaces_ms: 대체한 고정 대기시간 (절감 시간 계산용)
+
+        Returns:
+            준비 완료 여부 (시간 초과 시 False, 예외로 처리하려면 BotameAutomation.ready(required=True))
+        """
+        started = time.perf_counter()
+        deadline = started + self.timeout
+        stable_since = None
+        last_rows = None
+        ready = False
+
+        while True:
+            state = await self.page.evaluate(READY_STATE_SCRIPT, {
+                'overlaySelectors': self.overlay_selectors,
+                'overlayTexts': self.overlay_texts,
+                'grid': grid
+            })
+            busy = state['overlay'] or bool(self._pending) or state['rows'] != last_rows
+            last_rows = state['rows']
+
+            now = time.perf_counter()
+            if busy:
+                stable_since = None
+            elif stable_since is None:
+                stable_since = now
+            elif now - stable_since >= self.settle:
+                ready = True
+                break
+
+            if now >= deadline:
+                break
+            await asyncio.sleep(self.poll_interval)
+
+        elapsed = time.perf_counter() - started
+        if not ready:
+            logger.warning(f"[{screen}] 화면 준비 대기 시간 초과 ({elapsed:.1f}초, 진행중 요청 {len(self._pending)}건)")
+
+        saved = None
+        if replaces_ms:
+            saved = replaces_ms / 1000 - elapsed
+        elif self.compare_networkidle:
+            # 비교 모드: 기존 networkidle 대기가 추가로 걸렸을 시간 측정
+            idle_started = time.perf_counter()
+            try:
+                await self.page.wait_for_load_state('networkidle', timeout=self.timeout * 1000)
+            except Exception:
+                pass
+            saved = time.perf_counter() - idle_started
+
+        if automation_logger:
+            automation_logger.record_timing(f'ready.{screen}', elapsed)
+            if saved is not None:
+                automation_logger.record_timing('ready.saved', saved)
+
+        logger.debug(f"[{screen}] 화면 준비 {elapsed * 1000:.0f}ms")
+        return ready
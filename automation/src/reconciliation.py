@@ -0,0 +1,214 @@
+"""금액 정규화 및 대사(reconciliation) 모듈
+
+조회한 레코드 묶음의 금액 열을 pandas 문자열 연산으로 한 번에 정수로 바꾸고,
+세금계산서는 공급가액 + 세액 = 합계금액과 세액 = 공급가액 x 세율을 같은 패스에서
+검사한다. 원 단위 절사 등으로 tolerance 이내에서 어긋나는 건은 끝전 차이
+(rounding)로 따로 표시한다. 검사 결과는 대사 보고서 CSV로 남긴다. 보고서를
+시작(start_report)한 뒤에는 묶음마다 파일에 이어 쓰고 메모리에는 상태별 건수만
+남기므로 조회 건수가 많아도 메모리 사용량이 늘지 않는다.
+
+상태 값:
+    total_status: ok / rounding / mismatch / no_total(합계금액 없음)
+    vat_status: ok / rounding / off_rate / zero(영세율·면세 등 세액 0)
+"""
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from .amounts import AMOUNT_NOISE, INTEGER_PATTERN
+from .config import config
+
+
+# 세금계산서 대사에 필요한 금액 열
+VAT_COLUMNS = ('supply_amount', 'vat_amount', 'total_amount')
+
+
+def parse_amounts(values: pd.Series) -> pd.Series:
+    """금액 열을 정수로 변환 (amounts.parse_amount와 같은 규칙, 변환할 수 없으면 0)"""
+    if pd.api.types.is_integer_dtype(values):
+        return values.astype('int64')  # 레코드 모델에서 이미 변환한 금액
+    cleaned = values.fillna('').astype(str).str.replace(AMOUNT_NOISE.pattern, '', regex=True).str.strip()
+    valid = cleaned.str.fullmatch(INTEGER_PATTERN.pattern)
+    return cleaned.where(valid, '0').astype('int64')
+
+
+def normalize_amounts(frame: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """지정한 금액 열을 모두 int64로 변환한 DataFrame (없는 열은 0)"""
+    return pd.DataFrame({
+        column: parse_amounts(frame[column]) if column in frame else pd.Series(0, index=frame.index, dtype='int64')
+        for column in columns
+    }, index=frame.index)
+
+
+def reconcile(amounts: pd.DataFrame, tolerance: int = 1, vat_rate: float = 0.1) -> pd.DataFrame:
+    """공급가액 + 세액 = 합계금액, 세액 = 공급가액 x 세율 검사
+
+    Args:
+        amounts: supply_amount, vat_amount, total_amount 정수 열
+        tolerance: 끝전 차이로 볼 최대 금액 (원)
+        vat_rate: 부가가치세율
+
+    Returns:
+        total_difference, total_status, expected_vat, vat_status 열
+    """
+    supply = amounts['supply_amount']
+    vat = amounts['vat_amount']
+    total = amounts['total_amount']
+
+    difference = total - (supply + vat)
+    total_status = np.select(
+        [total.eq(0), difference.eq(0), difference.abs().le(tolerance)],
+        ['no_total', 'ok', 'rounding'],
+        default='mismatch'
+    )
+
+    # 세액은 원 미만 절사 (부동소수점 오차 없이 정수 연산)
+    expected_vat = (supply * round(vat_rate * 1000)) // 1000
+    vat_difference = vat - expected_vat
+    vat_status = np.select(
+        [vat.eq(0), vat_difference.eq(0), vat_difference.abs().le(tolerance)],
+        ['zero', 'ok', 'rounding'],
+        default='off_rate'
+    )
+
+    return pd.DataFrame({
+        'total_difference': difference,
+        'total_status': total_status,
+        'expected_vat': expected_vat,
+        'vat_status': vat_status
+    }, index=amounts.index)
+
+
+class AmountReconciler:
+    """레코드 묶음 단위 금액 정규화/대사 및 보고서 누적"""
+
+    def __init__(
+        self,
+        amount_columns: List[str],
+        tolerance: int = 1,
+        vat_rate: float = 0.1,
+        skip_mismatch: bool = False
+    ):
+        self.amount_columns = list(amount_columns)
+        self.check_vat = all(column in self.amount_columns for column in VAT_COLUMNS)
+        self.tolerance = tolerance
+        self.vat_rate = vat_rate
+        self.skip_mismatch = skip_mismatch
+        self.frames: List[pd.DataFrame] = []
+        self.checked = 0
+        self.counts: Dict[str, Counter] = {'total_status': Counter(), 'vat_status': Counter()}
+        self.report_path: Optional[Path] = None
+        self._report_started = False
+
+    @classmethod
+    def from_config(cls, amount_columns: List[str]) -> 'AmountReconciler':
+        """settings.yaml의 reconciliation으로 생성"""
+        return cls(
+            amount_columns,
+            tolerance=config.get('reconciliation.tolerance', 1),
+            vat_rate=config.get('reconciliation.vat_rate', 0.1),
+            skip_mismatch=config.get('reconciliation.skip_mismatch', False)
+        )
+
+    def check(self, records: List[Any]) -> List[Any]:
+        """금액 열을 정수로 바꾸고 대사 결과를 붙인 레코드 반환
+
+        records는 딕셔너리 또는 records.GridRecord 목록을 받는다.
+        skip_mismatch이면 합계 불일치(mismatch) 건은 제외한다.
+        """
+        if not records:
+            return records
+
+        columns = ['row_key', *self.amount_columns]
+        raw = pd.DataFrame([[record[column] for column in columns] for record in records], columns=columns)
+        amounts = normalize_amounts(raw, self.amount_columns)
+        checked = amounts
+        if self.check_vat:
+            checked = amounts.join(reconcile(amounts, self.tolerance, self.vat_rate))
+
+        # 문자열로 받은 금액만 원문 열을 남김 (레코드 모델은 이미 정수)
+        texts = [column for column in self.amount_columns if raw[column].dtype == object]
+        report = raw[['row_key']].join(raw[texts].add_suffix('_raw')).join(checked)
+        self._collect(report)
+
+        values = {column: checked[column].tolist() for column in checked.columns}
+        kept = []
+        for index, record in enumerate(records):
+            for column, column_values in values.items():
+                record[column] = column_values[index]
+
+            if self.check_vat and record['total_status'] == 'mismatch':
+                logger.warning(
+                    f"금액 불일치: {record['supply_amount']} + {record['vat_amount']} "
+                    f"!= {record['total_amount']} ({record['row_key']})"
+                )
+                if self.skip_mismatch:
+                    continue
+            kept.append(record)
+        return kept
+
+    def _collect(self, report: pd.DataFrame):
+        """묶음 결과 집계 (보고서를 시작했으면 파일에 이어 쓰고, 아니면 메모리에 보관)"""
+        self.checked += len(report)
+        for column, counts in self.counts.items():
+            if column in report:
+                counts.update(report[column].tolist())
+
+        if self.report_path is None:
+            self.frames.append(report)
+        else:
+            self._append(report)
+
+    def _append(self, report: pd.DataFrame):
+        """보고서 파일에 이어 쓰기 (BOM과 헤더는 파일 처음에 한 번만)"""
+        report.to_csv(
+            self.report_path,
+            mode='a' if self._report_started else 'w',
+            header=not self._report_started,
+            index=False,
+            encoding='utf-8' if self._report_started else 'utf-8-sig'
+        )
+        self._report_started = True
+
+    @property
+    def report(self) -> pd.DataFrame:
+        """메모리에 보관 중인 검사 결과 (보고서 파일로 이어 쓴 묶음은 제외)"""
+        return pd.concat(self.frames, ignore_index=True) if self.frames else pd.DataFrame()
+
+    def summary(self) -> Dict[str, Any]:
+        """상태별 건수"""
+        summary: Dict[str, Any] = {'checked': self.checked}
+        for column, counts in self.counts.items():
+            if counts:
+                summary[column] = dict(counts)
+        return summary
+
+    def start_report(self, name: str) -> Path:
+        """대사 보고서 파일 지정 (이후 검사 결과는 묶음마다 이어 씀)"""
+        output_dir = Path(config.get('reconciliation.report_dir', 'logs/reconciliation'))
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self.report_path = output_dir / f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        self._report_started = False
+
+        # 이미 메모리에 있던 결과부터 기록
+        for frame in self.frames:
+            self._append(frame)
+        self.frames = []
+        return self.report_path
+
+    def write_report(self, name: str) -> Optional[Path]:
+        """대사 보고서 CSV 저장 (검사한 건이 없으면 None)"""
+        if self.report_path is None:
+            if not self.frames:
+                return None
+            self.start_report(name)
+        if not self._report_started:
+            return None
+
+        logger.info(f"대사 보고서: {self.report_path} ({self.summary()})")
+        return self.report_path
@@ -0,0 +1,169 @@
+"""조회 레코드 모델
+
+그리드에서 읽은 행을 필드 타입을 선언한 __slots__ 클래스로 보관한다. 행마다 필드명 해시 테이블을
+두는 딕셔너리보다 작고, 금액은 정수로, 일자는 date로 조회 시점에 한 번만
+변환한다. DOM 요소(ElementHandle)는 담지 않고 행 키(row_key)와 페이지
+번호(grid_page)만 보관하므로, 클릭이 필요할 때 reveal_row로 행을 다시 찾는다.
+
+파이프라인/대사/처리 기록 등 딕셔너리를 받던 코드와 함께 쓸 수 있도록
+record['field'], record.get('field')로도 접근할 수 있다. 정의되지 않은 필드는
+추가할 수 없다. Python 3.9를 지원하므로 dataclass(slots=True) 대신 필드 타입
+주석과 __slots__를 함께 선언한다.
+
+이 모듈은 Playwright를 import하지 않는다.
+"""
+import re
+from datetime import date
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+from .amounts import parse_amount
+
+
+# 일자 표기 (2024-01-15, 2024.01.15, 2024/1/5, 20240115 등)
+DATE_PATTERN = re.compile(r'(\d{4})\D?(\d{1,2})\D?(\d{1,2})')
+
+
+def parse_date(text: Optional[str]) -> Optional[date]:
+    """일자 문자열을 date로 변환 (변환할 수 없으면 None)"""
+    match = DATE_PATTERN.search(text or '')
+    if not match:
+        return None
+    try:
+        return date(*(int(part) for part in match.groups()))
+    except ValueError:
+        return None
+
+
+R = TypeVar('R', bound='GridRecord')
+
+
+class GridRecord:
+    """그리드 레코드 기본 클래스
+
+    서브클래스는 TEXT_FIELDS/AMOUNT_FIELDS/DATE_FIELDS와 같은 이름의
+    필드 타입 주석과 __slots__를 지정한다.
+    """
+
+    KEY_FIELD = ''
+    TEXT_FIELDS: Tuple[str, ...] = ()
+    AMOUNT_FIELDS: Tuple[str, ...] = ()  # 정수로 변환
+    DATE_FIELDS: Tuple[str, ...] = ()  # date로 변환 (변환 실패 시 None)
+    # 조회 후 단계에서 채우는 필드 (기본값 None)
+    EXTRA_FIELDS: Tuple[str, ...] = ('budget',)
+
+    __slots__ = ('row_key', 'row_index', 'grid_page', 'budget')
+    row_key: str
+    row_index: Optional[int]
+    grid_page: Optional[int]
+    budget: Optional[Dict[str, Any]]
+
+    @classmethod
+    def from_row(cls: Type[R], row: Dict[str, Any]) -> R:
+        """extract_grid/GridCapture 행 딕셔너리로 생성"""
+        record = cls()
+        for name in cls.TEXT_FIELDS:
+            value = row.get(name)
+            setattr(record, name, '' if value is None else str(value).strip())
+        for name in cls.AMOUNT_FIELDS:
+            value = row.get(name)
+            setattr(record, name, value if isinstance(value, int) else parse_amount(str(value or '')))
+        for name in cls.DATE_FIELDS:
+            setattr(record, name, parse_date(row.get(name)))
+        for name in cls.EXTRA_FIELDS:
+            setattr(record, name, None)
+
+        record.row_key = str(row.get('row_key') or getattr(record, cls.KEY_FIELD, ''))
+        record.row_index = row.get('row_index')
+        record.grid_page = row.get('grid_page')
+        return record
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __setitem__(self, name: str, value: Any):
+        try:
+            setattr(self, name, value)
+        except AttributeError:
+            raise KeyError(f"{type(self).__name__}에 없는 필드: {name}") from None
+
+    def __contains__(self, name: str) -> bool:
+        return hasattr(self, name)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        value = getattr(self, name, None)
+        return default if value is None else value
+
+    def as_dict(self) -> Dict[str, Any]:
+        """설정된 필드 딕셔너리 (로그/디버그용)"""
+        names = [slot for klass in reversed(type(self).__mro__) for slot in getattr(klass, '__slots__', ())]
+        return {name: getattr(self, name) for name in names if hasattr(self, name)}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.row_key!r})"
+
+
+class CardRecord(GridRecord):
+    """보조금전용카드 사용내역"""
+
+    KEY_FIELD = 'approval_number'
+    TEXT_FIELDS = ('approval_number', 'merchant_name', 'business_type')
+    AMOUNT_FIELDS = ('amount',)
+    DATE_FIELDS = ('transaction_date',)
+
+    __slots__ = ('approval_number', 'merchant_name', 'business_type', 'amount', 'transaction_date')
+    approval_number: str
+    merchant_name: str
+    business_type: str
+    amount: int
+    transaction_date: Optional[date]
+
+
+class TaxInvoiceRecord(GridRecord):
+    """전자세금계산서 (대사 결과 필드 포함)"""
+
+    KEY_FIELD = 'invoice_number'
+    TEXT_FIELDS = ('invoice_number', 'vendor_name', 'business_number')
+    AMOUNT_FIELDS = ('supply_amount', 'vat_amount', 'total_amount')
+    DATE_FIELDS = ('issue_date',)
+    EXTRA_FIELDS = ('budget', 'total_difference', 'total_status', 'expected_vat', 'vat_status')
+
+    __slots__ = (
+        'invoice_number', 'vendor_name', 'business_number',
+        'supply_amount', 'vat_amount', 'total_amount', 'issue_date',
+        'total_difference', 'total_status', 'expected_vat', 'vat_status'
+    )
+    invoice_number: str
+    vendor_name: str
+    business_number: str
+    supply_amount: int
+    vat_amount: int
+    total_amount: int
+    issue_date: Optional[date]
+    total_difference: Optional[int]
+    total_status: Optional[str]
+    expected_vat: Optional[int]
+    vat_status: Optional[str]
+
+
+class TransferRecord(GridRecord):
+    """집행이체 대기 건"""
+
+    KEY_FIELD = 'execution_number'
+    TEXT_FIELDS = ('execution_number', 'vendor_name', 'bank_name', 'account_number', 'budget_item')
+    AMOUNT_FIELDS = ('amount',)
+    DATE_FIELDS = ('request_date',)
+
+    __slots__ = (
+        'execution_number', 'vendor_name', 'bank_name', 'account_number',
+        'budget_item', 'amount', 'request_date'
+    )
+    execution_number: str
+    vendor_name: str
+    bank_name: str
+    account_number: str
+    budget_item: str
+    amount: int
+    request_date: Optional[date]
@@ -0,0 +1,40 @@
+"""자동화 레지스트리
+
+자동화 클래스는 실행할 때 import한다. 자동화 모듈은 Playwright를 import하므로,
+목록 표시(--list)/도움말/계획(plan)/데몬 클라이언트는 이 모듈만으로 동작한다.
+
+이 모듈은 표준 라이브러리 외에는 import하지 않는다.
+"""
+import importlib
+from typing import Dict
+
+
+AUTOMATION_TYPES: Dict[str, Dict[str, str]] = {
+    'card': {
+        'class': 'src.card_usage_automation.CardUsageAutomation',
+        'name': '카드사용내역 집행등록',
+        'description': '미사용 카드내역을 조회하여 자동으로 집행등록합니다.'
+    },
+    'tax': {
+        'class': 'src.tax_invoice_automation.TaxInvoiceAutomation',
+        'name': '전자세금계산서 집행등록',
+        'description': '미등록 전자세금계산서를 조회하여 자동으로 집행등록합니다.'
+    },
+    'transfer': {
+        'class': 'src.transfer_automation.TransferAutomation',
+        'name': '집행이체 일괄처리',
+        'description': '이체 대기건을 선택하고 일괄이체합니다. (인증서 인증 필요)'
+    }
+}
+
+# 사전 계획(plan)을 지원하는 자동화
+PLAN_TYPES = ['card', 'tax']
+
+# 데몬/스케줄 실행 요청에 쓸 수 있는 타입 (all: 모든 자동화 순차 실행)
+RUN_TYPES = tuple(AUTOMATION_TYPES) + ('all',)
+
+
+def load_automation_class(automation_type: str):
+    """자동화 클래스 import"""
+    module_name, class_name = AUTOMATION_TYPES[automation_type]['class'].rsplit('.', 1)
+    return getattr(importlib.import_module(module_name), class_name)
@@ -0,0 +1,68 @@
+"""리소스 차단 정책 모듈
+
+자동화는 이미지/폰트/배너/분석 스크립트를 보지 않으므로 요청 단계에서
+차단하여 화면 로딩 시간을 줄인다. 문서와 스타일시트는 오류 스크린샷이
+알아볼 수 있게 렌더링되도록 유형 기준으로는 차단하지 않는다.
+"""
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from .config import config
+
+
+# 유형 기준 차단에서 제외 (화면 구성/스크린샷 가독성 유지)
+NEVER_BLOCK_TYPES = {'document', 'stylesheet'}
+
+
+class ResourcePolicy:
+    """리소스 유형/URL 패턴 기반 요청 차단 정책
+
+    판정 순서: allow_patterns 일치 → 허용, block_types 일치 → 차단,
+    block_patterns 일치 → 차단, 그 외 허용
+    """
+
+    def __init__(
+        self,
+        block_types: Optional[List[str]] = None,
+        block_patterns: Optional[List[str]] = None,
+        allow_patterns: Optional[List[str]] = None
+    ):
+        self.block_types = set(block_types or []) - NEVER_BLOCK_TYPES
+        self.block_patterns = [re.compile(p) for p in block_patterns or []]
+        self.allow_patterns = [re.compile(p) for p in allow_patterns or []]
+        self.blocked: Counter = Counter()
+        self.allowed = 0
+
+    @classmethod
+    def from_config(cls) -> Optional['ResourcePolicy']:
+        """settings.yaml의 browser.resource_policy로 생성 (비활성화 시 None)"""
+        settings: Dict[str, Any] = config.get('browser.resource_policy', {}) or {}
+        if not settings.get('enabled', False):
+            return None
+        return cls(
+            block_types=settings.get('block_types'),
+            block_patterns=settings.get('block_patterns'),
+            allow_patterns=settings.get('allow_patterns')
+        )
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """요청 차단 여부 판정 (판정 결과는 집계됨)"""
+        if any(p.search(url) for p in self.allow_patterns):
+            block = False
+        elif resource_type in self.block_types:
+            block = True
+        else:
+            block = any(p.search(url) for p in self.block_patterns)
+
+        if block:
+            self.blocked[resource_type] += 1
+        else:
+            self.allowed += 1
+        return block
+
+    def summary(self) -> str:
+        """차단 집계 요약"""
+        total = sum(self.blocked.values())
+        detail = ', '.join(f"{t} {n}" for t, n in self.blocked.most_common())
+        return f"차단 {total}건 / 허용 {self.allowed}건" + (f" ({detail})" if detail else "")
@@ -0,0 +1,201 @@
+"""재시도/백오프 정책 모듈
+
+화면 조작 중 난 예외를 종류별로 분류하여 일시적인 오류만 재시도한다.
+
+- timeout: 응답 지연으로 대기 시간 초과
+- detached: 그리드 재렌더링 등으로 요소가 DOM에서 떨어짐
+- session_expired: 세션 만료 (재로그인 후 재시도)
+- validation: 사이트의 업무 검증 오류 (재시도하지 않음)
+- other: 그 밖의 오류 (재시도하지 않음)
+
+재시도 간격은 지수적으로 늘리되 지터(jitter)를 섞어 여러 워커가 같은 순간에
+몰리지 않게 하고, 실행 전체의 재시도 횟수는 budget으로 제한하여 사이트 장애 시
+실행이 끝없이 늘어지지 않게 한다. 재시도 횟수와 재시도로 늘어난 시간은
+summary()로 실행 결과에 남긴다.
+"""
+import asyncio
+import random
+import re
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from loguru import logger
+
+from .config import config
+
+
+T = TypeVar('T')
+
+ERROR_TIMEOUT = 'timeout'
+ERROR_DETACHED = 'detached'
+ERROR_SESSION = 'session_expired'
+ERROR_VALIDATION = 'validation'
+ERROR_OTHER = 'other'
+
+# 재시도할 오류 분류
+TRANSIENT_ERRORS = (ERROR_TIMEOUT, ERROR_DETACHED, ERROR_SESSION)
+
+# 오류 메시지로 분류 (Playwright 메시지 기준, 세션/검증 문구는 settings.yaml에서 추가)
+DETACHED_PATTERN = re.compile(
+    r'not attached to the DOM|element is detached|node is detached|'
+    r'execution context was destroyed|element handle.*disposed',
+    re.IGNORECASE
+)
+TIMEOUT_PATTERN = re.compile(r'timeout \d+ms exceeded|timed out', re.IGNORECASE)
+DEFAULT_SESSION_PATTERNS = ['세션이 만료', '세션 만료', '다시 로그인', 'session expired']
+DEFAULT_VALIDATION_PATTERNS = ['필수 입력', '입력하십시오', '입력하세요', '잔액이 부족', '초과할 수 없']
+
+
+def classify_error(
+    error: BaseException,
+    session_patterns: Optional[List[str]] = None,
+    validation_patterns: Optional[List[str]] = None
+) -> str:
+    """예외를 오류 분류로 변환"""
+    message = str(error)
+    lowered = message.lower()
+
+    if any(pattern.lower() in lowered for pattern in session_patterns or DEFAULT_SESSION_PATTERNS):
+        return ERROR_SESSION
+    if any(pattern.lower() in lowered for pattern in validation_patterns or DEFAULT_VALIDATION_PATTERNS):
+        return ERROR_VALIDATION
+    if DETACHED_PATTERN.search(message):
+        return ERROR_DETACHED
+    # Playwright TimeoutError는 asyncio.TimeoutError를 상속하지 않으므로 이름으로도 확인
+    if (isinstance(error, asyncio.TimeoutError) or type(error).__name__ == 'TimeoutError'
+            or TIMEOUT_PATTERN.search(message)):
+        return ERROR_TIMEOUT
+    return ERROR_OTHER
+
+
+def is_transient(error: BaseException) -> bool:
+    """재시도 대상 오류인지 (처리 메서드의 except에서 재시도 계층으로 넘길지 판단)"""
+    return classify_error(
+        error,
+        config.get('retry.session_patterns'),
+        config.get('retry.validation_patterns')
+    ) in TRANSIENT_ERRORS
+
+
+class RetryPolicy:
+    """오류 분류별 재시도 정책 (실행 단위 재시도 예산 공유)"""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 15.0,
+        budget: int = 30,
+        session_patterns: Optional[List[str]] = None,
+        validation_patterns: Optional[List[str]] = None,
+        rng: Optional[random.Random] = None
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.session_patterns = session_patterns
+        self.validation_patterns = validation_patterns
+        self.rng = rng or random.Random()
+
+        self.retries: Counter = Counter()  # 분류별 재시도 횟수
+        self.failures: Counter = Counter()  # 분류별 최종 실패 횟수
+        self.recovered = 0  # 재시도 후 성공한 작업 수
+        self.relogins = 0
+        self.added_seconds = 0.0  # 실패한 시도 + 대기 시간 합계
+        self._budget_warned = False
+
+    @classmethod
+    def from_config(cls) -> 'RetryPolicy':
+        """settings.yaml의 retry로 생성 (비활성화 시 재시도 없음)"""
+        return cls(
+            max_attempts=config.get('retry.max_attempts', 3) if config.get('retry.enabled', True) else 1,
+            base_delay=config.get('retry.base_delay', 1.0),
+            max_delay=config.get('retry.max_delay', 15.0),
+            budget=config.get('retry.budget', 30),
+            session_patterns=config.get('retry.session_patterns'),
+            validation_patterns=config.get('retry.validation_patterns')
+        )
+
+    @property
+    def remaining(self) -> int:
+        """남은 재시도 예산"""
+        return max(0, self.budget - sum(self.retries.values()))
+
+    def classify(self, error: BaseException) -> str:
+        return classify_error(error, self.session_patterns, self.validation_patterns)
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째 실패 후 대기 시간 (지수 증가, 절반 구간 지터)"""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay / 2 + self.rng.uniform(0, delay / 2)
+
+    async def run(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        label: str = '',
+        recover: Optional[Callable[[str], Awaitable[bool]]] = None
+    ) -> T:
+        """operation 실행, 일시적인 오류면 백오프 후 재시도
+
+        Args:
+            operation: 매 시도마다 새로 호출할 비동기 함수
+            label: 로그용 작업 이름
+            recover: 재시도 전 호출 (오류 분류를 받아 복구, False면 재시도 중단)
+
+        Raises:
+            재시도하지 않거나 재시도를 모두 실패한 경우 마지막 예외
+        """
+        attempt = 1
+        first_failure: Optional[float] = None
+        while True:
+            started = time.monotonic()
+            try:
+                result = await operation()
+            except Exception as e:
+                kind = self.classify(e)
+                if first_failure is None:
+                    first_failure = started
+                if not self._should_retry(kind, attempt, label):
+                    self.failures[kind] += 1
+                    self.added_seconds += time.monotonic() - first_failure
+                    raise
+
+                delay = self.backoff(attempt)
+                self.retries[kind] += 1
+                logger.warning(f"{label} {kind} 오류 - {delay:.1f}초 후 재시도 ({attempt}/{self.max_attempts - 1}): {e}")
+                await asyncio.sleep(delay)
+
+                if recover is not None and not await recover(kind):
+                    self.failures[kind] += 1
+                    self.added_seconds += time.monotonic() - first_failure
+                    raise
+                attempt += 1
+                continue
+
+            if first_failure is not None:
+                self.recovered += 1
+                self.added_seconds += started - first_failure
+            return result
+
+    def _should_retry(self, kind: str, attempt: int, label: str) -> bool:
+        if kind not in TRANSIENT_ERRORS or attempt >= self.max_attempts:
+            return False
+        if self.remaining <= 0:
+            if not self._budget_warned:
+                logger.warning(f"재시도 예산({self.budget}회) 소진 - 이후 오류는 재시도하지 않음 ({label})")
+                self._budget_warned = True
+            return False
+        return True
+
+    def summary(self) -> Dict[str, Any]:
+        """재시도 통계 (실행 결과용)"""
+        return {
+            'retries': dict(self.retries),
+            'failures': dict(self.failures),
+            'recovered': self.recovered,
+            'relogins': self.relogins,
+            'added_seconds': round(self.added_seconds, 2),
+            'budget_left': self.remaining
+        }
@@ -0,0 +1,246 @@
+"""스케줄 실행 모듈 (`python main.py schedule`)
+
+외부 cron으로 main.py를 실행할 때마다 브라우저를 새로 띄우던 것을, 한 프로세스에서
+settings.yaml의 schedule.jobs 정의대로 실행한다. 실행은 상주 데몬(daemon.py)의
+큐로 보내므로 브라우저/로그인 세션을 재사용하고, 한 계정의 실행이 겹치지 않는다.
+
+작업 정의:
+    name: 작업 이름 (상태 파일 키)
+    type: card | tax | transfer | all
+    every: "30 minutes", "2 hours", "1 day", "monday" 등 (schedule 라이브러리 단위)
+    at: 실행 시각 ("09:00", every가 day/요일일 때, hours면 ":30")
+    window: 시작 허용 시간대 ("08:00-19:00", 자정을 넘는 "22:00-06:00"도 가능)
+    max_runtime_minutes: 최대 실행 시간 (넘기면 중단)
+    fiscal_year / project_code: 비우면 project 설정 사용
+    batch / targets / parallel: 여러 보조사업 일괄 실행 (targets를 비우면 batch.targets)
+
+마지막 실행 시각/상태는 schedule.state_path에 저장하며, 주기(at 없는) 작업은 재시작
+후에도 마지막 실행에서 한 주기가 지난 시점에 실행한다. 한 번도 실행하지 않은 작업은
+바로 실행한다.
+
+이 모듈은 Playwright를 import하지 않는다.
+"""
+import asyncio
+import json
+import re
+from datetime import datetime, time as dtime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import schedule
+from loguru import logger
+
+from .config import config
+from .registry import RUN_TYPES
+
+
+EVERY_PATTERN = re.compile(r'^\s*(\d+)?\s*([a-z]+?)s?\s*$')
+INTERVAL_UNITS = ('second', 'minute', 'hour', 'day', 'week')
+WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+# 작업 정의 -> 실행 요청 (데몬 run params)
+Submit = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+def parse_window(window: Optional[str]) -> Optional[Tuple[dtime, dtime]]:
+    """'08:00-19:00' -> (시작, 끝), 비어 있으면 None (제한 없음)"""
+    if not window:
+        return None
+    try:
+        start, end = (datetime.strptime(part.strip(), '%H:%M').time() for part in window.split('-'))
+    except ValueError:
+        raise ValueError(f"시간대 형식 오류 (예: 08:00-19:00): {window}") from None
+    return start, end
+
+
+def in_window(window: Optional[Tuple[dtime, dtime]], now: datetime) -> bool:
+    """now가 시간대 안인지 (끝이 시작보다 이르면 자정을 넘는 시간대)"""
+    if window is None:
+        return True
+    start, end = window
+    current = now.time()
+    if start <= end:
+        return start <= current < end
+    return current >= start or current < end
+
+
+def build_job(scheduler: schedule.Scheduler, spec: Dict[str, Any]) -> schedule.Job:
+    """작업 정의의 every/at으로 schedule 작업 생성 (실행 함수는 호출한 쪽에서 지정)"""
+    match = EVERY_PATTERN.match(str(spec.get('every', '')).lower())
+    if not match or match.group(2) not in INTERVAL_UNITS + WEEKDAYS:
+        raise ValueError(f"[{spec.get('name')}] every 형식 오류 (예: '30 minutes', '1 day', 'monday'): {spec.get('every')}")
+
+    interval, unit = int(match.group(1) or 1), match.group(2)
+    job = scheduler.every(interval)
+    job = getattr(job, unit if unit in WEEKDAYS else unit + 's')
+    if spec.get('at'):
+        job = job.at(str(spec['at']))
+    return job
+
+
+class ScheduleState:
+    """작업별 마지막 실행 시각/상태 (JSON 파일)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else None
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        if self.path and self.path.exists():
+            try:
+                self.jobs = json.loads(self.path.read_text(encoding='utf-8'))
+            except (OSError, ValueError) as e:
+                logger.warning(f"스케줄 상태 파일을 읽을 수 없음 - 새로 시작: {e}")
+
+    def last_run(self, name: str) -> Optional[datetime]:
+        value = self.jobs.get(name, {}).get('last_run')
+        return datetime.fromisoformat(value) if value else None
+
+    def record(self, name: str, **values: Any):
+        """작업 상태 갱신 후 저장"""
+        self.jobs.setdefault(name, {}).update(values)
+        self.save()
+
+    def save(self):
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self.jobs, ensure_ascii=False, indent=2, default=str), encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"스케줄 상태 저장 실패: {e}")
+
+
+class JobScheduler:
+    """작업 정의대로 실행 요청 (같은 작업이 대기/실행 중이면 새로 넣지 않음)"""
+
+    def __init__(
+        self,
+        specs: List[Dict[str, Any]],
+        submit: Submit,
+        state: Optional[ScheduleState] = None,
+        poll_seconds: float = 30,
+        clock: Callable[[], datetime] = datetime.now
+    ):
+        self.submit = submit
+        self.state = state or ScheduleState()
+        self.poll_seconds = poll_seconds
+        self.clock = clock
+        self.scheduler = schedule.Scheduler()
+        self.specs: Dict[str, Dict[str, Any]] = {}
+        self.windows: Dict[str, Optional[Tuple[dtime, dtime]]] = {}
+        self.jobs: Dict[str, schedule.Job] = {}
+        self.pending: List[str] = []  # 실행 시각이 되어 요청할 작업
+        self.active: Set[str] = set()  # 데몬 큐에서 대기/실행 중인 작업
+        self._tasks: Set[asyncio.Task] = set()
+
+        for spec in specs:
+            name = spec.get('name') or spec.get('type')
+            if name in self.specs:
+                raise ValueError(f"중복된 스케줄 작업 이름: {name}")
+            if spec.get('type') not in RUN_TYPES:
+                raise ValueError(f"[{name}] 알 수 없는 자동화 타입: {spec.get('type')} ({'/'.join(RUN_TYPES)})")
+            self.specs[name] = spec
+            self.windows[name] = parse_window(spec.get('window'))
+            self.jobs[name] = build_job(self.scheduler, spec).do(self._trigger, name)
+            self._resume(name)
+
+    @classmethod
+    def from_config(cls, submit: Submit) -> 'JobScheduler':
+        """settings.yaml의 schedule로 생성"""
+        return cls(
+            config.get('schedule.jobs') or [],
+            submit,
+            ScheduleState(config.get('schedule.state_path', 'data/schedule_state.json')),
+            poll_seconds=config.get('schedule.poll_seconds', 30)
+        )
+
+    def _resume(self, name: str):
+        """주기 작업의 다음 실행 시각을 마지막 실행 기준으로 맞춤 (실행한 적 없으면 바로)"""
+        job = self.jobs[name]
+        if job.at_time is not None or job.start_day is not None:
+            return
+        last_run = self.state.last_run(name)
+        now = self.clock()
+        job.next_run = max(now, last_run + job.period) if last_run else now
+
+    def _trigger(self, name: str):
+        """schedule 실행 시각 도달 (시간대 밖이거나 이전 실행이 남아 있으면 건너뜀)"""
+        if not in_window(self.windows[name], self.clock()):
+            logger.info(f"[{name}] 실행 시간대({self.specs[name].get('window')}) 밖 - 건너뜀")
+            return
+        if name in self.active or name in self.pending:
+            logger.warning(f"[{name}] 이전 실행이 아직 끝나지 않음 - 이번 실행 건너뜀")
+            return
+        self.pending.append(name)
+
+    def request(self, name: str) -> Dict[str, Any]:
+        """작업 정의 -> 데몬 실행 요청"""
+        spec = self.specs[name]
+        max_runtime = spec.get('max_runtime_minutes')
+        return {
+            'type': spec['type'],
+            'plan': None,
+            'fiscal_year': spec.get('fiscal_year') or None,
+            'project_code': spec.get('project_code') or None,
+            'max_runtime': max_runtime * 60 if max_runtime else None,
+            'batch': bool(spec.get('batch') or spec.get('targets')),
+            'targets': spec.get('targets') or None,
+            'parallel': spec.get('parallel') or None
+        }
+
+    def launch_pending(self):
+        """요청할 작업을 실행 태스크로 시작"""
+        while self.pending:
+            name = self.pending.pop(0)
+            self.active.add(name)
+            task = asyncio.create_task(self._execute(name))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, name: str):
+        started = self.clock()
+        self.state.record(name, last_run=started.isoformat(timespec='seconds'), last_status='RUNNING')
+        logger.info(f"[{name}] 스케줄 실행 요청")
+        try:
+            result = await self.submit(self.request(name))
+            status, error = result.get('status', 'COMPLETED'), result.get('error')
+        except Exception as e:
+            status, error = 'ERROR', str(e)
+        finally:
+            self.active.discard(name)
+
+        finished = self.clock()
+        self.state.record(
+            name,
+            last_status=status,
+            last_error=error,
+            last_finished=finished.isoformat(timespec='seconds'),
+            last_duration_seconds=round((finished - started).total_seconds()),
+            runs=self.state.jobs.get(name, {}).get('runs', 0) + 1,
+            next_run=self.jobs[name].next_run.isoformat(timespec='seconds')
+        )
+        log = logger.success if status in ('COMPLETED', 'NO_RECORDS') else logger.warning
+        log(f"[{name}] 스케줄 실행 종료: {status}" + (f" ({error})" if error else ''))
+
+    def describe(self) -> List[str]:
+        """로그용 작업 목록"""
+        return [
+            f"{name}: {spec['type']} / every {spec.get('every')}"
+            + (f" at {spec['at']}" if spec.get('at') else '')
+            + (f" / {spec['window']}" if spec.get('window') else '')
+            + f" / 다음 {self.jobs[name].next_run:%Y-%m-%d %H:%M}"
+            for name, spec in self.specs.items()
+        ]
+
+    async def run(self):
+        """취소될 때까지 실행 시각이 된 작업 요청"""
+        for line in self.describe():
+            logger.info(f"스케줄: {line}")
+        try:
+            while True:
+                self.scheduler.run_pending()
+                self.launch_pending()
+                idle = self.scheduler.idle_seconds
+                await asyncio.sleep(max(1.0, min(self.poll_seconds, idle if idle is not None else self.poll_seconds)))
+        finally:
+            for task in list(self._tasks):
+                task.cancel()
@@ -0,0 +1,85 @@
+"""열린 화면(MDI 탭) 관리 모듈
+
+eXBuilder6 셸은 메뉴로 연 화면을 탭으로 남겨 둔다. 카드/세금계산서 자동화가
+모두 '집행관리 > 집행등록'을 쓰고 일괄 집행요청에서 같은 화면으로 다시 가는 것처럼,
+이미 열린 화면은 메뉴를 다시 타지 않고 탭을 전환한 뒤 조회 조건을 초기화해 쓴다.
+
+열린 탭은 최근 사용 순으로 추적하고 max_open개를 넘으면 가장 오래 쓰지 않은
+탭을 닫아 브라우저 메모리가 계속 늘지 않게 한다. 페이지를 다시 불러오면(로그인 등)
+탭이 모두 사라지므로 clear()로 비운다.
+
+이 모듈은 Playwright를 import하지 않는다. 탭 전환/닫기는 BotameAutomation에서 한다.
+"""
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+from .config import config
+from .menu_routes import route_key
+
+
+class ScreenManager:
+    """열린 화면 탭 추적 (최근 사용 순, max_open이 0이면 추적하지 않음)"""
+
+    def __init__(self, max_open: int = 4):
+        self.max_open = max(0, max_open)
+        self._open: 'OrderedDict[str, List[str]]' = OrderedDict()  # 경로 키 -> 메뉴 경로
+
+        self.reused = 0  # 탭 전환으로 메뉴 이동을 생략한 횟수
+        self.opened_count = 0  # 메뉴 이동 횟수
+        self.evicted_count = 0
+
+    @classmethod
+    def from_config(cls) -> 'ScreenManager':
+        """settings.yaml의 screens로 생성 (비활성화 시 매번 메뉴 이동)"""
+        if not config.get('screens.enabled', True):
+            return cls(0)
+        return cls(config.get('screens.max_open', 4))
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_open > 0
+
+    def __len__(self) -> int:
+        return len(self._open)
+
+    def is_open(self, menu_path: List[str]) -> bool:
+        return route_key(menu_path) in self._open
+
+    def activated(self, menu_path: List[str]):
+        """열린 탭으로 전환함"""
+        self._open.move_to_end(route_key(menu_path))
+        self.reused += 1
+
+    def opened(self, menu_path: List[str]) -> List[List[str]]:
+        """메뉴 이동으로 화면을 엶, 닫아야 할 오래된 화면 경로 반환"""
+        self.opened_count += 1
+        if not self.enabled:
+            return []
+
+        key = route_key(menu_path)
+        self._open[key] = list(menu_path)
+        self._open.move_to_end(key)
+
+        evicted = []
+        while len(self._open) > self.max_open:
+            _, path = self._open.popitem(last=False)
+            evicted.append(path)
+        self.evicted_count += len(evicted)
+        return evicted
+
+    def closed(self, menu_path: List[str]):
+        """탭이 닫혔거나 전환할 수 없음"""
+        self._open.pop(route_key(menu_path), None)
+
+    def clear(self):
+        """페이지를 다시 불러와 탭이 모두 닫힘"""
+        self._open.clear()
+
+    def summary(self) -> Dict[str, Any]:
+        """탭 재사용 통계 (실행 결과용)"""
+        return {
+            'reused': self.reused,
+            'opened': self.opened_count,
+            'evicted': self.evicted_count,
+            'open': [path[-1] for path in self._open.values()]
+        }
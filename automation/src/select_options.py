@@ -0,0 +1,48 @@
+"""셀렉트 박스 옵션 인덱스 모듈
+
+비목/재원구분 드롭다운의 옵션 목록은 회계연도/보조사업이 같으면 바뀌지 않으므로
+한 번의 evaluate로 (텍스트, 값) 목록을 읽어 인덱스로 보관하고, 레코드마다
+select_option 한 번만 호출한다.
+"""
+from typing import Dict, List, Optional, Sequence
+
+
+# 셀렉트 박스 옵션 일괄 조회 스크립트 (셀렉트 박스가 없으면 null)
+SELECT_OPTIONS_SCRIPT = """
+(selector) => {
+    const select = document.querySelector(selector);
+    if (!select) return null;
+    return Array.from(select.options).map(o => [o.text.trim(), o.value]);
+}
+"""
+
+
+class OptionIndex:
+    """옵션 텍스트 → 값 인덱스
+
+    조회 순서: 텍스트 완전 일치 → 텍스트 포함(옵션 순서상 첫 옵션) → fallback 포함
+    """
+
+    def __init__(self, options: Sequence[Sequence[str]]):
+        self.options: List[tuple] = [(text, value) for text, value in options]
+        self.exact: Dict[str, str] = {}
+        for text, value in self.options:
+            self.exact.setdefault(text, value)
+        self._found: Dict[str, Optional[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    def _search(self, text: str) -> Optional[str]:
+        if text in self.exact:
+            return self.exact[text]
+        return next((value for option, value in self.options if text in option), None)
+
+    def find(self, text: str, fallback: Optional[str] = None) -> Optional[str]:
+        """텍스트에 해당하는 옵션 값 (못 찾으면 fallback 텍스트로 재검색, 그래도 없으면 None)"""
+        if text not in self._found:
+            self._found[text] = self._search(text) if text else None
+        value = self._found[text]
+        if value is None and fallback:
+            return self.find(fallback)
+        return value
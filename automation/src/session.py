@@ -0,0 +1,67 @@
+"""공유 세션 모듈 (브라우저 + 로그인 + 보조사업 선택 상태)"""
+from typing import Any, Optional, Tuple
+from playwright.async_api import Page
+from loguru import logger
+
+from .browser import BrowserManager
+from .config import config
+from .rate_limiter import ACTION_NAVIGATE
+from .screens import ScreenManager
+
+
+class BotameSession:
+    """여러 자동화가 함께 쓰는 브라우저 세션
+
+    `python main.py all`처럼 자동화를 연달아 실행할 때 브라우저 실행,
+    로그인, 보조사업 선택을 한 번만 수행하도록 상태를 보관한다.
+    """
+
+    def __init__(self, browser_manager: Optional[BrowserManager] = None):
+        self.browser_manager = browser_manager or BrowserManager()
+        self.page: Optional[Page] = None
+        self.logged_in = False
+        self.project: Optional[Tuple[str, str]] = None  # 선택된 (회계연도, 보조사업코드)
+        self.screens = ScreenManager.from_config()  # 이 페이지에 열린 화면 탭
+
+    @property
+    def is_started(self) -> bool:
+        return self.page is not None
+
+    async def start(self) -> Page:
+        """브라우저 시작 (이미 시작된 경우 기존 페이지 반환)"""
+        if not self.is_started:
+            self.page = await self.browser_manager.start()
+        return self.page
+
+    async def spawn_worker(self, worker_id: int, automation: Any) -> 'BotameSession':
+        """로그인 상태(쿠키)를 복사한 워커 세션 생성 (보조사업 선택은 워커가 다시 수행)
+
+        새 컨텍스트의 페이지는 about:blank이므로 보탬e에 접속한 뒤 로그인 상태가
+        확인된 경우에만 logged_in을 설정한다 (아니면 워커가 prepare에서 다시 로그인).
+
+        Args:
+            automation: 워커 세션으로 접속/로그인 확인을 할 자동화 (이 세션에 연결됨)
+        """
+        worker = BotameSession(await self.browser_manager.spawn_worker(worker_id))
+        worker.page = worker.browser_manager.page
+        automation.attach(worker)
+        try:
+            await automation.throttle(ACTION_NAVIGATE)
+            await worker.page.goto(config.botame_url)
+            await automation.ready('worker')
+            worker.logged_in = await automation.is_logged_in(navigate=False)
+        except Exception as e:
+            logger.warning(f"워커 {worker_id} 보탬e 접속 실패: {e}")
+        if not worker.logged_in:
+            logger.info(f"워커 {worker_id} 로그인 상태를 확인하지 못함 - 워커가 다시 로그인")
+        return worker
+
+    async def close(self):
+        """브라우저 종료 및 상태 초기화"""
+        if self.is_started:
+            await self.browser_manager.stop()
+        self.page = None
+        self.logged_in = False
+        self.project = None
+        self.screens.clear()
+        logger.debug("공유 세션 종료")
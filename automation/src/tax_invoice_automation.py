@@ -1,25 +1,38 @@
 """전자세금계산서 집행등록 자동화"""
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, AsyncIterator
 from loguru import logger
 
 from .botame import BotameAutomation
 from .config import config
+from .navigation import EXECUTION_MENU
+from .rate_limiter import ACTION_NAVIGATE, ACTION_SAVE, ACTION_SUBMIT
+from .records import TaxInvoiceRecord
+from .retry import is_transient
+from .session import BotameSession
 
 
 class TaxInvoiceAutomation(BotameAutomation):
     """전자세금계산서 집행등록 자동화"""
 
+    # 전자세금계산서 그리드 (셀렉터는 실제 화면에 맞게 수정 필요)
+    ROW_SELECTOR = 'tr.tax-invoice-row, .invoice-item'
+    COLUMNS = [
+        'issue_date', 'invoice_number', 'vendor_name', 'business_number',
+        'supply_amount', 'vat_amount', 'total_amount'
+    ]
+    AMOUNT_COLUMNS = list(TaxInvoiceRecord.AMOUNT_FIELDS)
+    WATERMARK_FIELD = 'issue_date'
+
     def __init__(self):
         super().__init__("전자세금계산서_집행등록")
         self.max_items = config.get('automation.tax_invoice.max_items', 100)
+        self.max_workers = config.get('automation.tax_invoice.max_workers', 1)
 
-    async def fetch_tax_invoices(self) -> List[Dict[str, Any]]:
-        """미등록 전자세금계산서 조회"""
-        invoices = []
-
+    async def open_record_screen(self) -> bool:
+        """집행등록 화면에서 전자세금계산서 조회"""
         try:
             # 집행등록 메뉴 이동
-            await self.navigate_to_menu(['집행관리', '집행등록'])
+            await self.open_screen(EXECUTION_MENU)
 
             # 전자세금계산서 탭/버튼 클릭
             tax_invoice_tab = await self.page.query_selector(
@@ -27,170 +40,133 @@ class TaxInvoiceAutomation(BotameAutomation):
             )
             if tax_invoice_tab:
                 await tax_invoice_tab.click()
-                await self.page.wait_for_load_state('networkidle')
+                await self.ready('invoice_tab')
+
+            # 이전 실행 이후 발행분만 조회 (워터마크가 있으면)
+            await self.fill_search_from()
 
             # 홈택스 연동 조회 버튼 클릭
             fetch_btn = await self.page.query_selector(
                 'button:has-text("조회"), button:has-text("세금계산서 조회")'
             )
             if fetch_btn:
+                await self.throttle(ACTION_SUBMIT)
                 await fetch_btn.click()
-                await self.page.wait_for_load_state('networkidle')
+                await self.ready('tax_invoice', grid=self.ROW_SELECTOR, required=True)
+            return True
+
+        except Exception as e:
+            logger.error(f"세금계산서 화면 조회 중 오류: {e}")
+            await self.browser_manager.screenshot("open_invoice_screen_error")
+            return False
 
-            # 전자세금계산서 목록 추출
-            rows = await self.page.query_selector_all('tr.tax-invoice-row, .invoice-item')
+    async def iter_tax_invoices(self) -> AsyncIterator[TaxInvoiceRecord]:
+        """미등록 전자세금계산서를 페이지/스크롤을 따라가며 순차 반환 (최대 max_items건)"""
+        count = 0
 
-            for row in rows[:self.max_items]:
+        try:
+            # 전자세금계산서 목록 조회 (응답 캡처 또는 DOM 추출)
+            async for row in self.iter_grid(
+                'tax_invoice',
+                self.ROW_SELECTOR,
+                self.COLUMNS,
+                key_column='invoice_number',
+                min_cells=6,
+                status_selectors={'registered': '.registered, .status-registered'}
+            ):
                 # 등록여부 확인
-                registered = await row.query_selector('.registered, .status-registered')
-                if registered:
+                if row.pop('registered', None) is not None:
                     continue  # 이미 등록된 건 스킵
 
-                # 데이터 추출
-                invoice = await self._extract_invoice_data(row)
-                if invoice:
-                    invoices.append(invoice)
+                yield TaxInvoiceRecord.from_row(row)
+                count += 1
+                if self.max_items and count >= self.max_items:
+                    logger.info(f"최대 처리 건수({self.max_items}건) 도달 - 나머지는 다음 실행에서 처리")
+                    break
+            else:
+                self.fetch_complete = True
 
-            logger.info(f"미등록 전자세금계산서 {len(invoices)}건 조회 완료")
-            return invoices
+            logger.info(f"미등록 전자세금계산서 {count}건 조회 완료")
 
         except Exception as e:
             logger.error(f"세금계산서 조회 중 오류: {e}")
             await self.browser_manager.screenshot("fetch_invoice_error")
-            return invoices
 
-    async def _extract_invoice_data(self, row) -> Dict[str, Any]:
-        """행에서 세금계산서 데이터 추출"""
-        try:
-            cells = await row.query_selector_all('td')
-            if len(cells) < 6:
-                return None
-
-            return {
-                'issue_date': await cells[0].inner_text(),
-                'invoice_number': await cells[1].inner_text(),
-                'vendor_name': await cells[2].inner_text(),
-                'business_number': await cells[3].inner_text(),
-                'supply_amount': await cells[4].inner_text(),
-                'vat_amount': await cells[5].inner_text(),
-                'total_amount': await cells[6].inner_text() if len(cells) > 6 else '',
-                'element': row
-            }
-        except Exception as e:
-            logger.warning(f"데이터 추출 중 오류: {e}")
-            return None
+    async def fetch_tax_invoices(self) -> List[TaxInvoiceRecord]:
+        """미등록 전자세금계산서 조회 (전체 목록)"""
+        return [invoice async for invoice in self.iter_tax_invoices()]
+
+    def map_record(self, invoice: TaxInvoiceRecord) -> TaxInvoiceRecord:
+        """비목/세목 매핑 (파이프라인 매핑 단계, 금액 검증은 reconciliation에서 묶음 단위로)"""
+        invoice.budget = self.find_budget_mapping(
+            invoice.vendor_name,
+            ''  # 세금계산서에는 업종 정보가 없을 수 있음
+        )
+        return invoice
 
-    async def process_invoice(self, invoice: Dict[str, Any]) -> bool:
+    async def process_invoice(self, invoice: TaxInvoiceRecord) -> bool:
         """개별 세금계산서 집행등록"""
+        vendor = invoice.vendor_name or 'Unknown'
         try:
-            vendor = invoice.get('vendor_name', 'Unknown')
-            amount = invoice.get('total_amount', '0')
+            amount = invoice.total_amount
 
-            logger.info(f"처리 중: {vendor} / {amount}")
+            logger.info(f"처리 중: {vendor} / {amount:,}")
 
             # 해당 행 선택 (체크박스 또는 클릭)
-            row = invoice.get('element')
-            if row:
-                checkbox = await row.query_selector('input[type="checkbox"]')
-                if checkbox:
-                    await checkbox.check()
-                else:
-                    await row.click()
-
-                await self.page.wait_for_timeout(500)
-
-            # 집행등록 버튼 클릭
-            register_btn = await self.page.query_selector('button:has-text("집행등록")')
-            if register_btn:
-                await register_btn.click()
-                await self.page.wait_for_load_state('networkidle')
+            row = await self.reveal_row('tax_invoice', self.ROW_SELECTOR, invoice.row_key, invoice.grid_page)
+            checkbox = row.locator('input[type="checkbox"]')
+            if await checkbox.count():
+                await checkbox.first.check()
+            else:
+                await row.click()
+
+            await self.ready('invoice_select', replaces_ms=500)
+
+            # 집행등록 버튼 클릭 (건마다 ElementHandle을 남기지 않도록 Locator 사용)
+            register_btn = self.page.locator('button:has-text("집행등록")')
+            if await register_btn.count():
+                await self.throttle(ACTION_NAVIGATE)
+                await register_btn.first.click()
+                await self.ready('invoice_register', required=True)
 
             # 집행등록 화면에서 처리
             # 거래처 정보 자동 로딩 확인
-            vendor_name_field = await self.page.query_selector('input#vendorName, .vendor-name')
-            if vendor_name_field:
+            vendor_name_field = self.page.locator('input#vendorName, .vendor-name').first
+            if await vendor_name_field.count():
                 loaded_vendor = await vendor_name_field.input_value() if await vendor_name_field.get_attribute('type') else await vendor_name_field.inner_text()
                 logger.debug(f"거래처 정보 로딩됨: {loaded_vendor}")
 
-            # 비목/세목 자동 매핑
-            budget = self.find_budget_mapping(
-                invoice.get('vendor_name', ''),
-                ''  # 세금계산서에는 업종 정보가 없을 수 있음
-            )
+            # 비목/세목 자동 매핑 (파이프라인 매핑 단계에서 미리 계산)
+            budget = invoice.budget or self.map_record(invoice).budget
 
             # 비목 선택
             await self._select_budget_item(budget['item'])
 
             # 재원구분 선택
-            funding_select = await self.page.query_selector('select#fundingType, select[name="fundingType"]')
-            if funding_select:
-                await funding_select.select_option(label=budget['funding'])
-
-            # 금액 검증
-            supply = self._parse_amount(invoice.get('supply_amount', '0'))
-            vat = self._parse_amount(invoice.get('vat_amount', '0'))
-            total = self._parse_amount(invoice.get('total_amount', '0'))
-
-            if total > 0 and supply + vat != total:
-                logger.warning(f"금액 불일치: {supply} + {vat} != {total}")
-                # 경고만 하고 계속 진행
+            await self._select_funding_type(budget['funding'])
 
             # 저장
+            await self.throttle(ACTION_SAVE)
             await self.page.click('button:has-text("저장"), button.save-btn')
-            await self.page.wait_for_load_state('networkidle')
+            await self.ready('invoice_save', required=True)
 
             # 성공 확인
-            success_msg = await self.page.query_selector('.success-message, .alert-success')
-            error_msg = await self.page.query_selector('.error-message, .alert-danger')
-
-            if error_msg:
-                error_text = await error_msg.inner_text()
+            error_msg = self.page.locator('.error-message, .alert-danger')
+            if await error_msg.count():
+                error_text = await error_msg.first.inner_text()
                 self.logger.log_item(vendor, "FAILURE", error_text)
                 return False
 
-            self.logger.log_item(vendor, "SUCCESS", f"집행등록 완료 ({amount})")
+            self.logger.log_item(vendor, "SUCCESS", f"집행등록 완료 ({amount:,})")
             return True
 
         except Exception as e:
-            self.logger.log_item(invoice.get('vendor_name', 'Unknown'), "FAILURE", str(e))
-            await self.browser_manager.screenshot(f"process_error_{invoice.get('invoice_number', 'unknown')}")
+            if is_transient(e):
+                raise  # with_retry에서 재시도
+            self.logger.log_item(vendor, "FAILURE", str(e))
+            await self.browser_manager.screenshot(f"process_error_{invoice.invoice_number or 'unknown'}")
             return False
 
-    async def _select_budget_item(self, budget_item: str):
-        """비목 선택"""
-        try:
-            budget_select = await self.page.query_selector('select#budgetItem, select[name="budgetItem"]')
-            if not budget_select:
-                return
-
-            options = await self.page.query_selector_all('select#budgetItem option')
-            for option in options:
-                text = await option.inner_text()
-                if budget_item in text:
-                    value = await option.get_attribute('value')
-                    await self.page.select_option('select#budgetItem', value=value)
-                    return
-
-            # 기본값
-            for option in options:
-                text = await option.inner_text()
-                if '기타' in text:
-                    value = await option.get_attribute('value')
-                    await self.page.select_option('select#budgetItem', value=value)
-                    return
-
-        except Exception as e:
-            logger.error(f"비목 선택 중 오류: {e}")
-
-    def _parse_amount(self, amount_str: str) -> int:
-        """금액 문자열을 정수로 변환"""
-        try:
-            # 콤마, 원 등 제거
-            cleaned = amount_str.replace(',', '').replace('원', '').replace(' ', '').strip()
-            return int(cleaned) if cleaned else 0
-        except:
-            return 0
-
     async def batch_execution_request(self) -> bool:
         """일괄 집행요청"""
         try:
@@ -199,8 +175,9 @@ class TaxInvoiceAutomation(BotameAutomation):
             if status_select:
                 await status_select.select_option(label='미요청')
 
+            await self.throttle(ACTION_SUBMIT)
             await self.page.click('button:has-text("조회")')
-            await self.page.wait_for_load_state('networkidle')
+            await self.ready('execution', required=True)
 
             # 전체 선택
             select_all = await self.page.query_selector('input.select-all, input#selectAll')
@@ -208,6 +185,7 @@ class TaxInvoiceAutomation(BotameAutomation):
                 await select_all.check()
 
             # 집행요청 버튼
+            await self.throttle(ACTION_SUBMIT)
             await self.page.click('button:has-text("집행요청")')
 
             # 확인
@@ -215,56 +193,56 @@ class TaxInvoiceAutomation(BotameAutomation):
             if confirm:
                 await confirm.click()
 
-            await self.page.wait_for_load_state('networkidle')
+            await self.ready('execution_request', required=True)
             logger.success("일괄 집행요청 완료")
             return True
 
         except Exception as e:
+            if is_transient(e):
+                raise  # with_retry에서 재시도
             logger.error(f"일괄 집행요청 중 오류: {e}")
             return False
 
-    async def run(self) -> Dict[str, Any]:
-        """자동화 실행"""
+    async def run(self, session: Optional[BotameSession] = None) -> Dict[str, Any]:
+        """자동화 실행
+
+        Args:
+            session: 공유 세션 (없으면 브라우저를 직접 시작/종료)
+        """
         self.logger.log_start({
             'fiscal_year': self.fiscal_year,
             'project_code': self.project_code,
-            'max_items': self.max_items
+            'max_items': self.max_items,
+            'max_workers': self.max_workers
         })
 
         results = {
             'status': 'STARTED',
             'processed': 0,
             'success': 0,
-            'failure': 0
+            'failure': 0,
+            'skipped': 0
         }
 
-        try:
-            await self.start()
-
-            if not await self.login():
-                results['status'] = 'LOGIN_FAILED'
-                return results
+        # 이전 실행 처리 기록 (저장/요청 완료 건은 건너뜀)
+        self.open_journal()
 
-            if not await self.select_project():
-                results['status'] = 'PROJECT_SELECT_FAILED'
+        try:
+            failure = await self.prepare(session)
+            if failure:
+                results['status'] = failure
                 return results
 
-            invoices = await self.fetch_tax_invoices()
-            if not invoices:
+            await self.process_records(self.iter_tax_invoices(), 'process_invoice', results)
+            # 이전 실행에서 저장 후 집행요청 전에 중단된 건과 앞 자동화가 넘긴 집행요청 포함
+            pending_request = self.journal_pending_request() or self.deferred_requests()
+            if results['processed'] == 0 and not pending_request:
                 results['status'] = 'NO_RECORDS'
                 logger.info("처리할 세금계산서가 없습니다")
                 return results
 
-            for invoice in invoices:
-                success = await self.process_invoice(invoice)
-                results['processed'] += 1
-                if success:
-                    results['success'] += 1
-                else:
-                    results['failure'] += 1
-
-            if results['success'] > 0:
-                await self.batch_execution_request()
+            if results['success'] > 0 or pending_request:
+                await self.request_execution(results)
 
             results['status'] = 'COMPLETED'
 
@@ -274,6 +252,10 @@ class TaxInvoiceAutomation(BotameAutomation):
             results['error'] = str(e)
 
         finally:
+            results['retry'] = self.retry.summary()
+            results['rate_limit'] = self.rate_limiter.summary()
+            results['screens'] = self.screens.summary()
+            self.close_journal()
             await self.stop()
             self.logger.log_end()
 
@@ -1,9 +1,51 @@
 """집행이체 일괄처리 자동화"""
-from typing import Dict, Any, List
+from collections import Counter
+from typing import Dict, Any, List, Optional
 from loguru import logger
 
 from .botame import BotameAutomation
 from .config import config
+from .navigation import TRANSFER_MENU
+from .rate_limiter import ACTION_SUBMIT
+from .records import TransferRecord
+from .session import BotameSession
+
+
+# 이체 결과 일괄 추출 스크립트 ([상태, 거래처, 집행번호] 목록, 셀이 없으면 null)
+RESULT_EXTRACT_SCRIPT = """
+({rowSelector, statusSelector, vendorSelector, keySelector}) => {
+    const text = (row, selector) => {
+        const cell = row.querySelector(selector);
+        return cell ? cell.innerText : null;
+    };
+    return Array.from(document.querySelectorAll(rowSelector)).map(row => [
+        text(row, statusSelector), text(row, vendorSelector), text(row, keySelector)
+    ]);
+}
+"""
+
+
+def is_transfer_success(status: str) -> bool:
+    return '성공' in status or '완료' in status
+
+
+def succeeded_transfers(transfers: List[TransferRecord], details: List[Dict[str, Any]]) -> List[TransferRecord]:
+    """결과 화면에서 이체 성공이 확인된 건
+
+    결과 행에 집행번호가 있으면 집행번호로 맞춘다. 없으면 거래처로만 구분할 수 있으므로
+    거래처의 성공 건수가 그 거래처 이체 건수와 같을 때만(전부 성공) 성공으로 본다.
+    """
+    keyed = [detail for detail in details if detail.get('key')]
+    if keyed:
+        succeeded = {detail['key'].strip() for detail in keyed if is_transfer_success(detail['status'])}
+        return [transfer for transfer in transfers if transfer.row_key in succeeded]
+
+    successes = Counter(detail['vendor'].strip() for detail in details if is_transfer_success(detail['status']))
+    counts = Counter(transfer.vendor_name for transfer in transfers)
+    return [
+        transfer for transfer in transfers
+        if successes[transfer.vendor_name] and successes[transfer.vendor_name] == counts[transfer.vendor_name]
+    ]
 
 
 class TransferAutomation(BotameAutomation):
@@ -15,18 +57,28 @@ class TransferAutomation(BotameAutomation):
     - 이체 실행 후 결과 확인: 자동화
     """
 
+    # 이체 대기 그리드 (셀렉터는 실제 화면에 맞게 수정 필요)
+    ROW_SELECTOR = 'tr.transfer-row, .transfer-item'
+    COLUMNS = [
+        'execution_number', 'vendor_name', 'bank_name', 'account_number',
+        'amount', 'budget_item', 'request_date'
+    ]
+    # 결과 화면 행/셀 (셀렉터는 실제 화면에 맞게 수정 필요)
+    RESULT_ROW_SELECTOR = '.result-row, .transfer-result-item'
+    RESULT_STATUS_SELECTOR = '.result-status, td.status'
+    RESULT_VENDOR_SELECTOR = '.vendor-name, td:nth-child(2)'
+    RESULT_KEY_SELECTOR = '.execution-number, td.execution-number'
+
     def __init__(self):
         super().__init__("집행이체_일괄처리")
         self.max_items = config.get('automation.transfer.max_items', 30)
         self.wait_for_auth_timeout = config.get('automation.transfer.auth_timeout', 120000)
 
-    async def fetch_pending_transfers(self) -> List[Dict[str, Any]]:
-        """이체 대기 건 조회"""
-        transfers = []
-
+    async def open_record_screen(self) -> bool:
+        """집행이체관리 화면에서 미이체 건 조회"""
         try:
             # 집행관리 > 집행이체관리 메뉴 이동
-            await self.navigate_to_menu(['집행관리', '집행이체관리'])
+            await self.open_screen(TRANSFER_MENU)
 
             # 조회 조건 설정
             await self.page.select_option('select#fiscalYear', self.fiscal_year)
@@ -37,24 +89,45 @@ class TransferAutomation(BotameAutomation):
                 await status_select.select_option(label='미이체')
 
             # 조회 버튼 클릭
+            await self.throttle(ACTION_SUBMIT)
             await self.page.click('button:has-text("조회")')
-            await self.page.wait_for_load_state('networkidle')
+            await self.ready('transfer', grid=self.ROW_SELECTOR, required=True)
+            return True
 
-            # 이체 대기 목록 추출
-            rows = await self.page.query_selector_all('tr.transfer-row, .transfer-item')
+        except Exception as e:
+            logger.error(f"이체 화면 조회 중 오류: {e}")
+            await self.browser_manager.screenshot("open_transfer_screen_error")
+            return False
 
-            for row in rows[:self.max_items]:
+    async def fetch_pending_transfers(self) -> List[TransferRecord]:
+        """이체 대기 건 조회 (모든 페이지, 최대 max_items건)"""
+        transfers = []
+
+        try:
+            # 이체 대기 목록 조회 (응답 캡처 또는 DOM 추출)
+            async for row in self.iter_grid(
+                'transfer',
+                self.ROW_SELECTOR,
+                self.COLUMNS,
+                key_column='execution_number',
+                min_cells=7,
+                status_selectors={'transfer_status': '.transfer-status, td.status'}
+            ):
                 # 이체 가능 여부 확인
-                status_cell = await row.query_selector('.transfer-status, td.status')
-                if status_cell:
-                    status_text = await status_cell.inner_text()
-                    if '완료' in status_text or '이체됨' in status_text:
-                        continue
+                status_text = row.pop('transfer_status', None)
+                if status_text and ('완료' in status_text or '이체됨' in status_text):
+                    continue
 
-                # 데이터 추출
-                transfer = await self._extract_transfer_data(row)
-                if transfer:
-                    transfers.append(transfer)
+                # 이전 실행에서 이체를 마친 건 (화면 상태 반영 전일 수 있음)
+                if self.journal and self.journal.is_done(row['row_key'], 'requested'):
+                    logger.debug(f"이전 실행에서 이체 완료 - 건너뜀: {row['row_key']}")
+                    continue
+
+                transfer = TransferRecord.from_row(row)
+                self.journal_mark(transfer, 'fetched')
+                transfers.append(transfer)
+                if self.max_items and len(transfers) >= self.max_items:
+                    break
 
             logger.info(f"이체 대기건 {len(transfers)}건 조회 완료")
             return transfers
@@ -64,39 +137,17 @@ class TransferAutomation(BotameAutomation):
             await self.browser_manager.screenshot("fetch_transfer_error")
             return transfers
 
-    async def _extract_transfer_data(self, row) -> Dict[str, Any]:
-        """행에서 이체 데이터 추출"""
-        try:
-            cells = await row.query_selector_all('td')
-            if len(cells) < 7:
-                return None
-
-            return {
-                'execution_number': await cells[0].inner_text(),
-                'vendor_name': await cells[1].inner_text(),
-                'bank_name': await cells[2].inner_text(),
-                'account_number': await cells[3].inner_text(),
-                'amount': await cells[4].inner_text(),
-                'budget_item': await cells[5].inner_text(),
-                'request_date': await cells[6].inner_text() if len(cells) > 6 else '',
-                'element': row
-            }
-        except Exception as e:
-            logger.warning(f"데이터 추출 중 오류: {e}")
-            return None
-
-    async def select_transfers(self, transfers: List[Dict[str, Any]]) -> int:
+    async def select_transfers(self, transfers: List[TransferRecord]) -> int:
         """이체 대상 선택"""
         selected = 0
         try:
             for transfer in transfers:
-                row = transfer.get('element')
-                if row:
-                    checkbox = await row.query_selector('input[type="checkbox"]')
-                    if checkbox:
-                        await checkbox.check()
-                        selected += 1
-                        logger.debug(f"선택: {transfer.get('vendor_name')} / {transfer.get('amount')}")
+                row = await self.reveal_row('transfer', self.ROW_SELECTOR, transfer.row_key, transfer.grid_page)
+                checkbox = row.locator('input[type="checkbox"]')
+                if await checkbox.count():
+                    await checkbox.first.check()
+                    selected += 1
+                    logger.debug(f"선택: {transfer.vendor_name} / {transfer.amount:,}")
 
             logger.info(f"이체 대상 {selected}건 선택 완료")
             return selected
@@ -111,8 +162,9 @@ class TransferAutomation(BotameAutomation):
             # 일괄이체 버튼 클릭
             transfer_btn = await self.page.query_selector('button:has-text("일괄이체"), button:has-text("이체실행")')
             if transfer_btn:
+                await self.throttle(ACTION_SUBMIT)
                 await transfer_btn.click()
-                await self.page.wait_for_load_state('networkidle')
+                await self.ready('transfer_request', required=True)
 
             # 이체 확인 팝업
             confirm_btn = await self.page.query_selector('button:has-text("확인"), .confirm-btn')
@@ -158,7 +210,7 @@ class TransferAutomation(BotameAutomation):
             logger.error(f"인증 대기 중 오류: {e}")
             return False
 
-    async def verify_transfer_result(self, transfers: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def verify_transfer_result(self, transfers: List[TransferRecord]) -> Dict[str, Any]:
         """이체 결과 확인"""
         result = {
             'total': len(transfers),
@@ -168,20 +220,19 @@ class TransferAutomation(BotameAutomation):
         }
 
         try:
-            await self.page.wait_for_load_state('networkidle')
-
-            # 결과 화면에서 각 건별 상태 확인
-            result_rows = await self.page.query_selector_all('.result-row, .transfer-result-item')
-
-            for row in result_rows:
-                status_cell = await row.query_selector('.result-status, td.status')
-                vendor_cell = await row.query_selector('.vendor-name, td:nth-child(2)')
-
-                if status_cell and vendor_cell:
-                    status = await status_cell.inner_text()
-                    vendor = await vendor_cell.inner_text()
-
-                    if '성공' in status or '완료' in status:
+            await self.ready('transfer_result')
+
+            # 결과 화면에서 각 건별 상태 확인 (행마다 ElementHandle을 만들지 않고 한 번에 읽음)
+            result_rows = await self.page.evaluate(RESULT_EXTRACT_SCRIPT, {
+                'rowSelector': self.RESULT_ROW_SELECTOR,
+                'statusSelector': self.RESULT_STATUS_SELECTOR,
+                'vendorSelector': self.RESULT_VENDOR_SELECTOR,
+                'keySelector': self.RESULT_KEY_SELECTOR
+            })
+
+            for status, vendor, key in result_rows:
+                if status is not None and vendor is not None:
+                    if is_transfer_success(status):
                         result['success'] += 1
                         self.logger.log_item(vendor, "SUCCESS", "이체 완료")
                     else:
@@ -190,7 +241,8 @@ class TransferAutomation(BotameAutomation):
 
                     result['details'].append({
                         'vendor': vendor,
-                        'status': status
+                        'status': status,
+                        'key': key
                     })
 
             # 결과 요약 로그
@@ -201,11 +253,17 @@ class TransferAutomation(BotameAutomation):
             logger.error(f"결과 확인 중 오류: {e}")
             return result
 
-    async def run(self, auto_auth: bool = False) -> Dict[str, Any]:
+    def _journal_transferred(self, transfers: List[TransferRecord], details: List[Dict[str, Any]]):
+        """결과 화면에서 성공으로 확인된 이체 건을 완료로 기록 (실패 건은 다음 실행에서 다시 처리)"""
+        for transfer in succeeded_transfers(transfers, details):
+            self.journal_mark(transfer, 'requested')
+
+    async def run(self, auto_auth: bool = False, session: Optional[BotameSession] = None) -> Dict[str, Any]:
         """자동화 실행
 
         Args:
             auto_auth: True면 인증 대기 없이 진행 (테스트용)
+            session: 공유 세션 (없으면 브라우저를 직접 시작/종료)
         """
         self.logger.log_start({
             'fiscal_year': self.fiscal_year,
@@ -222,15 +280,13 @@ class TransferAutomation(BotameAutomation):
             'failure': 0
         }
 
-        try:
-            await self.start()
+        # 이전 실행 처리 기록 (이체 완료 건은 건너뜀)
+        self.open_journal()
 
-            if not await self.login():
-                results['status'] = 'LOGIN_FAILED'
-                return results
-
-            if not await self.select_project():
-                results['status'] = 'PROJECT_SELECT_FAILED'
+        try:
+            failure = await self.prepare(session)
+            if failure:
+                results['status'] = failure
                 return results
 
             # 이체 대기건 조회
@@ -264,6 +320,7 @@ class TransferAutomation(BotameAutomation):
             results['transferred'] = transfer_result['total']
             results['success'] = transfer_result['success']
             results['failure'] = transfer_result['failure']
+            self._journal_transferred(transfers, transfer_result['details'])
             results['status'] = 'COMPLETED'
 
         except Exception as e:
@@ -272,6 +329,10 @@ class TransferAutomation(BotameAutomation):
             results['error'] = str(e)
 
         finally:
+            results['retry'] = self.retry.summary()
+            results['rate_limit'] = self.rate_limiter.summary()
+            results['screens'] = self.screens.summary()
+            self.close_journal()
             await self.stop()
             self.logger.log_end()
 
@@ -0,0 +1,61 @@
+"""증분 조회 워터마크 모듈
+
+자동화/회계연도/보조사업별로 "이 일자까지는 모두 처리됨"을 나타내는 워터마크를
+처리 기록(journal) DB에 남기고, 다음 실행에서는 워터마크에서 overlap_days를 뺀
+일자부터만 조회 조건에 넣어 서버가 변경분만 돌려주게 한다. 카드 승인 내역처럼
+늦게 들어오는 건은 overlap 구간에서 다시 걸리고, 이미 처리한 건은 기존대로
+사이트의 사용여부/처리 기록으로 걸러진다.
+
+워터마크는 조회를 끝까지 마친 실행에서만 올리며, 처리하지 못한 건이 있으면
+그중 가장 이른 일자까지만 올린다. 뒤로 내리지는 않는다.
+"""
+from collections import Counter
+from datetime import date, timedelta
+from typing import Optional
+
+
+def search_start(watermark: Optional[date], overlap_days: int, fiscal_year: str) -> Optional[date]:
+    """조회 시작일 (워터마크 - overlap_days, 회계연도 시작일 이전이면 회계연도 시작일)"""
+    if watermark is None:
+        return None
+    start = watermark - timedelta(days=overlap_days)
+    try:
+        return max(start, date(int(fiscal_year), 1, 1))
+    except ValueError:
+        return start
+
+
+class WatermarkTracker:
+    """이번 실행에서 조회/처리한 레코드 일자로 다음 워터마크 계산"""
+
+    def __init__(self, previous: Optional[date] = None):
+        self.previous = previous
+        self.latest: Optional[date] = None
+        self._pending: Counter = Counter()  # 일자별 미처리 건수
+
+    def fetched(self, value: Optional[date]):
+        """조회 단계에 넘긴 레코드"""
+        if value is None:
+            return
+        self.latest = max(self.latest, value) if self.latest else value
+        self._pending[value] += 1
+
+    def settled(self, value: Optional[date]):
+        """저장 성공 또는 이전 실행에서 처리 완료"""
+        if value is not None and self._pending[value] > 0:
+            self._pending[value] -= 1
+
+    @property
+    def earliest_pending(self) -> Optional[date]:
+        pending = [value for value, count in self._pending.items() if count > 0]
+        return min(pending) if pending else None
+
+    def next_value(self, complete: bool) -> Optional[date]:
+        """다음 워터마크 (complete: 조회 조건 범위를 끝까지 읽었는지)"""
+        if not complete:
+            return self.previous  # 읽지 않은 행의 일자를 알 수 없음
+
+        candidate = self.earliest_pending or self.latest
+        if candidate is None:
+            return self.previous
+        return max(self.previous, candidate) if self.previous else candidate
@@ -0,0 +1,132 @@
+"""여러 보조사업 일괄 실행 테스트 (브라우저 없이 가짜 세션/실행 함수 사용)"""
+import asyncio
+
+import pytest
+
+from src.batch import BatchRunner, load_targets, parse_target, result_counts, target_status
+
+from .test_session import Automation, logged_in_session
+
+
+class FakeSession:
+    def __init__(self, name='main', fail_spawn=False):
+        self.name = name
+        self.fail_spawn = fail_spawn
+        self.project = None
+        self.closed = False
+        self.workers = []
+
+    async def spawn_worker(self, worker_id, automation):
+        if self.fail_spawn:
+            raise RuntimeError('컨텍스트 생성 실패')
+        worker = FakeSession(f'w{worker_id}')
+        self.workers.append(worker)
+        return worker
+
+    async def close(self):
+        self.closed = True
+
+
+def make_runner(calls):
+    async def runner(params, session):
+        target = (params['fiscal_year'], params['project_code'])
+        # 세션이 다른 보조사업을 선택하고 있으면 보조사업만 전환 (prepare와 같은 규칙)
+        switched = session.project != target
+        session.project = target
+        calls.append((session.name, target, switched))
+        await asyncio.sleep(0.01)
+        if params['project_code'] == 'BAD':
+            raise RuntimeError('보조사업 선택 실패')
+        return {'status': 'COMPLETED', 'processed': 2, 'success': 2, 'failure': 0}
+    return runner
+
+
+def test_load_targets_formats(tmp_path):
+    """목록/명령행/파일의 대상을 (회계연도, 코드)로 변환하고 중복 제거"""
+    assert parse_target({'fiscal_year': 2024, 'project_code': '2024-001'}) == ('2024', '2024-001')
+    assert parse_target('2024-002', fiscal_year='2025') == ('2025', '2024-002')
+    assert load_targets('2024:A-1,2024:A-2,2024:A-1') == [('2024', 'A-1'), ('2024', 'A-2')]
+
+    path = tmp_path / 'targets.txt'
+    path.write_text('fiscal_year,project_code\n2024,A-1\n\n# 제외\nA-3  # 기본 회계연도\n', encoding='utf-8')
+    assert load_targets(str(path), fiscal_year='2023') == [('2024', 'A-1'), ('2023', 'A-3')]
+
+    with pytest.raises(ValueError):
+        parse_target('A-1')  # 회계연도 없음
+
+
+def test_batch_switches_projects_in_one_session():
+    """동시 실행 1이면 메인 세션 하나에서 보조사업만 바꿔 가며 대상 순서대로 실행"""
+    calls = []
+    session = FakeSession()
+    targets = [('2024', 'A'), ('2024', 'BAD'), ('2025', 'A')]
+    summary = asyncio.run(BatchRunner(make_runner(calls), {'type': 'card'}, targets).run(session))
+
+    assert [call[1] for call in calls] == targets
+    assert {call[0] for call in calls} == {'main'} and all(call[2] for call in calls)
+    assert not session.closed  # 호출한 쪽의 세션은 닫지 않음
+
+    assert summary['status'] == 'PARTIAL'
+    assert summary['failed'] == ['2024 / BAD']
+    assert summary['projects']['2024 / BAD']['status'] == 'ERROR'
+    assert (summary['processed'], summary['success']) == (4, 4)
+
+
+def test_batch_parallel_contexts():
+    """동시 실행 수만큼 컨텍스트를 만들어 공용 대기열의 대상을 나눠 처리하고 끝나면 닫음"""
+    calls = []
+    session = FakeSession()
+    targets = [('2024', f'P{index}') for index in range(5)]
+    runner = BatchRunner(make_runner(calls), {'type': 'tax'}, targets, parallel=3)
+    runner.warm_up = lambda session: asyncio.sleep(0)
+    summary = asyncio.run(runner.run(session))
+
+    assert sorted(call[1] for call in calls) == targets
+    assert {call[0] for call in calls} == {'main', 'w1', 'w2'}
+    assert all(worker.closed for worker in session.workers)
+    assert summary['status'] == 'COMPLETED' and summary['parallel'] == 3
+    assert list(summary['projects']) == [f'2024 / P{index}' for index in range(5)]
+
+    # 컨텍스트를 만들지 못하면 메인 세션이 모든 대상을 처리
+    calls.clear()
+    failing = BatchRunner(make_runner(calls), {'type': 'tax'}, targets[:2], parallel=2)
+    failing.warm_up = lambda session: asyncio.sleep(0)
+    assert asyncio.run(failing.run(FakeSession(fail_spawn=True)))['status'] == 'COMPLETED'
+    assert [call[0] for call in calls] == ['main', 'main']
+
+
+def test_batch_lanes_prepare_spawned_contexts():
+    """복사한 컨텍스트도 보탬e 접속/로그인 확인 후 보조사업을 선택해 대상을 완료"""
+    async def runner(params, session):
+        automation = Automation()
+        automation.fiscal_year, automation.project_code = params['fiscal_year'], params['project_code']
+        await asyncio.sleep(0.01)
+        return {'status': await automation.prepare(session) or 'COMPLETED'}
+
+    session = logged_in_session()
+    pages = []  # 복사한 컨텍스트의 페이지 (세션은 끝나면 닫힘)
+    spawn_worker = session.spawn_worker
+
+    async def track(worker_id, automation):
+        worker = await spawn_worker(worker_id, automation)
+        pages.append(worker.page)
+        return worker
+
+    session.spawn_worker = track
+    batch = BatchRunner(runner, {'type': 'card'}, [('2024', 'A-1'), ('2024', 'B-2')], parallel=2)
+    summary = asyncio.run(batch.run(session))
+
+    assert summary['status'] == 'COMPLETED'
+    assert sorted(project['lane'] for project in summary['projects'].values()) == [0, 1]
+    assert pages[0].calls[:2] == ['goto', 'select_project']
+
+
+def test_all_results_status_and_counts():
+    """all 실행 결과는 자동화별 건수를 합하고 완료되지 않은 자동화의 상태를 씀"""
+    result = {
+        'card': {'status': 'COMPLETED', 'processed': 3, 'success': 3, 'failure': 0},
+        'tax': {'status': 'PARTIAL', 'processed': 2, 'success': 1, 'failure': 1},
+        'navigation': {'order': ['card', 'tax']}
+    }
+    assert target_status(result) == 'PARTIAL'
+    assert result_counts(result) == {'processed': 5, 'success': 4, 'failure': 1}
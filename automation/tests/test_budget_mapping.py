@@ -0,0 +1,78 @@
+"""비목/세목 매핑 테스트"""
+import random
+
+from src.budget_mapping import BudgetMatcher
+from src.config import config
+
+
+RULES = [
+    {'vendor_type': '음식점', 'budget_item': '업무추진비', 'funding_type': '시도비'},
+    {'vendor_name_contains': '문구', 'budget_item': '사무용품비', 'funding_type': '시도비'},
+    {'vendor_type': '주유소', 'budget_item': '차량유지비', 'funding_type': '시도비'},
+    {'vendor_name_contains': '음식', 'budget_item': '식비', 'funding_type': '자부담'},
+]
+DEFAULT = {'budget_item': '기타운영비', 'funding_type': '시도비'}
+
+
+def linear_match(rules, vendor_name, business_type):
+    """기존 선형 탐색 방식 (비교 기준)"""
+    for rule in rules:
+        if 'vendor_type' in rule and business_type and rule['vendor_type'] in business_type:
+            return {'item': rule['budget_item'], 'funding': rule['funding_type']}
+        if 'vendor_name_contains' in rule and vendor_name and rule['vendor_name_contains'] in vendor_name:
+            return {'item': rule['budget_item'], 'funding': rule['funding_type']}
+    return {'item': DEFAULT['budget_item'], 'funding': DEFAULT['funding_type']}
+
+
+def test_rule_precedence():
+    """먼저 적힌 규칙이 우선"""
+    matcher = BudgetMatcher(RULES, DEFAULT)
+    # 업종(규칙 0)과 거래처명(규칙 3)이 모두 일치 → 규칙 0
+    assert matcher.match('음식나라', '일반음식점')['item'] == '업무추진비'
+    # 거래처명 규칙 1이 업종 규칙 2보다 앞섬
+    assert matcher.match('알파문구', '주유소')['item'] == '사무용품비'
+
+
+def test_default_when_no_match():
+    """일치하는 규칙이 없으면 기본값"""
+    matcher = BudgetMatcher(RULES, DEFAULT)
+    assert matcher.match('한국전력', '전기') == {'item': '기타운영비', 'funding': '시도비'}
+    assert matcher.match('', '') == {'item': '기타운영비', 'funding': '시도비'}
+
+
+def test_normalized_matching():
+    """공백/전각 차이는 같은 거래처로 취급"""
+    matcher = BudgetMatcher(RULES, DEFAULT)
+    assert matcher.match('ＡＢＣ문구', '')['item'] == '사무용품비'
+    assert matcher.match(' 알파문구', '일반  소매') == matcher.match('알파문구 ', '일반 소매')
+    assert matcher.cache_info().misses == 2
+
+
+def test_same_result_as_linear_scan():
+    """설정 규칙 기준으로 기존 선형 탐색과 결과가 같음"""
+    rules = config.budget_mapping_rules
+    matcher = BudgetMatcher(rules, DEFAULT)
+    words = [r.get('vendor_type') or r.get('vendor_name_contains') for r in rules] + ['상사', '마트', '']
+
+    rng = random.Random(0)
+    for _ in range(500):
+        vendor = ''.join(rng.sample(words, 2))
+        business = rng.choice(words)
+        assert matcher.match(vendor, business) == linear_match(rules, vendor, business)
+
+
+def test_cache_reuse():
+    """같은 거래처는 캐시에서 조회"""
+    matcher = BudgetMatcher(RULES, DEFAULT, cache_size=8)
+    for _ in range(100):
+        matcher.match('알파문구', '소매')
+    info = matcher.cache_info()
+    assert info.misses == 1
+    assert info.hits == 99
+
+
+def test_result_is_copy():
+    """반환값을 수정해도 캐시된 결과에 영향 없음"""
+    matcher = BudgetMatcher(RULES, DEFAULT)
+    matcher.match('알파문구')['item'] = '변경'
+    assert matcher.match('알파문구')['item'] == '사무용품비'
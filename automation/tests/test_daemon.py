@@ -0,0 +1,146 @@
+"""상주 데몬 제어 소켓 테스트 (브라우저 없이 가짜 실행 함수 사용)"""
+import asyncio
+import json
+import socket
+
+import pytest
+from loguru import logger
+
+from src import daemon
+from src.config import config
+
+from .test_session import Automation, logged_in_session
+
+
+class FakeSession:
+    logged_in = True
+    project = None
+
+    async def close(self):
+        pass
+
+
+async def fake_runner(params, session):
+    logger.info(f"{params['type']} 실행")
+    if params['type'] == 'tax':
+        raise RuntimeError('실행 실패')
+    return {'status': 'COMPLETED', 'type': params['type']}
+
+
+def test_daemon_runs_queued_requests(tmp_path, monkeypatch):
+    """실행 요청은 차례로 처리되고 진행 로그와 결과/오류가 클라이언트로 전달됨"""
+    socket_path = str(tmp_path / 'daemon.sock')
+    monkeypatch.setattr(config, 'get', lambda key, default=None: socket_path if key == 'daemon.socket' else default)
+
+    async def scenario():
+        server = daemon.AutomationDaemon(fake_runner, ('card', 'tax'), session=FakeSession())
+        server.warm_up = lambda: asyncio.sleep(0)
+        task = asyncio.create_task(server.serve_forever())
+        while not daemon.is_running():
+            await asyncio.sleep(0.01)
+
+        events = []
+        results = await asyncio.gather(
+            daemon.call('run', {'type': 'card'}, lambda method, event: events.append(method)),
+            daemon.call('run', {'type': 'card'})
+        )
+        assert [result['status'] for result in results] == ['COMPLETED', 'COMPLETED']
+        assert events[0] == 'queued' and 'progress' in events
+
+        with pytest.raises(daemon.DaemonError) as failed:
+            await daemon.call('run', {'type': 'tax'})
+        assert failed.value.code == daemon.RUN_FAILED
+        with pytest.raises(daemon.DaemonError) as invalid:
+            await daemon.call('run', {'type': 'unknown'})
+        assert invalid.value.code == daemon.INVALID_PARAMS
+
+        assert (await daemon.call('status'))['completed'] == 2
+        await daemon.call('shutdown')
+        await task
+
+    asyncio.run(scenario())
+    assert not daemon.is_running()
+
+
+def test_daemon_keeps_valid_session_after_idle(tmp_path, monkeypatch):
+    """session_check_after가 지나도 사이트 세션이 유효하면 다시 로그인하지 않고, 페이지를 다시
+    불러와 사라진 보조사업 선택만 다시 수행"""
+    socket_path = str(tmp_path / 'daemon.sock')
+    settings = {'daemon.socket': socket_path, 'daemon.session_check_after': 0}
+    monkeypatch.setattr(config, 'get', lambda key, default=None: settings.get(key, default))
+
+    async def runner(params, session):
+        automation = Automation()
+        automation.fiscal_year, automation.project_code = '2024', 'A-1'  # 세션에 선택돼 있던 보조사업
+        return {'status': await automation.prepare(session) or 'COMPLETED'}
+
+    session = logged_in_session()
+
+    async def scenario():
+        server = daemon.AutomationDaemon(runner, ('card',), session=session)
+        server.warm_up = lambda: asyncio.sleep(0)
+        task = asyncio.create_task(server.serve_forever())
+        while not daemon.is_running():
+            await asyncio.sleep(0.01)
+        page = session.page
+        result = await daemon.call('run', {'type': 'card'})
+        await daemon.call('shutdown')
+        await task
+        return page, result
+
+    page, result = asyncio.run(scenario())
+    assert result['status'] == 'COMPLETED'
+    # 로그인 상태 확인(goto) 후 보조사업 선택 (로그인 폼 입력 없음)
+    assert page.calls == ['goto', 'select_project', 'fill', 'click']
+
+
+def test_control_socket_owner_only(tmp_path, monkeypatch):
+    """Unix 제어 소켓은 소유자 전용 디렉토리에 0600으로 만듦"""
+    socket_path = tmp_path / 'private' / 'daemon.sock'
+    monkeypatch.setattr(config, 'get', lambda key, default=None: str(socket_path) if key == 'daemon.socket' else default)
+
+    async def scenario():
+        server = daemon.AutomationDaemon(fake_runner, ('card',), session=FakeSession())
+        server.warm_up = lambda: asyncio.sleep(0)
+        task = asyncio.create_task(server.serve_forever())
+        while not daemon.is_running():
+            await asyncio.sleep(0.01)
+        modes = (socket_path.parent.stat().st_mode & 0o777, socket_path.stat().st_mode & 0o777)
+        await daemon.call('shutdown')
+        await task
+        return modes
+
+    assert asyncio.run(scenario()) == (0o700, 0o600)
+
+
+def test_tcp_endpoint_requires_token(tmp_path, monkeypatch):
+    """TCP 제어 포트는 토큰이 맞는 요청만 처리 (토큰 파일은 0600)"""
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+    token_path = tmp_path / 'daemon.token'
+    settings = {'daemon.socket': None, 'daemon.port': port, 'daemon.token_path': str(token_path)}
+    monkeypatch.setattr(config, 'get', lambda key, default=None: settings.get(key, default))
+    monkeypatch.delenv('BOTAME_DAEMON_TOKEN', raising=False)
+
+    async def scenario():
+        server = daemon.AutomationDaemon(fake_runner, ('card',), session=FakeSession())
+        server.warm_up = lambda: asyncio.sleep(0)
+        task = asyncio.create_task(server.serve_forever())
+        while not daemon.is_running():
+            await asyncio.sleep(0.01)
+
+        # 토큰 없는 요청 (다른 로컬 사용자/프로세스)
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(json.dumps({'jsonrpc': '2.0', 'id': 1, 'method': 'shutdown'}).encode() + b'\n')
+        rejected = json.loads(await reader.readline())
+        writer.close()
+
+        assert (await daemon.call('run', {'type': 'card'}))['status'] == 'COMPLETED'
+        await daemon.call('shutdown')
+        await task
+        return rejected
+
+    rejected = asyncio.run(scenario())
+    assert rejected['error']['code'] == daemon.UNAUTHORIZED
+    assert token_path.stat().st_mode & 0o777 == 0o600
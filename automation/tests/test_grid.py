@@ -0,0 +1,136 @@
+"""그리드 순회 테스트 (브라우저 없이 페이지/가상 스크롤을 흉내 내는 가짜 페이지 사용)"""
+import asyncio
+
+from src.botame import GRID_EXTRACT_SCRIPT, BotameAutomation
+from src.session import BotameSession
+
+from .test_session import Automation, FakeBrowserManager
+
+
+ROW_SELECTOR = 'tr.row'
+
+
+class GridLocator:
+    def __init__(self, page, selector, text=None):
+        self.page = page
+        self.selector = selector
+        self.text = text
+        self.first = self
+
+    def filter(self, has_text):
+        return GridLocator(self.page, self.selector, has_text)
+
+    async def count(self):
+        page = self.page
+        if self.selector == BotameAutomation.PAGER_NEXT_SELECTOR:
+            return int(page.index < len(page.pages) - 1)
+        if self.selector == BotameAutomation.PAGER_INDEX_SELECTOR:
+            return int(1 <= int(self.text) <= len(page.pages))
+        return int(self.text in page.visible())
+
+    async def click(self):
+        page = self.page
+        if self.selector == BotameAutomation.PAGER_NEXT_SELECTOR:
+            if not page.stuck:
+                page.index += 1
+        elif self.selector == BotameAutomation.PAGER_INDEX_SELECTOR:
+            page.index = int(self.text) - 1
+        page.view = 0
+        page.clicks.append(self.selector)
+
+
+class GridPage:
+    """페이지마다 가상 스크롤 화면(보이는 행 키 목록)을 가진 그리드
+
+    stuck이면 다음 페이지 버튼을 눌러도 같은 페이지가 다시 그려진다.
+    """
+
+    def __init__(self, pages, stuck=False):
+        self.pages = pages
+        self.stuck = stuck
+        self.index = 0
+        self.view = 0
+        self.clicks = []
+        self.url = 'https://botame.example/'
+
+    def visible(self):
+        return self.pages[self.index][self.view]
+
+    async def evaluate(self, script, arg):
+        if script == GRID_EXTRACT_SCRIPT:
+            return [{'row_key': key, 'row_index': index} for index, key in enumerate(self.visible())]
+        # 스크롤: [스크롤 영역 셀렉터, 맨 위로]
+        before = self.view
+        self.view = 0 if arg[1] else min(self.view + 1, len(self.pages[self.index]) - 1)
+        return self.view != before
+
+    def locator(self, selector):
+        return GridLocator(self, selector)
+
+    # 응답이 없으므로 응답 캡처 대신 DOM 일괄 추출로 읽음
+    def on(self, event, handler):
+        pass
+
+    def remove_listener(self, event, handler):
+        pass
+
+
+class GridAutomation(Automation):
+    async def open_record_screen(self):
+        return True
+
+
+def attached(page):
+    automation = GridAutomation()
+    session = BotameSession(FakeBrowserManager(page))
+    session.page = page
+    automation.attach(session)
+    return automation
+
+
+async def collect(automation):
+    return [
+        row async for row in automation.iter_grid('card_usage', ROW_SELECTOR, ['approval_number'], 'approval_number')
+    ]
+
+
+def test_iter_grid_stops_after_last_page():
+    """스크롤을 끝까지 내린 뒤 다음 페이지로 넘어가고, 다음 버튼이 없으면 종료"""
+    page = GridPage([[['A1', 'A2'], ['A2', 'A3']], [['B1']]])
+    automation = attached(page)
+    rows = asyncio.run(collect(automation))
+
+    assert [row['row_key'] for row in rows] == ['A1', 'A2', 'A3', 'B1']
+    assert page.clicks == [BotameAutomation.PAGER_NEXT_SELECTOR]
+    assert automation.grid_page == 2
+
+
+def test_iter_grid_stops_when_page_has_no_new_rows():
+    """다음 페이지로 넘어가도 새 행이 없으면 (같은 화면이 다시 그려지면) 반복하지 않고 종료"""
+    page = GridPage([[['A1', 'A2']], [['B1']]], stuck=True)
+    rows = asyncio.run(collect(attached(page)))
+
+    assert [row['row_key'] for row in rows] == ['A1', 'A2']
+    assert len(page.clicks) == 1
+
+
+def test_iter_grid_records_page_for_reveal_row():
+    """행마다 읽은 페이지 번호를 남기고, reveal_row는 그 번호로 이전 페이지로 돌아가 행을 찾음"""
+    page = GridPage([[['A1']], [['B1']], [['C1']]])
+    automation = attached(page)
+
+    async def scenario():
+        rows = await collect(automation)
+        pages = {row['row_key']: row['grid_page'] for row in rows}
+        assert pages == {'A1': 1, 'B1': 2, 'C1': 3}
+
+        row = await automation.reveal_row('card_usage', ROW_SELECTOR, 'A1', pages['A1'])
+        assert await row.count()
+        assert automation.grid_page == 1
+
+        # 현재 페이지의 행은 페이지를 옮기지 않고 바로 반환
+        clicks = len(page.clicks)
+        await automation.reveal_row('card_usage', ROW_SELECTOR, 'A1', pages['A1'])
+        assert len(page.clicks) == clicks
+
+    asyncio.run(scenario())
@@ -0,0 +1,83 @@
+"""그리드 응답 캡처 테스트"""
+import json
+
+from src.grid_capture import parse_payload, map_rows
+
+
+FIELDS = {'approval_number': 'APRV_NO', 'amount': 'USE_AMT', 'merchant_name': 'MRCH_NM'}
+
+
+def test_parse_json_dataset():
+    """JSON 응답에서 지정한 데이터셋 추출"""
+    body = json.dumps({
+        'dmParam': {'fyr': '2024'},
+        'dsList': [{'APRV_NO': '1001', 'USE_AMT': 12000, 'MRCH_NM': '김밥천국'}]
+    })
+    rows = parse_payload(body, 'dsList')
+    assert rows == [{'APRV_NO': '1001', 'USE_AMT': 12000, 'MRCH_NM': '김밥천국'}]
+
+
+def test_parse_json_without_dataset():
+    """데이터셋 미지정 시 첫 행 목록 사용"""
+    body = json.dumps({'result': {'rows': [{'APRV_NO': '1'}, {'APRV_NO': '2'}]}})
+    assert len(parse_payload(body)) == 2
+
+
+def test_parse_xml_rows():
+    """XML 응답의 row 요소 추출"""
+    body = """
+    <root>
+      <dataset id="dsList">
+        <row><col id="APRV_NO">1001</col><col id="USE_AMT">12000</col></row>
+        <row><col id="APRV_NO">1002</col><col id="USE_AMT">5000</col></row>
+      </dataset>
+    </root>
+    """
+    rows = parse_payload(body, 'dsList')
+    assert rows == [
+        {'APRV_NO': '1001', 'USE_AMT': '12000'},
+        {'APRV_NO': '1002', 'USE_AMT': '5000'}
+    ]
+
+
+def test_parse_unknown_format():
+    """알 수 없는 형식은 None"""
+    assert parse_payload('OK') is None
+    assert parse_payload('{broken') is None
+
+
+def test_map_rows_fields_and_key():
+    """응답 필드를 레코드 필드로 변환"""
+    rows = [{'APRV_NO': '1001', 'USE_AMT': 12000, 'MRCH_NM': '김밥천국'}]
+    records = map_rows(rows, FIELDS, key_column='approval_number')
+    assert records == [{
+        'row_index': 0,
+        'approval_number': '1001',
+        'amount': '12000',
+        'merchant_name': '김밥천국',
+        'row_key': '1001'
+    }]
+
+
+def test_map_rows_flags():
+    """상태 플래그는 값이 일치할 때만 설정"""
+    rows = [
+        {'APRV_NO': '1', 'USE_AMT': 1, 'MRCH_NM': 'a', 'REG_YN': 'Y'},
+        {'APRV_NO': '2', 'USE_AMT': 1, 'MRCH_NM': 'b', 'REG_YN': 'N'}
+    ]
+    flags = {'registered': {'field': 'REG_YN', 'value': 'Y'}}
+    records = map_rows(rows, FIELDS, flags, key_column='approval_number')
+    assert records[0]['registered'] == 'Y'
+    assert records[1]['registered'] is None
+
+
+def test_map_rows_missing_field_falls_back():
+    """설정된 필드가 응답에 없으면 None (DOM 추출로 대체)"""
+    rows = [{'APRV_NO': '1001'}]
+    assert map_rows(rows, FIELDS, key_column='approval_number') is None
+
+
+def test_map_rows_limit():
+    """최대 행 수 제한"""
+    rows = [{'APRV_NO': str(i), 'USE_AMT': 1, 'MRCH_NM': 'a'} for i in range(10)]
+    assert len(map_rows(rows, FIELDS, key_column='approval_number', limit=3)) == 3
@@ -0,0 +1,70 @@
+"""처리 기록 저널 테스트"""
+from src.journal import RecordJournal
+
+
+def make_journal(tmp_path, scope='2024/P001', batch_size=100):
+    return RecordJournal(str(tmp_path / 'journal.db'), '카드사용내역_집행등록', scope,
+                         batch_size=batch_size, flush_interval=3600).open()
+
+
+def test_resume_after_reopen(tmp_path):
+    """닫았다 다시 열면 기록된 단계가 복원됨"""
+    journal = make_journal(tmp_path)
+    journal.mark('1001', 'fetched')
+    journal.mark('1001', 'mapped', '업무추진비')
+    journal.mark('1001', 'saved')
+    journal.mark('1002', 'mapped')
+    journal.close()
+
+    journal = make_journal(tmp_path)
+    assert journal.is_done('1001')
+    assert not journal.is_done('1002')
+    assert not journal.is_done('1003')
+    assert journal.keys('saved') == ['1001']
+
+
+def test_state_never_moves_back(tmp_path):
+    """이전 단계로 되돌리지 않음"""
+    journal = make_journal(tmp_path)
+    journal.mark('1001', 'requested')
+    journal.mark('1001', 'fetched')
+    assert journal.state('1001') == 'requested'
+
+
+def test_advance_saved_to_requested(tmp_path):
+    """일괄 집행요청 후 saved → requested"""
+    journal = make_journal(tmp_path)
+    journal.mark('1001', 'saved')
+    journal.mark('1002', 'saved')
+    journal.mark('1003', 'mapped')
+    assert journal.advance('saved', 'requested') == 2
+    assert journal.is_done('1001', 'requested')
+    assert journal.state('1003') == 'mapped'
+
+
+def test_writes_are_batched(tmp_path):
+    """조회/매핑 단계는 batch_size건이 모일 때까지 DB에 쓰지 않음"""
+    journal = make_journal(tmp_path, batch_size=3)
+    journal.mark('1', 'fetched')
+    journal.mark('2', 'mapped')
+    assert make_journal(tmp_path).states == {}
+    journal.mark('3', 'fetched')
+    assert len(make_journal(tmp_path).states) == 3
+
+
+def test_saved_and_requested_written_immediately(tmp_path):
+    """등록/집행요청한 건은 바로 저장 (닫지 않고 종료돼도 다시 등록하지 않음)"""
+    journal = make_journal(tmp_path)
+    journal.mark('1', 'fetched')
+    journal.mark('2', 'saved')
+    assert make_journal(tmp_path).states == {'1': 'fetched', '2': 'saved'}
+    journal.mark('2', 'requested')
+    assert make_journal(tmp_path).state('2') == 'requested'
+
+
+def test_scope_isolation(tmp_path):
+    """보조사업이 다르면 기록을 공유하지 않음"""
+    journal = make_journal(tmp_path, scope='2024/P001')
+    journal.mark('1001', 'saved')
+    journal.close()
+    assert make_journal(tmp_path, scope='2024/P002').states == {}
@@ -0,0 +1,53 @@
+"""메뉴 경로 캐시 테스트"""
+from src.menu_routes import MenuRoutes, program_from_urls, route_key
+
+CARD_MENU = ['금융정보관리', '보조금카드관리', '보조금전용카드사용내역관리']
+PATTERN = r'/([\w/-]+)\.clx'
+
+
+def test_program_from_urls_takes_last_screen():
+    """마지막으로 요청된 화면 앱의 프로그램 ID"""
+    urls = [
+        'https://www.losims.go.kr/ui/lss/com/menu.clx.js',
+        'https://www.losims.go.kr/lss/common/select.do',
+        'https://www.losims.go.kr/ui/lss/fin/FINC0301.clx.js?v=1',
+    ]
+    assert program_from_urls(urls, PATTERN) == 'ui/lss/fin/FINC0301'
+    assert program_from_urls(['https://www.losims.go.kr/lss.do'], PATTERN) is None
+
+
+def test_routes_persist(tmp_path):
+    """학습한 경로는 파일에 저장되고 다시 읽힘"""
+    path = str(tmp_path / 'routes.json')
+    routes = MenuRoutes(path)
+    routes.record(CARD_MENU, 'ui/lss/fin/FINC0301')
+
+    reloaded = MenuRoutes(path)
+    route = reloaded.get(CARD_MENU)
+    assert route['screen'] == '보조금전용카드사용내역관리'
+    assert route['program'] == 'ui/lss/fin/FINC0301'
+    assert route_key(CARD_MENU) in reloaded.routes
+
+
+def test_invalidate_removes_stale_route(tmp_path):
+    """바로 열기에 실패한 경로는 삭제"""
+    path = str(tmp_path / 'routes.json')
+    routes = MenuRoutes(path)
+    routes.record(CARD_MENU, None)
+    routes.invalidate(CARD_MENU)
+
+    assert MenuRoutes(path).get(CARD_MENU) is None
+
+
+def test_disabled_routes_not_recorded():
+    """경로 파일이 없으면(비활성화) 기록하지 않음"""
+    routes = MenuRoutes()
+    routes.record(CARD_MENU, 'x')
+    assert routes.get(CARD_MENU) is None
+
+
+def test_corrupt_file_ignored(tmp_path):
+    """깨진 캐시 파일은 무시하고 새로 학습"""
+    path = tmp_path / 'routes.json'
+    path.write_text('{not json', encoding='utf-8')
+    assert MenuRoutes(str(path)).routes == {}
@@ -0,0 +1,43 @@
+"""화면 이동 계획 테스트"""
+from src.navigation import (
+    CARD_MENU, EXECUTION_MENU, OP_BATCH_REQUEST, MenuGraph, plan_navigation
+)
+
+
+def test_batch_request_shared_on_execution_screen():
+    """카드/세금계산서 일괄 집행요청은 세금계산서 실행에서 한 번만 수행"""
+    plan = plan_navigation(['card', 'tax', 'transfer'])
+
+    assert plan.order == ['card', 'tax', 'transfer']
+    assert plan.deferred_operations('card') == {OP_BATCH_REQUEST}
+    assert plan.deferred_operations('tax') == set()
+    assert plan.performs_for('tax') == ['card']
+    assert [step['operation'] for step in plan.steps].count(OP_BATCH_REQUEST) == 1
+    # 카드 화면 -> 집행등록 -> 집행이체관리, 같은 화면을 다시 열지 않음
+    assert plan.predict() == {'navigations': 3, 'switches': 0, 'menu_clicks': 6}
+
+
+def test_transfer_runs_after_batch_request():
+    """집행이체는 일괄 집행요청 뒤에만 실행"""
+    plan = plan_navigation(['transfer', 'tax'])
+    assert plan.order == ['tax', 'transfer']
+
+
+def test_menu_graph_from_structure(tmp_path):
+    """사이드바 구조의 대메뉴/1단계 항목으로 그래프 생성, 클릭 수는 공통 상위 메뉴 아래부터"""
+    path = tmp_path / 'menus.json'
+    path.write_text(
+        '{"금융정보관리": {"menu": "금융정보관리", "submenus": ['
+        '{"text": "보조금카드관리", "class": "cl-folder cl-tree-item tree-item-level-1"},'
+        '{"text": "전체메뉴 검색", "class": "cl-searchinput menu-search"}]}}',
+        encoding='utf-8'
+    )
+    graph = MenuGraph.from_structure(str(path))
+    assert ['금융정보관리', '보조금카드관리'] in graph
+    assert ['금융정보관리', '전체메뉴 검색'] not in graph
+
+    graph.add_path(CARD_MENU)
+    graph.add_path(EXECUTION_MENU)
+    assert graph.hops(None, CARD_MENU) == 3
+    assert graph.hops(CARD_MENU, EXECUTION_MENU) == 2
+    assert graph.hops(['집행관리', '집행이체관리'], EXECUTION_MENU) == 1
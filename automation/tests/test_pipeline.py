@@ -0,0 +1,100 @@
+"""단계별 파이프라인 테스트"""
+import asyncio
+from contextlib import asynccontextmanager
+
+from src.pipeline import Pipeline, Stage
+
+
+async def source(n):
+    for i in range(n):
+        yield i
+
+
+def test_items_flow_through_stages():
+    """모든 항목이 매핑 → 등록 단계를 통과"""
+    done = []
+
+    async def double(x):
+        return x * 2
+
+    async def register(x):
+        done.append(x)
+
+    pipeline = Pipeline('test', [Stage('map', double), Stage('register', register)])
+    asyncio.run(pipeline.run(source(5)))
+
+    assert done == [0, 2, 4, 6, 8]
+    report = pipeline.report()
+    assert report['fetch']['items'] == 5
+    assert report['map']['items'] == 5
+    assert report['register']['items'] == 5
+
+
+def test_none_result_is_dropped():
+    """처리기가 None을 반환하면 다음 단계로 넘기지 않음"""
+    done = []
+
+    async def only_even(x):
+        return x if x % 2 == 0 else None
+
+    async def register(x):
+        done.append(x)
+
+    asyncio.run(Pipeline('test', [Stage('map', only_even), Stage('register', register)]).run(source(6)))
+    assert done == [0, 2, 4]
+
+
+def test_backpressure():
+    """뒤 단계가 느리면 대기열이 차서 앞 단계가 대기"""
+    async def slow(x):
+        await asyncio.sleep(0.01)
+
+    pipeline = Pipeline('test', [Stage('register', slow)], queue_size=1)
+    asyncio.run(pipeline.run(source(5)))
+
+    assert pipeline.stats['fetch'].blocked > 0
+    assert pipeline.stats['register'].max_depth <= 1
+
+
+def test_handler_error_counted():
+    """처리 중 예외는 집계하고 다음 항목 계속 처리"""
+    async def fragile(x):
+        if x == 1:
+            raise ValueError('boom')
+
+    pipeline = Pipeline('test', [Stage('register', fragile)])
+    asyncio.run(pipeline.run(source(3)))
+    assert pipeline.stats['register'].items == 3
+    assert pipeline.stats['register'].errors == 1
+
+
+def test_leftover_when_all_consumers_fail():
+    """소비자가 모두 준비에 실패하면 남은 항목은 leftover"""
+    @asynccontextmanager
+    async def broken():
+        yield None
+
+    pipeline = Pipeline('test', [Stage('register', consumers=[broken, broken])], queue_size=2)
+    asyncio.run(pipeline.run(source(5)))
+    assert pipeline.leftover == [0, 1, 2, 3, 4]
+
+
+def test_drain_waits_for_downstream():
+    """drain은 넣은 항목이 마지막 단계까지 끝날 때까지 대기"""
+    done = []
+
+    async def register(x):
+        await asyncio.sleep(0.01)
+        done.append(x)
+
+    pipeline = Pipeline('test', [Stage('register', register)])
+
+    async def source_with_barrier():
+        for i in range(3):
+            yield i
+        await pipeline.drain()
+        assert done == [0, 1, 2]
+        yield 3
+
+    asyncio.run(pipeline.run(source_with_barrier()))
+    assert done == [0, 1, 2, 3]
@@ -0,0 +1,73 @@
+"""처리 계획(dry-run) 테스트"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from src.planner import build_plan, load_plan, write_plan
+
+
+def write_csv(path: Path, rows):
+    pd.DataFrame(rows).to_csv(path, index=False, encoding='utf-8-sig')
+    return str(path)
+
+
+def test_card_plan(tmp_path):
+    """카드내역 계획: 매핑, 사용 건/중복/키 없음 구분"""
+    path = write_csv(tmp_path / 'card.csv', [
+        {'승인번호': '1001', '가맹점명': '김밥천국', '업종': '일반음식점', '금액': '12,000', '사용여부': 'N'},
+        {'승인번호': '1002', '가맹점명': '모닝주유소', '업종': '주유소', '금액': '70000', '사용여부': 'Y'},
+        {'승인번호': '1001', '가맹점명': '김밥천국', '업종': '일반음식점', '금액': '12,000', '사용여부': 'N'},
+        {'승인번호': '', '가맹점명': '기타상회', '업종': '', '금액': '1000', '사용여부': 'N'},
+    ])
+    plan = build_plan('card', path)
+
+    assert plan['action'].tolist() == ['register', 'skip', 'skip', 'review']
+    assert plan.loc[0, 'budget_item'] == '회의비'
+    assert plan.loc[0, 'amount_value'] == 12000
+
+
+def test_tax_plan_amount_mismatch(tmp_path):
+    """세금계산서 계획: 공급가액 + 세액 != 합계 표시"""
+    path = write_csv(tmp_path / 'tax.csv', [
+        {'승인번호': 'T1', '공급자상호': '가나인쇄', '공급가액': '10,000', '세액': '1,000', '합계금액': '11,000'},
+        {'승인번호': 'T2', '공급자상호': '다라상사', '공급가액': '10,000', '세액': '1,000', '합계금액': '12,000'},
+    ])
+    plan = build_plan('tax', path)
+
+    assert plan['amount_mismatch'].tolist() == [False, True]
+    assert plan.loc[0, 'budget_item'] == '인쇄비'
+    assert plan.loc[1, 'note'] == '금액 불일치'
+
+
+def test_plan_roundtrip(tmp_path):
+    """저장한 계획을 작업 목록으로 로드 (등록 대상만, 수정한 비목 반영)"""
+    path = write_csv(tmp_path / 'card.csv', [
+        {'승인번호': '1001', '가맹점명': '김밥천국', '업종': '일반음식점', '금액': '12000', '사용여부': 'N'},
+        {'승인번호': '1002', '가맹점명': '모닝주유소', '업종': '주유소', '금액': '70000', '사용여부': 'Y'},
+    ])
+    plan = build_plan('card', path)
+    plan.loc[0, 'budget_item'] = '업무추진비'  # 담당자가 계획 파일에서 수정
+    plan_path = write_plan(plan, 'card', str(tmp_path / 'plan.csv'))
+
+    assert load_plan(str(plan_path)) == {'1001': {'budget': {'item': '업무추진비', 'funding': '시도비'}}}
+
+
+def test_plan_does_not_import_playwright(tmp_path):
+    """plan 모드는 Playwright 없이 동작"""
+    path = write_csv(tmp_path / 'card.csv', [
+        {'승인번호': '1001', '가맹점명': '김밥천국', '업종': '일반음식점', '금액': '12000', '사용여부': 'N'},
+    ])
+    script = (
+        "import runpy, sys\n"
+        f"sys.argv = ['main.py', '--no-banner', 'plan', 'card', '--input', {path!r}, '-o', {str(tmp_path / 'p.csv')!r}]\n"
+        "try:\n"
+        "    runpy.run_path('main.py', run_name='__main__')\n"
+        "except SystemExit as e:\n"
+        "    assert not e.code, e.code\n"
+        "assert 'playwright' not in sys.modules\n"
+    )
+    root = Path(__file__).resolve().parent.parent
+    subprocess.run([sys.executable, '-c', script], cwd=root, check=True, capture_output=True)
+    assert (tmp_path / 'p.csv').exists()
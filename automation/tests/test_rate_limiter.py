@@ -0,0 +1,66 @@
+"""동작 속도 제한 테스트"""
+import asyncio
+
+from src.rate_limiter import ActionRateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_allows_burst_then_spaces_out():
+    """burst까지는 바로 통과, 이후에는 1/rate초 간격으로 예약"""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    clock.now = 1.0  # 1초 뒤 토큰 2개 보충 (예약분 상환)
+    assert bucket.reserve() == 0.5
+
+
+def test_bucket_refill_capped_at_burst():
+    """오래 쉬어도 burst 이상 쌓이지 않음"""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, burst=2, clock=clock)
+    clock.now = 100.0
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 1.0]
+
+
+def test_aimd_adjustment():
+    """느린 응답/오류는 곱셈 감소(min_rate 하한), 빠른 응답은 덧셈 증가(max_rate 상한)"""
+    bucket = TokenBucket(rate=1.0, min_rate=0.3, max_rate=1.2)
+    limiter = ActionRateLimiter({'save': bucket}, slow_threshold=2.0, decrease_factor=0.5, increase_step=0.1)
+
+    limiter.observe('save', 3.0)
+    assert bucket.rate == 0.5
+    limiter.on_error()
+    assert bucket.rate == 0.3  # min_rate
+    for _ in range(20):
+        limiter.observe('save', 0.2)
+    assert bucket.rate == 1.2  # max_rate
+    limiter.observe('save', 0.2, ok=False)
+    assert bucket.rate == 0.6
+    assert limiter.summary()['save']['slowdowns'] == 3
+
+
+def test_unknown_action_not_limited():
+    """분류가 설정되지 않은 동작은 대기 없음"""
+    limiter = ActionRateLimiter({})
+    assert asyncio.run(limiter.acquire('navigate')) == 0.0
+    limiter.observe('navigate', 10.0)
+
+
+def test_shared_bucket_serializes_workers():
+    """여러 코루틴이 같은 버킷을 쓰면 도착 순서대로 간격을 두고 통과"""
+    bucket = TokenBucket(rate=50.0, burst=1)
+
+    async def run():
+        return await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+    waits = asyncio.run(run())
+    assert waits[0] == 0.0
+    assert 0.01 < waits[1] < waits[2] <= 0.05
@@ -0,0 +1,88 @@
+"""금액 정규화/대사 테스트"""
+import pandas as pd
+
+from src.amounts import parse_amount
+from src.config import config
+from src.reconciliation import AmountReconciler, normalize_amounts, parse_amounts, reconcile
+
+
+AMOUNTS = ['12,000원', '5000', ' 1 000 ', '', 'abc', '-300', '1.5', None]
+VAT_COLUMNS = ['supply_amount', 'vat_amount', 'total_amount']
+
+
+def test_parse_amounts_matches_scalar():
+    """벡터 변환 결과가 parse_amount와 같음"""
+    vectorized = parse_amounts(pd.Series(AMOUNTS)).tolist()
+    assert vectorized == [parse_amount(value) for value in AMOUNTS]
+    assert vectorized[:3] == [12000, 5000, 1000]
+
+
+def test_normalize_missing_column():
+    """없는 금액 열은 0"""
+    frame = pd.DataFrame({'supply_amount': ['1,000']})
+    amounts = normalize_amounts(frame, VAT_COLUMNS)
+    assert amounts.iloc[0].tolist() == [1000, 0, 0]
+    assert str(amounts.dtypes['supply_amount']) == 'int64'
+
+
+def test_reconcile_statuses():
+    """합계/세율 검사: 일치, 끝전 차이, 불일치, 합계 없음, 세액 0"""
+    amounts = pd.DataFrame({
+        'supply_amount': [10000, 10005, 10000, 10000, 10000],
+        'vat_amount': [1000, 1001, 1000, 1000, 0],
+        'total_amount': [11000, 11007, 12000, 0, 10000],
+    })
+    checked = reconcile(amounts, tolerance=1)
+
+    assert checked['total_status'].tolist() == ['ok', 'rounding', 'mismatch', 'no_total', 'ok']
+    assert checked['total_difference'].tolist() == [0, 1, 1000, -11000, 0]
+    # 10005 x 0.1 = 1000.5 → 절사 1000, 반올림한 1001은 끝전 차이
+    assert checked['vat_status'].tolist() == ['ok', 'rounding', 'ok', 'ok', 'zero']
+
+
+def test_reconciler_types_records():
+    """등록 단계로 넘기는 레코드는 정수 금액과 대사 결과를 가짐"""
+    reconciler = AmountReconciler(VAT_COLUMNS)
+    records = [
+        {'row_key': 'T1', 'supply_amount': '10,000', 'vat_amount': '1,000', 'total_amount': '11,000원'},
+        {'row_key': 'T2', 'supply_amount': '10,000', 'vat_amount': '1,000', 'total_amount': '12,000'},
+    ]
+    checked = reconciler.check(records)
+
+    assert [r['total_amount'] for r in checked] == [11000, 12000]
+    assert all(type(r['supply_amount']) is int for r in checked)
+    assert [r['total_status'] for r in checked] == ['ok', 'mismatch']
+    assert reconciler.summary()['total_status'] == {'ok': 1, 'mismatch': 1}
+
+
+def test_reconciler_skip_mismatch():
+    """skip_mismatch이면 합계 불일치 건 제외 (보고서에는 남음)"""
+    reconciler = AmountReconciler(VAT_COLUMNS, skip_mismatch=True)
+    checked = reconciler.check([
+        {'row_key': 'T1', 'supply_amount': '100', 'vat_amount': '10', 'total_amount': '110'},
+        {'row_key': 'T2', 'supply_amount': '100', 'vat_amount': '10', 'total_amount': '999'},
+    ])
+    assert [r['row_key'] for r in checked] == ['T1']
+    assert len(reconciler.report) == 2
+
+
+def test_reconciler_amount_only():
+    """세금계산서가 아니면 정수 변환만"""
+    reconciler = AmountReconciler(['amount'])
+    checked = reconciler.check([{'row_key': '1001', 'amount': '12,000원'}])
+    assert checked == [{'row_key': '1001', 'amount': 12000}]
+
+
+def test_reconciler_streams_report(tmp_path, monkeypatch):
+    """보고서를 시작하면 묶음마다 파일에 이어 쓰고 메모리에는 건수만 남김"""
+    monkeypatch.setattr(config, 'get', lambda key, default=None: str(tmp_path) if key == 'reconciliation.report_dir' else default)
+    reconciler = AmountReconciler(VAT_COLUMNS)
+    reconciler.check([{'row_key': 'T1', 'supply_amount': '100', 'vat_amount': '10', 'total_amount': '110'}])
+    path = reconciler.start_report('세금계산서')
+    reconciler.check([{'row_key': 'T2', 'supply_amount': '100', 'vat_amount': '10', 'total_amount': '999'}])
+
+    assert reconciler.report.empty
+    assert reconciler.summary()['total_status'] == {'ok': 1, 'mismatch': 1}
+    assert reconciler.write_report('세금계산서') == path
+    written = pd.read_csv(path, encoding='utf-8-sig', dtype=str)
+    assert written['row_key'].tolist() == ['T1', 'T2']
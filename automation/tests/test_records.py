@@ -0,0 +1,70 @@
+"""조회 레코드 모델 테스트"""
+from datetime import date
+
+import pytest
+
+from src.reconciliation import AmountReconciler, VAT_COLUMNS
+from src.records import CardRecord, TaxInvoiceRecord, TransferRecord, parse_date
+
+
+def test_parse_date_formats():
+    """여러 일자 표기를 date로 변환 (변환할 수 없으면 None)"""
+    assert parse_date('2024-01-15') == date(2024, 1, 15)
+    assert parse_date('2024.1.5') == date(2024, 1, 5)
+    assert parse_date('20240115') == date(2024, 1, 15)
+    assert parse_date('2024-13-01') is None
+    assert parse_date('') is None
+    assert parse_date(None) is None
+
+
+def test_card_record_from_row():
+    """그리드 행에서 금액/일자를 변환하고 행 위치만 보관"""
+    record = CardRecord.from_row({
+        'row_index': 3, 'row_key': '12345678', 'grid_page': 2,
+        'transaction_date': '2024.03.02', 'approval_number': ' 12345678 ',
+        'amount': '15,000원', 'merchant_name': '김밥천국', 'business_type': '한식'
+    })
+
+    assert record.row_key == '12345678'
+    assert record.approval_number == '12345678'
+    assert record.amount == 15000
+    assert record.transaction_date == date(2024, 3, 2)
+    assert (record.row_index, record.grid_page) == (3, 2)
+    assert record.budget is None
+    assert not hasattr(record, '__dict__')
+
+
+def test_record_key_falls_back_to_key_field():
+    """row_key가 없으면 KEY_FIELD 값 사용"""
+    record = TransferRecord.from_row({'execution_number': 'E-1', 'amount': '1,000'})
+    assert record.row_key == 'E-1'
+    assert record.request_date is None
+
+
+def test_record_mapping_access():
+    """딕셔너리처럼 접근 가능하지만 정의되지 않은 필드는 추가할 수 없음"""
+    record = CardRecord.from_row({'approval_number': '1001', 'amount': '500'})
+    record['budget'] = {'item': '회의비', 'funding': '보조금'}
+
+    assert record['budget']['item'] == '회의비'
+    assert record.get('budget') == record.budget
+    assert record.get('missing', 'x') == 'x'
+    with pytest.raises(KeyError):
+        record['missing'] = 1
+    with pytest.raises(KeyError):
+        record['missing']
+
+
+def test_reconciler_accepts_records():
+    """대사는 레코드 모델의 정수 금액을 그대로 쓰고 결과 필드를 채움"""
+    records = [
+        TaxInvoiceRecord.from_row({'invoice_number': 'T1', 'supply_amount': '10,000',
+                                   'vat_amount': '1,000', 'total_amount': '11,000'}),
+        TaxInvoiceRecord.from_row({'invoice_number': 'T2', 'supply_amount': '10,000',
+                                   'vat_amount': '1,000', 'total_amount': '11,001'}),
+    ]
+    checked = AmountReconciler(VAT_COLUMNS).check(records)
+
+    assert [r.total_status for r in checked] == ['ok', 'rounding']
+    assert [r.total_difference for r in checked] == [0, 1]
+    assert type(checked[0].expected_vat) is int
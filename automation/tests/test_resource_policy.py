@@ -0,0 +1,47 @@
+"""리소스 차단 정책 테스트"""
+from src.resource_policy import ResourcePolicy
+
+
+def make_policy():
+    return ResourcePolicy(
+        block_types=['image', 'font', 'stylesheet'],
+        block_patterns=['google-analytics'],
+        allow_patterns=['/captcha']
+    )
+
+
+def test_block_by_type():
+    """리소스 유형 기준 차단"""
+    policy = make_policy()
+    assert policy.should_block('image', 'https://www.losims.go.kr/a.png')
+    assert policy.should_block('font', 'https://www.losims.go.kr/a.woff')
+    assert not policy.should_block('xhr', 'https://www.losims.go.kr/list.do')
+
+
+def test_block_by_pattern():
+    """URL 패턴 기준 차단"""
+    policy = make_policy()
+    assert policy.should_block('script', 'https://www.google-analytics.com/ga.js')
+
+
+def test_allow_pattern_wins():
+    """허용 패턴이 차단보다 우선"""
+    policy = make_policy()
+    assert not policy.should_block('image', 'https://www.losims.go.kr/captcha/img.png')
+
+
+def test_stylesheet_never_blocked_by_type():
+    """스타일시트는 유형 기준으로 차단하지 않음 (스크린샷 가독성)"""
+    policy = make_policy()
+    assert not policy.should_block('stylesheet', 'https://www.losims.go.kr/ui.css')
+
+
+def test_blocked_counts():
+    """차단 건수 집계"""
+    policy = make_policy()
+    policy.should_block('image', 'https://www.losims.go.kr/a.png')
+    policy.should_block('image', 'https://www.losims.go.kr/b.png')
+    policy.should_block('xhr', 'https://www.losims.go.kr/list.do')
+    assert policy.blocked['image'] == 2
+    assert policy.allowed == 1
+    assert '차단 2건' in policy.summary()
@@ -0,0 +1,100 @@
+"""재시도/백오프 정책 테스트"""
+import asyncio
+import random
+
+import pytest
+
+from src.retry import (
+    ERROR_DETACHED, ERROR_OTHER, ERROR_SESSION, ERROR_TIMEOUT, ERROR_VALIDATION,
+    RetryPolicy, classify_error
+)
+
+
+# Playwright TimeoutError와 같은 이름의 예외 (asyncio.TimeoutError를 상속하지 않음)
+PlaywrightTimeout = type('TimeoutError', (Exception,), {})
+
+
+def make_policy(**kwargs):
+    kwargs.setdefault('base_delay', 0)
+    return RetryPolicy(rng=random.Random(0), **kwargs)
+
+
+def flaky(errors, result=True):
+    """errors를 차례로 발생시킨 뒤 result 반환"""
+    calls = []
+
+    async def operation():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return result
+    return operation, calls
+
+
+def test_classify_error():
+    """메시지/예외 종류로 오류 분류"""
+    assert classify_error(PlaywrightTimeout('Timeout 30000ms exceeded.')) == ERROR_TIMEOUT
+    assert classify_error(asyncio.TimeoutError()) == ERROR_TIMEOUT
+    assert classify_error(Exception('Element is not attached to the DOM')) == ERROR_DETACHED
+    assert classify_error(Exception('세션이 만료되었습니다')) == ERROR_SESSION
+    assert classify_error(Exception('비목은 필수 입력 항목입니다')) == ERROR_VALIDATION
+    assert classify_error(ValueError('invalid literal')) == ERROR_OTHER
+
+
+def test_backoff_grows_with_jitter():
+    """대기 시간은 지수 증가하고 [delay/2, delay] 범위, max_delay로 제한"""
+    policy = make_policy(base_delay=1.0, max_delay=4.0)
+    for attempt, delay in [(1, 1.0), (2, 2.0), (3, 4.0), (6, 4.0)]:
+        assert delay / 2 <= policy.backoff(attempt) <= delay
+
+
+def test_transient_error_retried_until_success():
+    """일시적 오류는 재시도하고 통계에 남김"""
+    policy = make_policy(max_attempts=3)
+    operation, calls = flaky([PlaywrightTimeout('Timeout 100ms exceeded.'), Exception('element is detached')])
+
+    assert asyncio.run(policy.run(operation, 'op')) is True
+    assert len(calls) == 3
+    summary = policy.summary()
+    assert summary['retries'] == {ERROR_TIMEOUT: 1, ERROR_DETACHED: 1}
+    assert summary['recovered'] == 1
+    assert summary['budget_left'] == policy.budget - 2
+
+
+def test_non_transient_error_not_retried():
+    """업무 검증/기타 오류는 바로 실패"""
+    policy = make_policy()
+    operation, calls = flaky([Exception('필수 입력 항목 누락')])
+
+    with pytest.raises(Exception):
+        asyncio.run(policy.run(operation, 'op'))
+    assert len(calls) == 1
+    assert policy.summary()['failures'] == {ERROR_VALIDATION: 1}
+
+
+def test_budget_limits_retries():
+    """실행 전체 재시도 예산을 넘으면 재시도하지 않음"""
+    policy = make_policy(max_attempts=5, budget=2)
+    operation, calls = flaky([PlaywrightTimeout('t')] * 5)
+
+    with pytest.raises(PlaywrightTimeout):
+        asyncio.run(policy.run(operation, 'op'))
+    assert len(calls) == 3
+    assert policy.remaining == 0
+
+
+def test_session_expiry_triggers_recover():
+    """세션 만료면 재시도 전에 복구 함수 호출, 복구 실패 시 중단"""
+    kinds = []
+
+    async def recover(kind):
+        kinds.append(kind)
+        return len(kinds) < 2
+
+    policy = make_policy(max_attempts=5)
+    operation, calls = flaky([Exception('세션이 만료되었습니다')] * 5)
+
+    with pytest.raises(Exception):
+        asyncio.run(policy.run(operation, 'op', recover=recover))
+    assert kinds == [ERROR_SESSION, ERROR_SESSION]
+    assert len(calls) == 2
@@ -0,0 +1,81 @@
+"""스케줄 실행 테스트"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+import schedule
+
+from src.scheduler import JobScheduler, ScheduleState, build_job, in_window, parse_window
+
+NOW = datetime(2024, 3, 4, 10, 0)  # 월요일
+
+
+def test_build_job_units():
+    """every/at 표기를 schedule 작업으로 변환"""
+    scheduler = schedule.Scheduler()
+    minutes = build_job(scheduler, {'every': '30 minutes'})
+    assert (minutes.interval, minutes.unit) == (30, 'minutes')
+    hours = build_job(scheduler, {'every': '2 hours'})
+    assert (hours.interval, hours.unit) == (2, 'hours')
+
+    daily = build_job(scheduler, {'every': '1 day', 'at': '09:00'})
+    assert daily.unit == 'days' and daily.at_time.hour == 9
+    assert build_job(scheduler, {'every': 'monday', 'at': '07:30'}).start_day == 'monday'
+
+    with pytest.raises(ValueError):
+        build_job(scheduler, {'name': 'bad', 'every': 'fortnight'})
+
+
+def test_window():
+    """시작 허용 시간대 (자정을 넘는 시간대 포함)"""
+    day = parse_window('08:00-19:00')
+    assert in_window(day, NOW)
+    assert not in_window(day, NOW.replace(hour=19))
+    night = parse_window('22:00-06:00')
+    assert in_window(night, NOW.replace(hour=23)) and in_window(night, NOW.replace(hour=5))
+    assert not in_window(night, NOW)
+    assert in_window(parse_window(''), NOW)
+
+
+def test_interval_job_resumes_from_state(tmp_path):
+    """주기 작업은 저장된 마지막 실행 + 주기에, 실행한 적 없으면 바로 실행"""
+    state = ScheduleState(str(tmp_path / 'state.json'))
+    state.record('card', last_run=(NOW - timedelta(minutes=10)).isoformat())
+
+    specs = [{'name': 'card', 'type': 'card', 'every': '30 minutes'}, {'name': 'tax', 'type': 'tax', 'every': '1 hour'}]
+    scheduler = JobScheduler(specs, submit=None, state=ScheduleState(state.path), clock=lambda: NOW)
+    assert scheduler.jobs['card'].next_run == NOW + timedelta(minutes=20)
+    assert scheduler.jobs['tax'].next_run == NOW
+
+
+def test_overlapping_trigger_skipped(tmp_path):
+    """같은 작업이 대기/실행 중이면 다시 요청하지 않고, 결과는 상태 파일에 남김"""
+    release = None
+    requests = []
+
+    async def submit(params):
+        requests.append(params)
+        await release.wait()
+        return {'status': 'COMPLETED'}
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+        specs = [{'name': 'card', 'type': 'card', 'every': '30 minutes', 'window': '08:00-19:00', 'max_runtime_minutes': 5}]
+        scheduler = JobScheduler(specs, submit, ScheduleState(str(tmp_path / 'state.json')), clock=lambda: NOW)
+
+        scheduler._trigger('card')
+        scheduler.launch_pending()
+        await asyncio.sleep(0)
+        scheduler._trigger('card')  # 이전 실행이 끝나지 않음
+        assert scheduler.pending == []
+
+        release.set()
+        await asyncio.gather(*scheduler._tasks)
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+    assert len(requests) == 1 and requests[0]['max_runtime'] == 300
+    saved = ScheduleState(str(tmp_path / 'state.json')).jobs['card']
+    assert saved['last_status'] == 'COMPLETED' and saved['runs'] == 1
+    assert scheduler.active == set()
@@ -0,0 +1,46 @@
+"""열린 화면 탭 관리 테스트"""
+from src.screens import ScreenManager
+
+CARD = ['금융정보관리', '보조금카드관리', '보조금전용카드사용내역관리']
+EXECUTION = ['집행관리', '집행등록']
+TRANSFER = ['집행관리', '집행이체관리']
+
+
+def test_reopened_screen_is_reused():
+    """한 번 연 화면은 열린 것으로 추적되고 탭 전환 횟수가 집계됨"""
+    screens = ScreenManager(max_open=4)
+    assert not screens.is_open(EXECUTION)
+
+    assert screens.opened(EXECUTION) == []
+    assert screens.is_open(EXECUTION)
+    screens.activated(EXECUTION)
+
+    summary = screens.summary()
+    assert summary['reused'] == 1
+    assert summary['opened'] == 1
+    assert summary['open'] == ['집행등록']
+
+
+def test_least_recently_used_screen_is_evicted():
+    """max_open 초과 시 가장 오래 쓰지 않은 화면을 닫을 대상으로 반환"""
+    screens = ScreenManager(max_open=2)
+    screens.opened(CARD)
+    screens.opened(EXECUTION)
+    screens.activated(CARD)  # 집행등록이 가장 오래 쓰지 않은 화면이 됨
+
+    assert screens.opened(TRANSFER) == [EXECUTION]
+    assert not screens.is_open(EXECUTION)
+    assert screens.summary()['open'] == ['보조금전용카드사용내역관리', '집행이체관리']
+    assert screens.summary()['evicted'] == 1
+
+
+def test_clear_and_disabled():
+    """페이지를 다시 불러오면 비우고, max_open 0이면 추적하지 않음"""
+    screens = ScreenManager(max_open=2)
+    screens.opened(CARD)
+    screens.clear()
+    assert len(screens) == 0
+
+    disabled = ScreenManager(max_open=0)
+    assert disabled.opened(CARD) == []
+    assert not disabled.is_open(CARD)
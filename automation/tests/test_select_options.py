@@ -0,0 +1,33 @@
+"""셀렉트 옵션 인덱스 테스트"""
+from src.select_options import OptionIndex
+
+
+OPTIONS = [
+    ['선택', ''],
+    ['210-01 일반수용비', '01'],
+    ['210-07 업무추진비', '07'],
+    ['210-99 기타운영비', '99'],
+    ['업무추진비', 'X7'],
+]
+
+
+def test_exact_match_first():
+    """텍스트 완전 일치 우선"""
+    assert OptionIndex(OPTIONS).find('업무추진비') == 'X7'
+
+
+def test_substring_match():
+    """완전 일치가 없으면 포함 검색 (옵션 순서상 첫 옵션)"""
+    assert OptionIndex(OPTIONS).find('일반수용비') == '01'
+
+
+def test_fallback():
+    """못 찾으면 fallback 텍스트로 검색"""
+    index = OptionIndex(OPTIONS)
+    assert index.find('차량유지비', fallback='기타') == '99'
+    assert index.find('차량유지비') is None
+
+
+def test_empty_text():
+    """빈 텍스트는 일치하지 않음"""
+    assert OptionIndex(OPTIONS).find('') is None
@@ -0,0 +1,160 @@
+"""워커 세션 생성 테스트 (브라우저 없이 가짜 페이지 사용)"""
+import asyncio
+
+import pytest
+
+from src.botame import BotameAutomation
+from src.retry import RetryPolicy
+from src.session import BotameSession
+
+
+class FakeLocator:
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+        self.first = self
+
+    def or_(self, other):
+        return self
+
+    async def wait_for(self, state=None):
+        if self.page.url == 'about:blank':
+            raise TimeoutError('about:blank에는 요소가 없음')
+
+    async def is_visible(self):
+        return self.page.url != 'about:blank' and self.page.valid and self.selector == BotameAutomation.LOGGED_IN_SELECTOR
+
+
+class FakePage:
+    """동작 순서를 기록하는 페이지 (about:blank에서는 화면 요소를 찾지 못함)"""
+
+    def __init__(self, valid=True):
+        self.url = 'about:blank'
+        self.valid = valid  # 복사한 쿠키로 로그인 상태가 유지되는지
+        self.calls = []
+
+    async def goto(self, url, **kwargs):
+        self.url = url
+        self.calls.append('goto')
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+    async def select_option(self, selector, value):
+        if self.url == 'about:blank':
+            raise TimeoutError('보조사업 선택 요소 없음')
+        self.calls.append('select_project')
+
+    async def fill(self, selector, value):
+        if self.url == 'about:blank':
+            raise TimeoutError('입력란 없음')
+        self.calls.append('fill')
+
+    async def click(self, selector):
+        self.calls.append('click')
+
+
+class FakeReadiness:
+    def __init__(self, ready=True):
+        self.ready = ready
+
+    async def wait(self, screen, logger, grid=None, replaces_ms=0):
+        return self.ready
+
+
+class FakeBrowserManager:
+    session_restored = False
+
+    def __init__(self, page):
+        self.page = page
+        self.readiness = FakeReadiness()
+
+    async def spawn_worker(self, worker_id):
+        return FakeBrowserManager(FakePage(valid=self.page.valid))
+
+    async def screenshot(self, name):
+        pass
+
+    async def save_session(self):
+        pass
+
+    def clear_session(self):
+        pass
+
+    async def stop(self):
+        pass
+
+
+class Automation(BotameAutomation):
+    def __init__(self):
+        super().__init__('test')
+
+
+def logged_in_session(valid=True):
+    page = FakePage(valid)
+    page.url = 'https://botame.example/'
+    session = BotameSession(FakeBrowserManager(page))
+    session.page = page
+    session.logged_in = True
+    session.project = ('2024', 'A-1')
+    return session
+
+
+def test_worker_navigates_before_select_project():
+    """워커는 about:blank에서 보탬e로 이동해 로그인을 확인한 뒤 보조사업을 선택 (로그인 생략)"""
+    async def scenario():
+        main = Automation()
+        main.fiscal_year, main.project_code = '2024', 'A-1'
+        main.attach(logged_in_session())
+
+        worker = main.create_worker()
+        worker_session = await main.session.spawn_worker(1, worker)
+        assert worker_session.logged_in
+
+        assert await worker.prepare(worker_session) is None
+        return worker_session
+
+    worker_session = asyncio.run(scenario())
+    # 접속 한 번 후 보조사업 선택 (회계연도, 보조사업코드 입력, 조회), 다시 로그인하지 않음
+    assert worker_session.page.calls == ['goto', 'select_project', 'fill', 'click']
+    assert worker_session.project == ('2024', 'A-1')
+
+
+def test_worker_without_valid_login_is_not_marked_logged_in():
+    """복사한 쿠키로 로그인 상태가 확인되지 않으면 logged_in을 복사하지 않음"""
+    async def scenario():
+        main = Automation()
+        main.attach(logged_in_session(valid=False))
+        return await main.session.spawn_worker(1, main.create_worker())
+
+    worker_session = asyncio.run(scenario())
+    assert worker_session.page.calls == ['goto']
+    assert not worker_session.logged_in
+
+
+def test_required_ready_timeout_raises():
+    """필수 대기(로그인/보조사업/조회 등)가 시간 초과되면 TimeoutError로 with_retry에 알림"""
+    async def scenario():
+        automation = Automation()
+        automation.attach(logged_in_session())
+        automation.browser_manager.readiness = FakeReadiness(ready=False)
+
+        assert await automation.ready('menu') is False  # 필수가 아니면 결과만 반환
+        with pytest.raises(TimeoutError):
+            await automation.ready('project', required=True)
+
+        attempts = []
+
+        async def save():
+            attempts.append(1)
+            return await automation.ready('card_save', required=True)
+
+        async def recover(kind):
+            automation.browser_manager.readiness.ready = True  # 재시도 전 화면 복구
+            return True
+
+        automation.retry = RetryPolicy(max_attempts=3, base_delay=0)
+        assert await automation.retry.run(save, 'card_save', recover=recover)
+        return attempts
+
+    assert len(asyncio.run(scenario())) == 2
@@ -0,0 +1,50 @@
+"""CLI 시작 시간 테스트 (python -X importtime)
+
+--list/--help는 자동화 모듈(Playwright), loguru/asyncio, 설정 파일을 불러오지 않고
+로그 파일도 만들지 않아야 한다.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+MAIN = Path(__file__).resolve().parents[1] / 'main.py'
+
+# --list/--help에서 import되면 안 되는 모듈 (최상위 이름)
+HEAVY_MODULES = {'playwright', 'pandas', 'loguru', 'asyncio', 'yaml', 'dotenv', 'schedule', 'httpx'}
+
+# 인터프리터 기본 import를 뺀 main.py import 시간 상한 (마이크로초)
+IMPORT_BUDGET_US = 100_000
+
+
+def import_times(args, cwd):
+    """-X importtime 출력 -> {모듈: 누적 시간(us)} (최상위 import만)"""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        cwd=cwd, capture_output=True, text=True, timeout=60
+    )
+    assert completed.returncode == 0, completed.stderr[-2000:]
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if not name.startswith('  '):  # 들여쓰기 없음 = 최상위 import
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize('option', ['--list', '--help'])
+def test_cli_starts_without_heavy_imports(tmp_path, option):
+    """--list/--help는 무거운 모듈/설정/로그 파일 없이 시작"""
+    baseline = import_times(['-c', 'pass'], tmp_path)
+    times = import_times([str(MAIN), option, '--no-banner'], tmp_path)
+
+    imported = {name.split('.')[0] for name in times}
+    assert not imported & HEAVY_MODULES
+
+    added = sum(cumulative for name, cumulative in times.items() if name not in baseline)
+    assert added < IMPORT_BUDGET_US, f"main.py import {added / 1000:.1f}ms: {times}"
+    # 실행 디렉토리에 로그 파일을 만들지 않음
+    assert not (tmp_path / 'logs').exists()
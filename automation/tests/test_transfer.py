@@ -0,0 +1,34 @@
+"""집행이체 결과 처리 기록 테스트"""
+from src.records import TransferRecord
+from src.transfer_automation import succeeded_transfers
+
+
+def make_transfers():
+    return [
+        TransferRecord.from_row({'execution_number': 'E-1', 'vendor_name': '가나상사', 'amount': '1,000'}),
+        TransferRecord.from_row({'execution_number': 'E-2', 'vendor_name': '가나상사', 'amount': '2,000'}),
+        TransferRecord.from_row({'execution_number': 'E-3', 'vendor_name': '다라유통', 'amount': '3,000'}),
+    ]
+
+
+def test_succeeded_by_execution_number():
+    """결과 행의 집행번호로 맞춰 같은 거래처의 실패 건은 완료로 보지 않음"""
+    details = [
+        {'vendor': '가나상사', 'status': '이체성공', 'key': 'E-1'},
+        {'vendor': '가나상사', 'status': '이체실패', 'key': 'E-2'},
+        {'vendor': '다라유통', 'status': '이체완료', 'key': ' E-3 '},
+    ]
+    assert [t.row_key for t in succeeded_transfers(make_transfers(), details)] == ['E-1', 'E-3']
+
+
+def test_succeeded_by_vendor_only_when_all_succeed():
+    """집행번호가 없으면 거래처의 이체가 모두 성공한 경우만 완료"""
+    details = [
+        {'vendor': '가나상사', 'status': '이체성공', 'key': None},
+        {'vendor': '가나상사', 'status': '이체실패', 'key': None},
+        {'vendor': '다라유통', 'status': '이체성공', 'key': None},
+    ]
+    assert [t.row_key for t in succeeded_transfers(make_transfers(), details)] == ['E-3']
+
+    details[1]['status'] = '이체성공'
+    assert len(succeeded_transfers(make_transfers(), details)) == 3
@@ -0,0 +1,56 @@
+"""증분 조회 워터마크 테스트"""
+from datetime import date
+
+from src.journal import RecordJournal
+from src.watermark import WatermarkTracker, search_start
+
+
+def test_search_start_overlap_and_fiscal_year():
+    """워터마크 - overlap, 회계연도 시작일보다 앞서지 않음"""
+    assert search_start(None, 7, '2024') is None
+    assert search_start(date(2024, 6, 10), 7, '2024') == date(2024, 6, 3)
+    assert search_start(date(2024, 1, 3), 7, '2024') == date(2024, 1, 1)
+
+
+def test_all_settled_advances_to_latest():
+    """모두 처리되면 조회한 가장 늦은 일자까지"""
+    tracker = WatermarkTracker(date(2024, 3, 1))
+    for day in (5, 9, 7):
+        tracker.fetched(date(2024, 3, day))
+        tracker.settled(date(2024, 3, day))
+    assert tracker.next_value(complete=True) == date(2024, 3, 9)
+
+
+def test_pending_record_pins_watermark():
+    """처리하지 못한 건이 있으면 그 일자까지만"""
+    tracker = WatermarkTracker()
+    for day in (5, 9, 7):
+        tracker.fetched(date(2024, 3, day))
+    tracker.settled(date(2024, 3, 5))
+    tracker.settled(date(2024, 3, 9))
+    assert tracker.next_value(complete=True) == date(2024, 3, 7)
+
+
+def test_incomplete_fetch_keeps_previous():
+    """끝까지 읽지 않았으면 유지, 뒤로 내리지 않음"""
+    tracker = WatermarkTracker(date(2024, 3, 10))
+    tracker.fetched(date(2024, 3, 12))
+    tracker.settled(date(2024, 3, 12))
+    assert tracker.next_value(complete=False) == date(2024, 3, 10)
+
+    tracker = WatermarkTracker(date(2024, 3, 10))
+    tracker.fetched(date(2024, 3, 4))  # overlap 구간의 미처리 건
+    assert tracker.next_value(complete=True) == date(2024, 3, 10)
+
+
+def test_journal_stores_watermark_per_scope(tmp_path):
+    """워터마크는 자동화/범위별로 저장"""
+    path = str(tmp_path / 'journal.db')
+    journal = RecordJournal(path, '카드', '2024/P001').open()
+    assert journal.get_watermark() is None
+    journal.set_watermark('2024-03-09')
+    journal.set_watermark('2024-03-15')
+    journal.close()
+
+    assert RecordJournal(path, '카드', '2024/P001').open().get_watermark() == '2024-03-15'
+    assert RecordJournal(path, '카드', '2024/P002').open().get_watermark() is None
@@ -4,9 +4,10 @@
 
 import json
 import os
+import re
 import time
 from datetime import datetime
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
 BASE_URL = "https://www.losims.go.kr/lss.do"
 CREDENTIALS = {
@@ -17,6 +18,49 @@ CREDENTIALS = {
 OUTPUT_DIR = "/mnt/d/00.Projects/02.보탬e/site_analysis/output/menus"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# eXBuilder 로딩 오버레이 문구
+LOADING_TEXT = "잠시만 기다려 주세요"
+
+# 화면 앱 정의 요청 (메뉴로 화면을 열면 .clx를 내려받음)
+SCREEN_APP_PATTERN = re.compile(r'\.clx(\?|$)')
+
+# 로딩 오버레이 표시 여부가 visible과 같으면 true
+OVERLAY_SCRIPT = """
+    ({text, visible}) => {
+        const found = document.evaluate(
+            `//*[normalize-space(text())="${text}"]`, document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        let shown = false;
+        for (let i = 0; i < found.snapshotLength; i++) {
+            const rect = found.snapshotItem(i).getBoundingClientRect();
+            if (rect.width > 1 && rect.height > 1) shown = true;
+        }
+        return shown === visible;
+    }
+"""
+
+def wait_ready(page, timeout=10000, appear_timeout=1500):
+    """로딩 오버레이가 나타났다가 사라질 때까지 대기 (고정 대기 대체)
+
+    클릭 직후에는 오버레이가 아직 나타나지 않았을 수 있으므로 appear_timeout 동안
+    나타나기를 기다린 뒤(끝내 나타나지 않으면 넘어감) 사라질 때까지 기다린다.
+    """
+    try:
+        page.wait_for_function(OVERLAY_SCRIPT, arg={'text': LOADING_TEXT, 'visible': True}, timeout=appear_timeout)
+    except PlaywrightTimeoutError:
+        pass
+    page.wait_for_function(OVERLAY_SCRIPT, arg={'text': LOADING_TEXT, 'visible': False}, timeout=timeout)
+
+def open_screen(page, locator, timeout=10000):
+    """메뉴 클릭 후 화면 앱(.clx) 응답과 로딩 완료까지 대기 (응답이 없으면 오버레이 기준)"""
+    try:
+        with page.expect_response(lambda response: SCREEN_APP_PATTERN.search(response.url), timeout=timeout):
+            locator.click()
+    except PlaywrightTimeoutError:
+        print("  화면 앱 응답 없음 - 로딩 오버레이 기준으로 대기")
+    wait_ready(page, timeout)
+
 def save_json(data, name):
     path = os.path.join(OUTPUT_DIR, f"{name}.json")
     with open(path, 'w', encoding='utf-8') as f:
@@ -37,7 +81,7 @@ def login(page):
 
     # 아이디 로그인 탭
     page.locator('text=아이디 로그인').click()
-    page.wait_for_timeout(500)
+    page.locator('input[type="password"].cl-text').wait_for(state='visible')
 
     # 입력
     page.locator('input[type="text"].cl-text').fill(CREDENTIALS['user_id'])
@@ -45,7 +89,8 @@ def login(page):
 
     # 로그인 버튼
     page.locator('.btn-login:visible >> text=로그인').click()
-    page.wait_for_timeout(3000)
+    page.locator('text=전체메뉴 검색').first.wait_for(state='visible')
+    wait_ready(page)
 
     print("로그인 완료")
     return True
@@ -103,7 +148,7 @@ def click_menu_and_capture(page, menu_text, menu_index):
         menu_item = page.locator(f'text={menu_text}').first
         if menu_item.is_visible():
             menu_item.click()
-            page.wait_for_timeout(1500)
+            wait_ready(page)
 
             # 스크린샷
             save_screenshot(page, f"{menu_index:02d}_{menu_text.replace(' ', '_')}")
@@ -162,8 +207,6 @@ def explore_all_menus(page):
         if result:
             all_menus[menu] = result
 
-        page.wait_for_timeout(500)
-
     save_json(all_menus, "all_menus_structure")
     return all_menus
 
@@ -251,12 +294,11 @@ def navigate_to_key_screens(page):
 
             # 메인 메뉴 클릭
             page.locator(f'text={main_menu}').first.click()
-            page.wait_for_timeout(1000)
+            wait_ready(page)
 
-            # 서브 메뉴 클릭 시도
+            # 서브 메뉴 클릭 시도 (화면 앱을 받아 그릴 때까지 대기)
             try:
-                page.locator(f'text={sub_menu}').first.click()
-                page.wait_for_timeout(2000)
+                open_screen(page, page.locator(f'text={sub_menu}').first)
 
                 # 요소 추출
                 elements = extract_page_elements(page, f"{main_menu}_{sub_menu}")